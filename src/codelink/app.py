@@ -27,6 +27,7 @@ from path_loader import *
 from app_style import MAIN_STYLE
 from editor_widget import EditorWidget
 from dag_scene import DAGScene
+from result_cache import RESULT_CACHE
 # from nodes.util.scalar_functions import ScalarFunctions
 
 
@@ -35,6 +36,10 @@ def main() -> None:
 
     app: QtWidgets.QApplication = QtWidgets.QApplication(sys.argv)
 
+    # Keeps node results across sessions
+    cache_location: str = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.CacheLocation)
+    RESULT_CACHE.disk_dir = os.path.join(cache_location, "results")
+
     undo_stack: QtWidgets.QUndoStack = QtWidgets.QUndoStack()
     undo_stack.clear()
 
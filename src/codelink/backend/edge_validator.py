@@ -22,8 +22,6 @@
 # *                                                                         *
 # ***************************************************************************
 
-import networkx as nx
-
 import PySide2.QtCore as QtCore
 
 from codelink.backend.user_roles import UserRoles
@@ -34,8 +32,6 @@ class EdgeValidator:
         self._model: QtCore.QAbstractItemModel = model
 
     def can_connect(self, source: QtCore.QModelIndex, destination: QtCore.QModelIndex) -> bool:
-        di_graph: nx.DiGraph = self._model.to_nx()
-
         if self._model.is_input(source) and self._model.is_output(destination):
             temp: QtCore.QModelIndex = destination
             destination: QtCore.QModelIndex = source
@@ -56,14 +52,7 @@ class EdgeValidator:
         if self._model.is_output(source) and self._model.is_output(destination):
             return False
 
-        di_graph.add_edge(
+        return not self._model.creates_cycle(
             source.parent().parent().data(UserRoles.UUID),
             destination.parent().parent().data(UserRoles.UUID)
         )
-
-        try:
-            nx.find_cycle(di_graph)
-        except nx.exception.NetworkXNoCycle:
-            return True
-        else:
-            return False
@@ -33,6 +33,7 @@ import PySide2.QtCore as QtCore
 import PySide2.QtGui as QtGui
 import PySide2.QtWidgets as QtWidgets
 
+from codelink.reachability_index import ReachabilityIndex
 from codelink.backend.user_roles import UserRoles
 from codelink.frontend.color_palette import ColorPalette
 from codelink.backend.undo_cmds import BaseItemEditCommand, TreeItemInsertCommand, TreeItemRemoveCommand
@@ -57,8 +58,14 @@ class TreeModel(QtCore.QAbstractItemModel):
 
         self._undo_stack: QtWidgets.QUndoStack = undo_stack if undo_stack else QtWidgets.QUndoStack()
 
+        # Lookup tables of all items in the tree, kept up to date by the row signals
+        self._uuid_indexes: dict[str, QtCore.QPersistentModelIndex] = {}
+        self._pin_edges: dict[str, list[str]] = {}
+        self._child_keys: dict[str, dict[str, str]] = {}
+
         if data:
             self._root_item: RootItem = cast(RootItem, self.from_dict(data))
+            self.rebuild_indexes()
             self._nodes_index: QtCore.QModelIndex = self.index_from_key("Nodes")
             self._edges_index: QtCore.QModelIndex = self.index_from_key("Edges")
             self._frames_index: QtCore.QModelIndex = self.index_from_key("Frames")
@@ -68,9 +75,20 @@ class TreeModel(QtCore.QAbstractItemModel):
             self._nodes_index: QtCore.QModelIndex = self.append_item(SeperatorItem("Nodes"), QtCore.QModelIndex())
             self._edges_index: QtCore.QModelIndex = self.append_item(SeperatorItem("Edges"), QtCore.QModelIndex())
             self._frames_index: QtCore.QModelIndex = self.append_item(SeperatorItem("Frames"), QtCore.QModelIndex())
+            self.rebuild_indexes()
 
         self._edge_validator: EdgeValidator = EdgeValidator(self)
 
+        # Node dependencies of all edges, kept up to date by the row signals
+        self._reachability: ReachabilityIndex = ReachabilityIndex()
+        self._edge_dependencies: dict[str, tuple[str, str]] = {}
+        self.rebuild_reachability()
+
+        # Listeners
+        cast(QtCore.SignalInstance, self.rowsInserted).connect(self.on_rows_inserted)
+        cast(QtCore.SignalInstance, self.rowsAboutToBeRemoved).connect(self.on_rows_about_to_be_removed)
+        cast(QtCore.SignalInstance, self.dataChanged).connect(self.on_data_changed)
+
     @property
     def root_item(self) -> RootItem:
         return self._root_item
@@ -305,18 +323,33 @@ class TreeModel(QtCore.QAbstractItemModel):
     def index_from_uuid(
             self, uuid: str, parent: QtCore.QModelIndex = QtCore.QModelIndex()
     ) -> Optional[QtCore.QModelIndex]:
-        index_list: list[int] = self.match(
-            self.index(0, 0, parent), UserRoles.UUID, uuid, 1,
-            QtCore.Qt.MatchContains | QtCore.Qt.MatchRecursive | QtCore.Qt.MatchWrap
-        )
-        if len(index_list) > 0:
-            return cast(QtCore.QModelIndex, index_list[0])
+        persistent_index: Optional[QtCore.QPersistentModelIndex] = self._uuid_indexes.get(uuid)
+        if persistent_index is None or not persistent_index.isValid():
+            return None
 
-        return None
+        index: QtCore.QModelIndex = QtCore.QModelIndex(persistent_index)
+        if parent.isValid() and not self.has_parent_recursively(index, parent):
+            return None
+
+        return index
 
     def index_from_key(
             self, key: str, parent: QtCore.QModelIndex = QtCore.QModelIndex()
     ) -> Optional[QtCore.QModelIndex]:
+        # Direct children are looked up by key, deeper items are still searched recursively
+        parent_item: TreeItem = self.item_from_index(parent)
+        if parent_item.uuid not in self._child_keys:
+            child_keys: dict[str, str] = {}
+            for child in parent_item.children:
+                if isinstance(child, BaseItem):
+                    child_keys.setdefault(child.key, child.uuid)
+            self._child_keys[parent_item.uuid] = child_keys
+
+        if key in self._child_keys[parent_item.uuid]:
+            child_index: Optional[QtCore.QModelIndex] = self.index_from_uuid(self._child_keys[parent_item.uuid][key])
+            if child_index is not None:
+                return child_index
+
         index_list: list[int] = self.match(
             self.index(0, 0, parent), UserRoles.KEY, key, 1,
             QtCore.Qt.MatchContains | QtCore.Qt.MatchRecursive | QtCore.Qt.MatchWrap
@@ -364,25 +397,12 @@ class TreeModel(QtCore.QAbstractItemModel):
 
     def connected_edges(self, index: QtCore.QModelIndex) -> list[QtCore.QModelIndex]:
         uuid: str = index.data(UserRoles.UUID)
-
-        src_list: list[int] = self.match(
-            self.index(0, 0, self._edges_index), UserRoles.SRC, uuid, -1,
-            QtCore.Qt.MatchContains | QtCore.Qt.MatchRecursive | QtCore.Qt.MatchWrap
-        )
-
-        dest_list: list[int] = self.match(
-            self.index(0, 0, self._edges_index), UserRoles.DEST, uuid, -1,
-            QtCore.Qt.MatchContains | QtCore.Qt.MatchRecursive | QtCore.Qt.MatchWrap
-        )
-
-        return cast(list[QtCore.QModelIndex], src_list + dest_list)
+        return [self.index_from_uuid(edge_uuid) for edge_uuid in self._pin_edges.get(uuid, [])]
 
     def has_edge(self, source_uuid: str, destination_uuid: str) -> bool:
-        for i in range(self.rowCount(self._edges_index)):
-            edge_index: QtCore.QModelIndex = self.index(i, 0, self._edges_index)
-            connected_uuids: list[str] = [edge_index.data(UserRoles.SRC), edge_index.data(UserRoles.DEST)]
-
-            if source_uuid in connected_uuids and destination_uuid in connected_uuids:
+        for edge_uuid in self._pin_edges.get(source_uuid, []):
+            edge_item: EdgeItem = cast(EdgeItem, self.item_from_uuid(edge_uuid))
+            if destination_uuid in (edge_item.source_uuid, edge_item.destination_uuid):
                 return True
 
         return False
@@ -428,19 +448,98 @@ class TreeModel(QtCore.QAbstractItemModel):
 
         return ends
 
-    def to_nx(self) -> nx.DiGraph:
-        di_graph: nx.DiGraph = nx.DiGraph()
+    def edge_dependency(self, edge_index: QtCore.QModelIndex) -> tuple[str, str]:
+        source_index: QtCore.QModelIndex = self.index_from_uuid(edge_index.data(UserRoles.SRC))
+        destination_index: QtCore.QModelIndex = self.index_from_uuid(edge_index.data(UserRoles.DEST))
+        return (
+            source_index.parent().parent().data(UserRoles.UUID),
+            destination_index.parent().parent().data(UserRoles.UUID)
+        )
+
+    def rebuild_reachability(self) -> None:
+        self._reachability.clear()
+        self._edge_dependencies: dict[str, tuple[str, str]] = {}
+        for row in range(self.rowCount(self._edges_index)):
+            self.add_edge_dependency(self.index(row, 0, self._edges_index))
+
+    def add_edge_dependency(self, edge_index: QtCore.QModelIndex) -> None:
+        dependency: tuple[str, str] = self.edge_dependency(edge_index)
+        self._edge_dependencies[edge_index.data(UserRoles.UUID)] = dependency
+        self._reachability.add_edge(*dependency)
+
+    def creates_cycle(self, source_node_uuid: str, destination_node_uuid: str) -> bool:
+        return self._reachability.creates_cycle(source_node_uuid, destination_node_uuid)
+
+    def rebuild_indexes(self) -> None:
+        self._uuid_indexes: dict[str, QtCore.QPersistentModelIndex] = {}
+        self._pin_edges: dict[str, list[str]] = {}
+        self._child_keys: dict[str, dict[str, str]] = {}
+        for row in range(self.rowCount()):
+            self.add_to_indexes(self.index(row, 0))
+
+    def add_to_indexes(self, index: QtCore.QModelIndex) -> None:
+        tree_item: TreeItem = self.item_from_index(index)
+        self._uuid_indexes[tree_item.uuid] = QtCore.QPersistentModelIndex(index)
+
+        if type(tree_item) is EdgeItem:
+            edge_item: EdgeItem = cast(EdgeItem, tree_item)
+            for pin_uuid in (edge_item.source_uuid, edge_item.destination_uuid):
+                self._pin_edges.setdefault(pin_uuid, []).append(edge_item.uuid)
+
+        for row in range(len(tree_item.children)):
+            self.add_to_indexes(self.index(row, 0, index))
 
-        for edge_i in range(self.rowCount(self._edges_index)):
-            edge_index: QtCore.QModelIndex = self.index(edge_i, 0, self._edges_index)
+    def remove_from_indexes(self, index: QtCore.QModelIndex) -> None:
+        tree_item: TreeItem = self.item_from_index(index)
+        self._uuid_indexes.pop(tree_item.uuid, None)
+        self._child_keys.pop(tree_item.uuid, None)
 
-            source_index: QtCore.QModelIndex = self.index_from_uuid(edge_index.data(UserRoles.SRC))
-            source_node_idx: QtCore.QModelIndex = source_index.parent().parent()
+        if type(tree_item) is EdgeItem:
+            edge_item: EdgeItem = cast(EdgeItem, tree_item)
+            for pin_uuid in (edge_item.source_uuid, edge_item.destination_uuid):
+                pin_edges: list[str] = self._pin_edges.get(pin_uuid, [])
+                if edge_item.uuid in pin_edges:
+                    pin_edges.remove(edge_item.uuid)
+                if len(pin_edges) == 0:
+                    self._pin_edges.pop(pin_uuid, None)
+
+        for row in range(len(tree_item.children)):
+            self.remove_from_indexes(self.index(row, 0, index))
+
+    def on_rows_inserted(self, parent: QtCore.QModelIndex, first: int, last: int) -> None:
+        # Emitted by the insert and remove commands, the indexes have to be ready before any other listener runs
+        self._child_keys.pop(self.item_from_index(parent).uuid, None)
+        for row in range(first, last + 1):
+            self.add_to_indexes(self.index(row, 0, parent))
+
+        if parent == self._edges_index:
+            for row in range(first, last + 1):
+                self.add_edge_dependency(self.index(row, 0, self._edges_index))
+
+    def on_rows_about_to_be_removed(self, parent: QtCore.QModelIndex, first: int, last: int) -> None:
+        self._child_keys.pop(self.item_from_index(parent).uuid, None)
+        for row in range(first, last + 1):
+            self.remove_from_indexes(self.index(row, 0, parent))
+
+        if parent == self._edges_index:
+            for row in range(first, last + 1):
+                edge_uuid: str = self.index(row, 0, self._edges_index).data(UserRoles.UUID)
+                if edge_uuid in self._edge_dependencies:
+                    self._reachability.remove_edge(*self._edge_dependencies.pop(edge_uuid))
+
+        elif parent == self._nodes_index:
+            for row in range(first, last + 1):
+                self._reachability.remove_vertex(self.index(row, 0, self._nodes_index).data(UserRoles.UUID))
+
+    def on_data_changed(self, top_left: QtCore.QModelIndex, bottom_right: QtCore.QModelIndex) -> None:
+        # Keys may have been renamed
+        self._child_keys.pop(self.item_from_index(top_left.parent()).uuid, None)
 
-            destination_index: QtCore.QModelIndex = self.index_from_uuid(edge_index.data(UserRoles.DEST))
-            destination_node_idx: QtCore.QModelIndex = destination_index.parent().parent()
+    def to_nx(self) -> nx.DiGraph:
+        di_graph: nx.DiGraph = nx.DiGraph()
 
-            di_graph.add_edge(source_node_idx.data(UserRoles.UUID), destination_node_idx.data(UserRoles.UUID))
+        for source_node_uuid, destination_node_uuid in self._edge_dependencies.values():
+            di_graph.add_edge(source_node_uuid, destination_node_uuid)
 
         return di_graph
 
@@ -21,12 +21,11 @@
 # ***************************************************************************
 
 from __future__ import annotations
-from typing import Optional, Union, cast
+from typing import Any, Iterator, Optional, Union, cast
 import sys
-import math
 import json
-
-from dask.threaded import get
+from collections import deque
+from contextlib import contextmanager
 
 import PySide2.QtCore as QtCore
 import PySide2.QtWidgets as QtWidgets
@@ -35,13 +34,27 @@ import PySide2.QtGui as QtGui
 import networkx as nx
 
 from nodes import *
+from executors import THREADED
+from evaluation_scheduler import evaluation_scheduler
+from reachability_index import ReachabilityIndex
+from execution_graph import ExecutionGraph
+from spatial_index import SpatialIndex, segments_intersect
 from frame_item import FrameItem
-from node_item import NodeItem
+from node_item import NodeItem, QUALITY_FULL, OVERVIEW_ZOOM_LEVEL
 from socket_widget import SocketWidget
 from pin_item import PinItem
 from edge_item import EdgeItem
 
 
+# Property keys that change the look of a node but not its result
+LAYOUT_KEYS: tuple[str, ...] = ("Name", "Color", "Collapsed", "X", "Y", "Width")
+
+
+def forward_result(result: Any) -> Any:
+    # Task of a group output, hands on the result of the inner socket the output is linked to
+    return result
+
+
 class DAGScene(QtWidgets.QGraphicsScene):
     node_added: QtCore.Signal = QtCore.Signal(NodeItem)
     dag_changed: QtCore.Signal = QtCore.Signal(QtWidgets.QGraphicsItem, str)
@@ -55,19 +68,35 @@ class DAGScene(QtWidgets.QGraphicsScene):
         self._edges: list[EdgeItem] = []
 
         # Non persistent data model
+        self._dag_items: dict[str, Union[FrameItem, NodeItem, EdgeItem]] = {}
+        self._reachability: ReachabilityIndex = ReachabilityIndex()
+        self._edge_dependencies: dict[EdgeItem, tuple[NodeItem, NodeItem]] = {}
+        self._execution_graph: Optional[ExecutionGraph] = None
         self._undo_stack: QtWidgets.QUndoStack = undo_stack
         self._clipboard: QtGui.QClipboard = QtWidgets.QApplication.clipboard()
         self._parent_node: Optional[NodeItem] = None
         self._zoom_level: int = 10
+        self._executor: str = THREADED
+        self._preview: bool = True
+        self._timing_overlay: bool = False
+        self._batch_depth: int = 0
+        self._batch_changes: dict[tuple[DAGScene, QtWidgets.QGraphicsItem], str] = {}
+        self._edge_index: SpatialIndex = SpatialIndex()
+        self._pin_index: SpatialIndex = SpatialIndex()
+        self._spatial_changes: set[Union[PinItem, EdgeItem]] = set()
 
         # Background
         self._grid_spacing: int = 50
+        self._edge_batches: Optional[dict[str, QtGui.QPainterPath]] = None
 
         # Assets
         self._background_color: QtGui.QColor = QtGui.QColor("#1D1D1D")
         self._grid_color: QtGui.QColor = QtGui.QColor("#282828")
         self._grid_pen: QtGui.QPen = QtGui.QPen(self._grid_color)
         self._grid_pen.setWidth(5)
+        self._grid_brushes: dict[int, QtGui.QBrush] = {}
+        self._edge_batch_pen: QtGui.QPen = QtGui.QPen()
+        self._edge_batch_pen.setWidthF(3.0)
 
         # Widget setup
         self.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
@@ -85,6 +114,7 @@ class DAGScene(QtWidgets.QGraphicsScene):
     @frames.setter
     def frames(self, value: list[FrameItem]) -> None:
         self._frames: list[FrameItem] = value
+        self.update_dag_items()
 
     @property
     def nodes(self) -> list[NodeItem]:
@@ -93,6 +123,7 @@ class DAGScene(QtWidgets.QGraphicsScene):
     @nodes.setter
     def nodes(self, value: list[NodeItem]) -> None:
         self._nodes: list[NodeItem] = value
+        self.update_dag_items()
 
     @property
     def edges(self) -> list[EdgeItem]:
@@ -101,6 +132,56 @@ class DAGScene(QtWidgets.QGraphicsScene):
     @edges.setter
     def edges(self, value: list[EdgeItem]) -> None:
         self._edges: list[EdgeItem] = value
+        self.rebuild_reachability()
+        self.update_dag_items()
+
+    @property
+    def executor(self) -> str:
+        # Sub scenes are evaluated with the executor of their top level scene
+        if self._parent_node is not None and self._parent_node.scene() is not None:
+            return self._parent_node.scene().executor
+        return self._executor
+
+    @executor.setter
+    def executor(self, value: str) -> None:
+        self._executor: str = value
+
+    @property
+    def preview(self) -> bool:
+        # Edits are evaluated as previews first and refined once the user stops interacting
+        if self._parent_node is not None and self._parent_node.scene() is not None:
+            return self._parent_node.scene().preview
+        return self._preview
+
+    @preview.setter
+    def preview(self, value: bool) -> None:
+        self._preview: bool = value
+
+    @property
+    def timing_overlay(self) -> bool:
+        # Nodes are tinted by their recorded eval time
+        if self._parent_node is not None and self._parent_node.scene() is not None:
+            return self._parent_node.scene().timing_overlay
+        return self._timing_overlay
+
+    @timing_overlay.setter
+    def timing_overlay(self, value: bool) -> None:
+        self._timing_overlay: bool = value
+        self.update()
+
+    @property
+    def execution_graph(self) -> ExecutionGraph:
+        # Compiled once for the top level scene and all of its sub scenes, dropped on structural edits
+        if self._parent_node is not None and self._parent_node.scene() is not None:
+            return self._parent_node.scene().execution_graph
+        if self._execution_graph is None:
+            self._execution_graph: Optional[ExecutionGraph] = ExecutionGraph(self)
+        return self._execution_graph
+
+    def invalidate_execution_graph(self) -> None:
+        if self._parent_node is not None and self._parent_node.scene() is not None:
+            self._parent_node.scene().invalidate_execution_graph()
+        self._execution_graph: Optional[ExecutionGraph] = None
 
     @property
     def parent_node(self) -> Optional[NodeItem]:
@@ -109,6 +190,7 @@ class DAGScene(QtWidgets.QGraphicsScene):
     @parent_node.setter
     def parent_node(self, value: Optional[NodeItem]) -> None:
         self._parent_node: Optional[NodeItem] = value
+        self.invalidate_execution_graph()
 
     @property
     def background_color(self) -> QtGui.QColor:
@@ -131,6 +213,7 @@ class DAGScene(QtWidgets.QGraphicsScene):
         )
 
         self._frames.append(frame)
+        self.register_dag_item(frame)
         self.addItem(frame)
         return frame
 
@@ -140,13 +223,14 @@ class DAGScene(QtWidgets.QGraphicsScene):
 
         self.removeItem(frame)
         self._frames.remove(frame)
+        self.unregister_dag_item(frame)
 
     def add_node(self, node: NodeItem) -> NodeItem:
         if node.uuid == "":
             node.uuid = QtCore.QUuid.createUuid().toString()
 
         cast(QtCore.SignalInstance, node.prop_model.dataChanged).connect(
-            lambda start_idx, end_idx: cast(QtCore.SignalInstance, self.dag_changed).emit(
+            lambda start_idx, end_idx: self.emit_dag_changed(
                 node, list(node.prop_model.properties.keys())[start_idx.row()]
             )
         )
@@ -160,13 +244,15 @@ class DAGScene(QtWidgets.QGraphicsScene):
             node.register_evals()
 
         self._nodes.append(node)
+        self.register_dag_item(node)
         self.addItem(node)
+        self.invalidate_execution_graph()
         cast(QtCore.SignalInstance, self.node_added).emit(node)
 
         for socket_widget in node.input_socket_widgets + node.output_socket_widgets:
             socket_widget.pin.setParentItem(node)
             cast(QtCore.SignalInstance, socket_widget.prop_model.dataChanged).connect(
-                lambda start_idx, end_idx: cast(QtCore.SignalInstance, self.dag_changed).emit(
+                lambda start_idx, end_idx: self.emit_dag_changed(
                     socket_widget.parent_node, list(socket_widget.prop_model.properties.keys())[start_idx.row()]
                 )
             )
@@ -189,15 +275,20 @@ class DAGScene(QtWidgets.QGraphicsScene):
 
         for sub_node in nodes:
             self._nodes.remove(sub_node)
+            self._reachability.remove_vertex(sub_node)
+            self.unregister_dag_item(sub_node)
             grp_node.sub_scene.add_node(sub_node)
             sub_node.setEnabled(False)
 
         for sub_edge in sub_edges:
             self._edges.remove(sub_edge)
+            self.sync_edge(sub_edge)
+            self.unregister_dag_item(sub_edge)
             grp_node.sub_scene.add_edge(sub_edge)
 
         for sub_frame in sub_frames:
             self._frames.remove(sub_frame)
+            self.unregister_dag_item(sub_frame)
             grp_node.sub_scene.add_frame(sub_frame)
 
         socket_map: list[tuple[int, tuple[str, int]]] = [
@@ -233,6 +324,7 @@ class DAGScene(QtWidgets.QGraphicsScene):
                         edge.sort_pins()
 
         grp_node.sort_socket_widgets()
+        self.invalidate_execution_graph()
         return grp_node
 
     def resolve_sub_scene(self, grp_node: NodeItem):
@@ -284,7 +376,7 @@ class DAGScene(QtWidgets.QGraphicsScene):
         self.remove_node(grp_node)
 
     def remove_node(self, node: NodeItem) -> None:
-        if node.has_sub_scene():
+        if node.has_sub_scene() and node.is_sub_scene_loaded():
             for sub_node in node.sub_scene.nodes:
                 sub_node.on_remove()
         node.on_remove()
@@ -296,6 +388,9 @@ class DAGScene(QtWidgets.QGraphicsScene):
         node.content_widget.setParent(None)
         self.removeItem(node)
         self._nodes.remove(node)
+        self._reachability.remove_vertex(node)
+        self.unregister_dag_item(node)
+        self.invalidate_execution_graph()
 
     def add_edge(self, edge: EdgeItem) -> EdgeItem:
         if edge.uuid == "":
@@ -310,6 +405,8 @@ class DAGScene(QtWidgets.QGraphicsScene):
             edge.end_pin.socket_widget.update_stylesheets()
 
         self._edges.append(edge)
+        self.sync_edge(edge)
+        self.register_dag_item(edge)
         self.addItem(edge)
 
         return edge
@@ -329,6 +426,8 @@ class DAGScene(QtWidgets.QGraphicsScene):
             end_pin.socket_widget.update_stylesheets()
 
         self._edges.append(edge)
+        self.sync_edge(edge)
+        self.register_dag_item(edge)
         self.addItem(edge)
 
         return edge
@@ -346,6 +445,8 @@ class DAGScene(QtWidgets.QGraphicsScene):
 
         self.removeItem(edge)
         self._edges.remove(edge)
+        self.sync_edge(edge)
+        self.unregister_dag_item(edge)
 
     def remove_item(self, uuid: str) -> Union[NodeItem, EdgeItem, FrameItem, None]:
         item: Union[NodeItem, EdgeItem, FrameItem] = self.dag_item(uuid)
@@ -387,18 +488,29 @@ class DAGScene(QtWidgets.QGraphicsScene):
 
     # --------------- DAG analytics ---------------
 
-    def dag_item(self, uuid: str = "") -> Any:
+    def register_dag_item(self, item: Union[FrameItem, NodeItem, EdgeItem]) -> None:
+        self._dag_items[item.uuid] = item
+
+    def unregister_dag_item(self, item: Union[FrameItem, NodeItem, EdgeItem]) -> None:
+        if self._dag_items.get(item.uuid) is item:
+            del self._dag_items[item.uuid]
+
+    def rename_dag_item(self, item: Union[FrameItem, NodeItem, EdgeItem], old_uuid: str) -> None:
+        # Called by the uuid setters, so that lookups by the new uuid find registered items
+        if self._dag_items.get(old_uuid) is item:
+            del self._dag_items[old_uuid]
+            self._dag_items[item.uuid] = item
+
+    def update_dag_items(self) -> None:
         all_items: list = (
                 cast(list[QtWidgets.QGraphicsItem], self._frames) +
                 cast(list[QtWidgets.QGraphicsItem], self._nodes) +
                 cast(list[QtWidgets.QGraphicsItem], self._edges)
         )
-        result: list[Any] = [item for item in all_items if item.uuid == uuid]
+        self._dag_items: dict[str, Union[FrameItem, NodeItem, EdgeItem]] = {item.uuid: item for item in all_items}
 
-        if len(result) == 1:
-            return result[0]
-        else:
-            return None
+    def dag_item(self, uuid: str = "") -> Any:
+        return self._dag_items.get(uuid)
 
     def selected_nodes(self) -> list[NodeItem]:
         return [item for item in self.selectedItems() if isinstance(item, NodeItem)]
@@ -461,36 +573,93 @@ class DAGScene(QtWidgets.QGraphicsScene):
                 result.append(node)
         return result
 
-    def _path_ends(self, current_node: NodeItem, result: list[NodeItem]) -> None:
-        if len(current_node.successors()) == 0:
-            result.append(current_node)
-        else:
-            for suc_node in current_node.successors():
-                self._path_ends(suc_node, result)
+    def successor_map(self, node: NodeItem) -> dict[NodeItem, list[NodeItem]]:
+        # Unique successors of all nodes downstream of node, every node is visited once
+        execution_graph: ExecutionGraph = self.execution_graph
+        result: dict[NodeItem, list[NodeItem]] = {}
+        stack: list[NodeItem] = [node]
+        while len(stack) > 0:
+            current_node: NodeItem = stack.pop()
+            if current_node not in result:
+                result[current_node] = list(execution_graph.successors(current_node))
+                stack.extend(result[current_node])
+        return result
 
     def path_ends(self, node: NodeItem) -> list[NodeItem]:
+        return [suc_node for suc_node, successors in self.successor_map(node).items() if len(successors) == 0]
+
+    def dirty_cone(self, node: NodeItem) -> list[NodeItem]:
+        # Topologically sorted nodes affected by a change of node
+        successor_map: dict[NodeItem, list[NodeItem]] = self.successor_map(node)
+
+        in_degrees: dict[NodeItem, int] = {cone_node: 0 for cone_node in successor_map.keys()}
+        for successors in successor_map.values():
+            for suc_node in successors:
+                in_degrees[suc_node] += 1
+
         result: list[NodeItem] = []
-        self._path_ends(node, result)
+        queue: deque[NodeItem] = deque([cone_node for cone_node, degree in in_degrees.items() if degree == 0])
+        while len(queue) > 0:
+            current_node: NodeItem = queue.popleft()
+            result.append(current_node)
+            for suc_node in successor_map[current_node]:
+                in_degrees[suc_node] -= 1
+                if in_degrees[suc_node] == 0:
+                    queue.append(suc_node)
+
         return result
 
-    def mark_successors_invalid(self, node: NodeItem) -> None:
-        node.is_invalid = True
+    def mark_successors_invalid(self, node: NodeItem) -> list[NodeItem]:
+        # Only the changed node drops its cache, downstream nodes are re-evaluated if their inputs differ
         node.cache = [None] * len(node.evals)
-        for suc_node in node.successors():
-            self.mark_successors_invalid(suc_node)
-
-    def to_dsk(self, visited_node: NodeItem, graph_dict: dict) -> dict:
-        for node in visited_node.predecessors():
-            self.to_dsk(node, graph_dict)
 
+        dirty_nodes: list[NodeItem] = self.dirty_cone(node)
+        for dirty_node in dirty_nodes:
+            dirty_node.is_invalid = True
+
+        return dirty_nodes
+
+    def to_dsk(self, visited_node: NodeItem, graph_dict: dict, dirty_nodes: Optional[set[NodeItem]] = None,
+               quality: int = QUALITY_FULL) -> dict:
+        visited_pins: list[PinItem] = [socket_widget.pin for socket_widget in visited_node.output_socket_widgets]
+        if len(visited_pins) > 0 and all([pin in graph_dict for pin in visited_pins]):
+            # Shared upstream node already scheduled by another path end
+            return graph_dict
+
+        if visited_node.has_sub_scene() and not visited_node.is_sub_scene_loaded():
+            if dirty_nodes is not None and visited_node not in dirty_nodes and visited_node.has_stored_outputs():
+                # Group with deferred sub graph outside the dirty cone, its outputs are served as stored
+                for idx, socket_widget in enumerate(visited_node.output_socket_widgets):
+                    graph_dict[socket_widget.pin] = (visited_node.stored_output, idx)
+                return graph_dict
+
+            # The change reaches into the group or its outputs were not stored, so its sub graph is needed now
+            visited_node.load_sub_scene()
+            for socket_widget in visited_node.output_socket_widgets:
+                lowest_socket: SocketWidget = visited_node.linked_lowest_socket(socket_widget)
+                self.to_dsk(lowest_socket.parent_node, graph_dict, dirty_nodes, quality)
+                graph_dict[socket_widget.pin] = (forward_result, lowest_socket.pin)
+            return graph_dict
+
+        if dirty_nodes is not None and visited_node not in dirty_nodes and visited_node.is_cached():
+            # Unaffected node outside the dirty cone, upstream nodes are not visited
+            for idx, socket_widget in enumerate(visited_node.output_socket_widgets):
+                graph_dict[socket_widget.pin] = (visited_node.cached_output, idx)
+            return graph_dict
+
+        execution_graph: ExecutionGraph = self.execution_graph
+        for node in execution_graph.predecessors(visited_node):
+            self.to_dsk(node, graph_dict, dirty_nodes, quality)
+
+        # Inputs point straight at the output pins of leaf nodes, group nodes never show up in the task graph
         task_inputs: list = []
         for socket_widget in visited_node.input_socket_widgets:
             if socket_widget.is_input:
-                task_inputs.append(socket_widget.input_data())
+                task_inputs.append(execution_graph.input_data(socket_widget))
 
         for idx, socket_widget in enumerate(visited_node.output_socket_widgets):
             if not socket_widget.is_input:
-                graph_dict[socket_widget.pin] = (visited_node.evals[idx], *task_inputs)
+                graph_dict[socket_widget.pin] = (visited_node.eval_socket, idx, quality, *task_inputs)
 
         return graph_dict
 
@@ -510,69 +679,261 @@ class DAGScene(QtWidgets.QGraphicsScene):
         return nx_graph
 
     def is_cyclic(self) -> bool:
-        nx_graph: nx.DiGraph = self.to_nx()
-        result: bool = True
-        try:
-            nx.find_cycle(nx_graph)
-        except nx.exception.NetworkXNoCycle:
-            result: bool = False
-        return result
+        return not self._reachability.is_acyclic
+
+    # --------------- Reachability ---------------
+
+    @staticmethod
+    def edge_dependency(start_pin: PinItem, end_pin: PinItem) -> tuple[NodeItem, NodeItem]:
+        # Same direction as in to_nx
+        if start_pin.socket_widget.is_input:
+            return start_pin.parent_node, end_pin.parent_node
+        return end_pin.parent_node, start_pin.parent_node
+
+    def sync_edge(self, edge: EdgeItem) -> None:
+        # Updates the reachability index after the edge was added, removed or got new pins
+        self.invalidate_execution_graph()
+        self.invalidate_edge_batches()
+        if edge in self._edge_dependencies:
+            self._reachability.remove_edge(*self._edge_dependencies.pop(edge))
+
+        if edge in self._edges and type(edge.start_pin) == PinItem and type(edge.end_pin) == PinItem:
+            dependency: tuple[NodeItem, NodeItem] = self.edge_dependency(edge.start_pin, edge.end_pin)
+            self._edge_dependencies[edge] = dependency
+            self._reachability.add_edge(*dependency)
+
+    def rebuild_reachability(self) -> None:
+        self.invalidate_execution_graph()
+        self.invalidate_edge_batches()
+        self._reachability.clear()
+        self._edge_dependencies: dict[EdgeItem, tuple[NodeItem, NodeItem]] = {}
+        for edge in self._edges:
+            self.sync_edge(edge)
+
+    def creates_cycle(self, start_pin: PinItem, end_pin: PinItem) -> bool:
+        # Answered by the maintained index, no graph is built while an edge is dragged
+        return self._reachability.creates_cycle(*self.edge_dependency(start_pin, end_pin))
 
     def is_sub_scene(self) -> bool:
         return self._parent_node is not None
 
-    def execute_dag(self, item: Union[NodeItem, FrameItem], prop_key: str = ""):
-        if isinstance(item, NodeItem):
-            if prop_key not in ("Name", "Color", "Collapsed", "X", "Y", "Width"):
-                self.mark_successors_invalid(item)
+    def top_scene(self) -> DAGScene:
+        if self._parent_node is not None and self._parent_node.scene() is not None:
+            return self._parent_node.scene().top_scene()
+        return self
 
-                for end_node in self.path_ends(item):
-                    dsk: dict = self.to_dsk(end_node, {})
-                    for socket in end_node.output_socket_widgets:
-                        get(dsk, end_node.linked_lowest_socket(socket).pin)
-                        # print(get(dsk, end_node.linked_lowest_socket(socket).pin))
+    # --------------- Batched edits ---------------
 
-    # --------------- Background ---------------
+    @property
+    def is_batching(self) -> bool:
+        # Sub scenes share the batch of their top level scene
+        if self._parent_node is not None and self._parent_node.scene() is not None:
+            return self._parent_node.scene().is_batching
+        return self._batch_depth > 0
+
+    @contextmanager
+    def batch(self) -> Iterator[DAGScene]:
+        # Suspends repaints, evaluation and the property change fan out for bulk edits like loading or pasting. All
+        # changes are replayed once per item when the outermost batch ends.
+        top_scene: DAGScene = self.top_scene()
+        suspended_views: list[QtWidgets.QGraphicsView] = [view for view in self.views() if view.updatesEnabled()]
+
+        for view in suspended_views:
+            view.setUpdatesEnabled(False)
+        top_scene.begin_batch()
+        try:
+            yield self
+        finally:
+            for view in suspended_views:
+                view.setUpdatesEnabled(True)
+            top_scene.end_batch()
+            self.update()
 
-    def drawBackground(self, painter: QtGui.QPainter, rect: QtCore.QRectF) -> None:
-        super().drawBackground(painter, rect)
-        self.setBackgroundBrush(self._background_color)
+    def begin_batch(self) -> None:
+        self._batch_depth += 1
 
-        if self._zoom_level is not None:
-            if self._zoom_level >= 9:
+    def end_batch(self) -> None:
+        self._batch_depth -= 1
+        if self._batch_depth > 0:
+            return
 
-                bound_box_left: int = int(math.floor(rect.left()))
-                bound_box_right: int = int(math.ceil(rect.right()))
-                bound_box_top: int = int(math.floor(rect.top()))
-                bound_box_bottom: int = int(math.ceil(rect.bottom()))
+        batch_changes: dict[tuple[DAGScene, QtWidgets.QGraphicsItem], str] = self._batch_changes
+        self._batch_changes: dict[tuple[DAGScene, QtWidgets.QGraphicsItem], str] = {}
+        for (scene, item), prop_key in batch_changes.items():
+            if item.scene() is scene:
+                cast(QtCore.SignalInstance, scene.dag_changed).emit(item, prop_key)
 
-                first_left: int = bound_box_left - (bound_box_left % self._grid_spacing)
-                first_top: int = bound_box_top - (bound_box_top % self._grid_spacing)
+    def defer_dag_change(self, scene: DAGScene, item: QtWidgets.QGraphicsItem, prop_key: str) -> None:
+        # A change that needs an evaluation wins over pure layout changes of the same item
+        if (scene, item) not in self._batch_changes or self._batch_changes[(scene, item)] in LAYOUT_KEYS:
+            self._batch_changes[(scene, item)] = prop_key
 
-                points: list[Optional[QtCore.QPoint]] = []
-                for x in range(first_left, bound_box_right, self._grid_spacing):
-                    for y in range(first_top, bound_box_bottom, self._grid_spacing):
-                        points.append(QtCore.QPoint(x, y))
+    def emit_dag_changed(self, item: QtWidgets.QGraphicsItem, prop_key: str) -> None:
+        if self.is_batching:
+            self.top_scene().defer_dag_change(self, item, prop_key)
+        else:
+            cast(QtCore.SignalInstance, self.dag_changed).emit(item, prop_key)
 
-                painter.setPen(self._grid_pen)
-                painter.drawPoints(points)
+    def execute_dag(self, item: Union[NodeItem, FrameItem], prop_key: str = ""):
+        # Bursts of changes, e.g. while dragging a value, are coalesced and evaluated off the Qt thread
+        if self.is_batching:
+            self.top_scene().defer_dag_change(self, item, prop_key)
+            return
 
-        else:
-            bound_box_left: int = int(math.floor(rect.left()))
-            bound_box_right: int = int(math.ceil(rect.right()))
-            bound_box_top: int = int(math.floor(rect.top()))
-            bound_box_bottom: int = int(math.ceil(rect.bottom()))
+        if isinstance(item, NodeItem):
+            if prop_key not in LAYOUT_KEYS:
+                evaluation_scheduler().request(self, item)
+
+    def evaluation_graph(self, changed_nodes: list[NodeItem],
+                         quality: int = QUALITY_FULL) -> tuple[dict, list[PinItem], list[NodeItem]]:
+        # Called by the evaluation scheduler right before a run, when no other run touches the node caches
+        dirty_nodes: list[NodeItem] = []
+        dirty_set: set[NodeItem] = set()
+        for node in changed_nodes:
+            if node in self._nodes:
+                for dirty_node in self.mark_successors_invalid(node):
+                    if dirty_node not in dirty_set:
+                        dirty_set.add(dirty_node)
+                        dirty_nodes.append(dirty_node)
+
+        # Merges all affected path ends into one task graph, so that shared upstream tasks run only once
+        execution_graph: ExecutionGraph = self.execution_graph
+        dsk: dict = {}
+        end_pins: list[PinItem] = []
+        for end_node in [node for node in dirty_nodes if len(execution_graph.successors(node)) == 0]:
+            self.to_dsk(end_node, dsk, dirty_set, quality)
+            for socket in end_node.output_socket_widgets:
+                end_pin: PinItem = end_node.linked_lowest_socket(socket).pin
+                if end_pin in dsk and end_pin not in end_pins:
+                    end_pins.append(end_pin)
+
+        return dsk, end_pins, dirty_nodes
 
-            first_left: int = bound_box_left - (bound_box_left % self._grid_spacing)
-            first_top: int = bound_box_top - (bound_box_top % self._grid_spacing)
+    # --------------- Background ---------------
 
-            points: list[Optional[QtCore.QPoint]] = []
-            for x in range(first_left, bound_box_right, self._grid_spacing):
-                for y in range(first_top, bound_box_bottom, self._grid_spacing):
-                    points.append(QtCore.QPoint(x, y))
+    def drawBackground(self, painter: QtGui.QPainter, rect: QtCore.QRectF) -> None:
+        if self.backgroundBrush().color() != self._background_color:
+            self.setBackgroundBrush(self._background_color)
+        super().drawBackground(painter, rect)
+
+        if self._zoom_level is None or self._zoom_level >= 9:
+            painter.fillRect(rect, self.grid_brush(painter.worldTransform().m11()))
+
+        if self.is_overview:
+            self.draw_edge_batches(painter)
+
+    def grid_brush(self, scale: float) -> QtGui.QBrush:
+        # One grid cell rendered at its device size, tiled over the exposed area instead of drawing every dot
+        tile_size: int = max(1, round(self._grid_spacing * scale))
+        if tile_size not in self._grid_brushes:
+            tile_scale: float = tile_size / self._grid_spacing
+            tile: QtGui.QPixmap = QtGui.QPixmap(tile_size, tile_size)
+            tile.fill(QtCore.Qt.transparent)
+
+            tile_painter: QtGui.QPainter = QtGui.QPainter(tile)
+            tile_painter.scale(tile_scale, tile_scale)
+            tile_painter.setPen(self._grid_pen)
+            tile_painter.drawPoint(QtCore.QPointF(self._grid_spacing / 2, self._grid_spacing / 2))
+            tile_painter.end()
+
+            # Maps the tile back to scene units with the dot on the grid point
+            grid_brush: QtGui.QBrush = QtGui.QBrush(tile)
+            grid_brush.setTransform(
+                QtGui.QTransform().translate(-self._grid_spacing / 2, -self._grid_spacing / 2).scale(
+                    1 / tile_scale, 1 / tile_scale
+                )
+            )
+            self._grid_brushes[tile_size] = grid_brush
 
-            painter.setPen(self._grid_pen)
-            painter.drawPoints(points)
+        return self._grid_brushes[tile_size]
+
+    @property
+    def is_overview(self) -> bool:
+        return self._zoom_level is not None and self._zoom_level < OVERVIEW_ZOOM_LEVEL
+
+    def invalidate_edge_batches(self) -> None:
+        self._edge_batches: Optional[dict[str, QtGui.QPainterPath]] = None
+
+    def edge_batches(self) -> dict[str, QtGui.QPainterPath]:
+        # One path per edge color, rebuilt after an edge changed or moved
+        if self._edge_batches is None:
+            self._edge_batches: Optional[dict[str, QtGui.QPainterPath]] = {}
+            for edge in self._edges:
+                if type(edge.start_pin) == PinItem and type(edge.end_pin) == PinItem:
+                    color_path: QtGui.QPainterPath = self._edge_batches.setdefault(
+                        edge.color.name(), QtGui.QPainterPath()
+                    )
+                    color_path.addPath(edge.path())
+        return self._edge_batches
+
+    def draw_edge_batches(self, painter: QtGui.QPainter) -> None:
+        # Edges lie below the nodes, so drawing them with the background keeps the stacking order
+        painter.setBrush(QtCore.Qt.NoBrush)
+        for color_name, color_path in self.edge_batches().items():
+            self._edge_batch_pen.setColor(QtGui.QColor(color_name))
+            painter.setPen(self._edge_batch_pen)
+            painter.drawPath(color_path)
+
+    # --------------- Hit testing ---------------
+
+    def update_spatial_item(self, item: Union[PinItem, EdgeItem]) -> None:
+        # Moved items are refiled on the next query, so dragging nodes around only collects their pins and edges
+        self._spatial_changes.add(item)
+
+    def remove_spatial_item(self, item: Union[PinItem, EdgeItem]) -> None:
+        self._spatial_changes.discard(item)
+        self._pin_index.remove(item)
+        self._edge_index.remove(item)
+
+    def clear_spatial_index(self) -> None:
+        self._spatial_changes: set[Union[PinItem, EdgeItem]] = set()
+        self._pin_index.clear()
+        self._edge_index.clear()
+
+    def refresh_spatial_index(self) -> None:
+        for item in self._spatial_changes:
+            if type(item) == PinItem:
+                rect: QtCore.QRectF = item.sceneBoundingRect()
+                self._pin_index.insert(
+                    item, self._pin_index.rect_cells(rect.left(), rect.top(), rect.right(), rect.bottom())
+                )
+            else:
+                start_point, end_point = item.end_points()
+                self._edge_index.insert(
+                    item, self._edge_index.segment_cells(
+                        (start_point.x(), start_point.y()), (end_point.x(), end_point.y())
+                    )
+                )
+        self._spatial_changes: set[Union[PinItem, EdgeItem]] = set()
+
+    def pin_at(self, pos: QtCore.QPointF) -> Optional[PinItem]:
+        # Visible pin under pos, the one closest to its center if pins overlap
+        self.refresh_spatial_index()
+
+        result: Optional[PinItem] = None
+        result_distance: float = float("inf")
+        for pin in self._pin_index.query(self._pin_index.rect_cells(pos.x(), pos.y(), pos.x(), pos.y())):
+            if pin.isVisible() and pin.sceneBoundingRect().contains(pos):
+                center: QtCore.QPointF = pin.parentItem().mapToScene(pin.center())
+                distance: float = QtCore.QLineF(center, pos).length()
+                if distance < result_distance:
+                    result, result_distance = pin, distance
+        return result
+
+    def edges_crossing(self, start: QtCore.QPointF, end: QtCore.QPointF) -> list[EdgeItem]:
+        # Connected edges intersecting the line from start to end, e.g. the edge cutter
+        self.refresh_spatial_index()
+
+        cut_start: tuple[float, float] = (start.x(), start.y())
+        cut_end: tuple[float, float] = (end.x(), end.y())
+        result: list[EdgeItem] = []
+        for edge in self._edge_index.query(self._edge_index.segment_cells(cut_start, cut_end)):
+            if type(edge.start_pin) == PinItem and type(edge.end_pin) == PinItem:
+                edge_start, edge_end = edge.end_points()
+                if segments_intersect(cut_start, cut_end, (edge_start.x(), edge_start.y()),
+                                      (edge_end.x(), edge_end.y())):
+                    result.append(edge)
+        return result
 
     # --------------- Callbacks ---------------
 
@@ -584,20 +945,21 @@ class DAGScene(QtWidgets.QGraphicsScene):
     # --------------- Serialization ---------------
 
     def clear_scene(self):
-        while len(self._frames) > 0:
-            frame: FrameItem = self._frames[-1]
-            self.remove_frame(frame)
+        with self.batch():
+            while len(self._frames) > 0:
+                frame: FrameItem = self._frames[-1]
+                self.remove_frame(frame)
 
-        while len(self._edges) > 0:
-            edge: EdgeItem = self._edges[-1]
-            self.remove_edge(edge)
+            while len(self._edges) > 0:
+                edge: EdgeItem = self._edges[-1]
+                self.remove_edge(edge)
 
-        while len(self._nodes) > 0:
-            node: NodeItem = self._nodes[-1]
-            self.remove_node(node)
+            while len(self._nodes) > 0:
+                node: NodeItem = self._nodes[-1]
+                self.remove_node(node)
 
-        self.clear()
-        self.update()
+            self.clear()
+            self.clear_spatial_index()
 
     def serialize_nodes(self) -> list[dict]:
         nodes_dict: list[dict] = []
@@ -621,8 +983,8 @@ class DAGScene(QtWidgets.QGraphicsScene):
             # Reset node state
             new_node.__setstate__(node_dict)
             deserialized_nodes.append(new_node)
-            self.update()
 
+        self.update()
         return deserialized_nodes
 
     def serialize_edges(self) -> list[dict]:
@@ -650,8 +1012,8 @@ class DAGScene(QtWidgets.QGraphicsScene):
             # Reset edge state
             new_edge.__setstate__(edge_dict)
             deserialized_edges.append(new_edge)
-            self.update()
 
+        self.update()
         return deserialized_edges
 
     def serialize_frames(self) -> list[dict]:
@@ -674,8 +1036,8 @@ class DAGScene(QtWidgets.QGraphicsScene):
             # Reset frame state
             new_frame.__setstate__(frame_dict)
             deserialized_frames.append(new_frame)
-            self.update()
 
+        self.update()
         return deserialized_frames
 
     def serialize(self) -> dict:
@@ -686,7 +1048,18 @@ class DAGScene(QtWidgets.QGraphicsScene):
         }
         return dag_dict
 
+    def stored_results(self) -> dict[str, Any]:
+        # Outputs of all group nodes, nested ones included, which serve the groups of a reopened project file
+        results: dict[str, Any] = {}
+        for node in self._nodes:
+            if node.has_sub_scene():
+                results.update(node.stored_results())
+                if node.is_sub_scene_loaded():
+                    results.update(node.sub_scene.stored_results())
+        return results
+
     def deserialize(self, data_dict: dict) -> None:
-        self.deserialize_nodes(data_dict["Nodes"])
-        self.deserialize_edges(data_dict["Edges"])
-        self.deserialize_frames(data_dict["Frames"])
+        with self.batch():
+            self.deserialize_nodes(data_dict["Nodes"])
+            self.deserialize_edges(data_dict["Edges"])
+            self.deserialize_frames(data_dict["Frames"])
@@ -41,6 +41,7 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
         self._start_pin: Optional[Union[QtWidgets.QGraphicsItem, PinItem]] = None
         self._end_pin: Optional[Union[QtWidgets.QGraphicsItem, PinItem]] = None
         self._mode: str = ""
+        self._path: Optional[QtGui.QPainterPath] = None
 
         # Assets
         self._default_color: QtGui.QColor = color
@@ -59,7 +60,10 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
 
     @uuid.setter
     def uuid(self, value: str) -> None:
+        old_uuid: str = self._uuid
         self._uuid: str = value
+        if self.scene() is not None:
+            self.scene().rename_dag_item(self, old_uuid)
 
     @property
     def color(self) -> QtGui.QColor:
@@ -68,6 +72,8 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
     @color.setter
     def color(self, value: QtGui.QColor) -> None:
         self._default_color: QtGui.QColor = value
+        if self.scene() is not None:
+            self.scene().invalidate_edge_batches()
 
     @property
     def start_pin(self) -> QtWidgets.QGraphicsItem:
@@ -76,6 +82,8 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
     @start_pin.setter
     def start_pin(self, value: QtWidgets.QGraphicsItem) -> None:
         self._start_pin: QtWidgets.QGraphicsItem = value
+        self.update_geometry()
+        self.sync_scene()
 
     @property
     def end_pin(self) -> QtWidgets.QGraphicsItem:
@@ -84,6 +92,8 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
     @end_pin.setter
     def end_pin(self, value: QtWidgets.QGraphicsItem) -> None:
         self._end_pin: QtWidgets.QGraphicsItem = value
+        self.update_geometry()
+        self.sync_scene()
 
     @property
     def mode(self) -> str:
@@ -101,44 +111,56 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
         if old_start_socket.socket_widget.is_input:
             self._start_pin: QtWidgets.QGraphicsItem = self._end_pin
             self._end_pin: QtWidgets.QGraphicsItem = old_start_socket
+            self.update_geometry()
+
+    def is_batched(self) -> bool:
+        # Zoomed out, the scene draws all connected edges at once and only highlighted ones paint themselves
+        return (self.scene() is not None and self.scene().is_overview and type(self._end_pin) == PinItem and
+                not self.isSelected() and self._mode != "HOVER")
+
+    def update_geometry(self) -> None:
+        # The path is cached until one of the pins moves
+        self.prepareGeometryChange()
+        self._path: Optional[QtGui.QPainterPath] = None
+        if self.scene() is not None:
+            self.scene().invalidate_edge_batches()
+            self.scene().update_spatial_item(self)
+
+    def sync_scene(self) -> None:
+        # Keeps the reachability index of the scene in line with the connected pins
+        if self.scene() is not None:
+            self.scene().sync_edge(self)
 
     def is_valid(self, eval_target: QtWidgets.QGraphicsItem) -> bool:
         result: bool = True
 
         if type(eval_target) == PinItem and type(self._start_pin) == PinItem and (eval_target != self._start_pin):
-            self._start_pin: PinItem = cast(PinItem, self._start_pin)
-            self._end_pin: PinItem = cast(PinItem, eval_target)
-            self._end_pin.add_edge(self)
+            start_pin: PinItem = cast(PinItem, self._start_pin)
+            end_pin: PinItem = cast(PinItem, eval_target)
 
-            socket_type_start: type = self._start_pin.pin_type
-            socket_type_end: type = self._end_pin.pin_type
+            socket_type_start: type = start_pin.pin_type
+            socket_type_end: type = end_pin.pin_type
 
             if ((socket_type_start == socket_type_end) or socket_type_start == Any or
                     socket_type_end == Any):
-                if self._start_pin.parentItem() is self._end_pin.parentItem():
+                if start_pin.parentItem() is end_pin.parentItem():
                     # Sockets of the same node
                     result: bool = False
 
-                elif self._start_pin.socket_widget.is_input and self._end_pin.socket_widget.is_input:
+                elif start_pin.socket_widget.is_input and end_pin.socket_widget.is_input:
                     # Input with input pin
                     result: bool = False
 
-                elif not self._start_pin.socket_widget.is_input and not self._end_pin.socket_widget.is_input:
+                elif not start_pin.socket_widget.is_input and not end_pin.socket_widget.is_input:
                     # Output with output pin
                     result: bool = False
 
-                elif self.scene().is_cyclic():
+                elif self.scene().creates_cycle(start_pin, end_pin):
                     # Cyclic graph
                     result: bool = False
             else:
                 result: bool = False
 
-            # In any case, reset target to QtWidgets.QGraphicsEllipseItem
-            self._end_pin.remove_edge(self)
-            temp_target: QtWidgets.QGraphicsEllipseItem = QtWidgets.QGraphicsEllipseItem(-6, -6, 12, 12)
-            temp_target.setPos(self._end_pin.parent_node.mapToScene(self._end_pin.center()))
-            self._end_pin = temp_target
-
         else:
             result: bool = False
 
@@ -149,6 +171,15 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
     def scene(self) -> Any:
         return super().scene()
 
+    def itemChange(self, change: QtWidgets.QGraphicsItem.GraphicsItemChange, value: Any) -> Any:
+        if change == QtWidgets.QGraphicsItem.GraphicsItemChange.ItemSceneChange and self.scene() is not None:
+            self.scene().remove_spatial_item(self)
+        elif change == QtWidgets.QGraphicsItem.GraphicsItemChange.ItemSceneHasChanged:
+            self._path: Optional[QtGui.QPainterPath] = None
+            if self.scene() is not None:
+                self.scene().update_spatial_item(self)
+        return super().itemChange(change, value)
+
     def hoverEnterEvent(self, event: QtWidgets.QGraphicsSceneHoverEvent) -> None:
         super().hoverEnterEvent(event)
         self._mode: str = "HOVER"
@@ -160,7 +191,7 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
 
     # --------------- Shape and painting ---------------
 
-    def path(self) -> QtGui.QPainterPath:
+    def end_points(self) -> tuple[QtCore.QPointF, QtCore.QPointF]:
         start_pin: PinItem = cast(PinItem, self._start_pin)
         start_point: QtCore.QPointF = self._start_pin.parentItem().mapToScene(start_pin.center())
 
@@ -170,6 +201,14 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
         else:
             end_point: QtCore.QPointF = self._end_pin.pos()
 
+        return start_point, end_point
+
+    def path(self) -> QtGui.QPainterPath:
+        if self._path is not None:
+            return self._path
+
+        start_point, end_point = self.end_points()
+
         # ctr_pt_offset: float = abs(end_point.x() - start_point.x()) / 2.5
 
         # if not start_pin.socket_widget.is_input:
@@ -183,6 +222,7 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
         # path.cubicTo(ctr_pt_1, ctr_pt_2, end_point)
         path.lineTo(end_point)
 
+        self._path: Optional[QtGui.QPainterPath] = path
         return path
 
     def shape(self) -> QtGui.QPainterPath:
@@ -194,6 +234,9 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
     def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionGraphicsItem,
               widget: Optional[QtWidgets.QWidget] = None) -> None:
 
+        if self.is_batched():
+            return
+
         if self.isSelected() or self._mode == "HOVER":
             self._pen.setColor(self._selected_color)
         else:
@@ -221,5 +264,5 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
         return data_dict
 
     def __setstate__(self, state: dict):
-        self._uuid = state["UUID"]
+        self.uuid = state["UUID"]
         self.update()
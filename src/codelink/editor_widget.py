@@ -48,6 +48,9 @@ from socket_widget import SocketWidget
 from pin_item import PinItem
 from edge_item import EdgeItem
 from cutter_item import CutterItem
+from evaluation_scheduler import evaluation_scheduler
+from eval_profiler import PROFILER
+from project_file import FILE_SUFFIX, ProjectFile, is_project_file, write_project
 
 
 class EditorWidget(QtWidgets.QGraphicsView):
@@ -112,6 +115,12 @@ class EditorWidget(QtWidgets.QGraphicsView):
         self._prop_scroller.hide()
         self._layout.addWidget(self._prop_scroller)
 
+        # Evaluation progress, placed in the lower left corner while a run is going on
+        self._eval_progress: QtWidgets.QProgressBar = QtWidgets.QProgressBar(self)
+        self._eval_progress.setFormat("Evaluating %v / %m")
+        self._eval_progress.setFixedSize(200, 18)
+        self._eval_progress.hide()
+
         # Actions
         self._open_action: QtWidgets.QAction = QtWidgets.QAction("Open", self)
         self._open_action.setShortcuts(QtGui.QKeySequence.keyBindings(QtGui.QKeySequence.Open))
@@ -175,6 +184,21 @@ class EditorWidget(QtWidgets.QGraphicsView):
         cast(QtCore.SignalInstance, self._copy_action.triggered).connect(self.copy)
         self.addAction(self._copy_action)
 
+        self._cancel_eval_action: QtWidgets.QAction = QtWidgets.QAction("Cancel Evaluation", self)
+        self._cancel_eval_action.setShortcut(QtGui.QKeySequence("Esc"))
+        cast(QtCore.SignalInstance, self._cancel_eval_action.triggered).connect(self.cancel_evaluation)
+        self.addAction(self._cancel_eval_action)
+
+        self._timing_action: QtWidgets.QAction = QtWidgets.QAction("Show Timings", self)
+        self._timing_action.setCheckable(True)
+        self._timing_action.setShortcut(QtGui.QKeySequence("Shift+T"))
+        cast(QtCore.SignalInstance, self._timing_action.toggled).connect(self.show_timings)
+        self.addAction(self._timing_action)
+
+        self._export_trace_action: QtWidgets.QAction = QtWidgets.QAction("Export Trace", self)
+        cast(QtCore.SignalInstance, self._export_trace_action.triggered).connect(self.export_trace)
+        self.addAction(self._export_trace_action)
+
         self._past_action: QtWidgets.QAction = QtWidgets.QAction("Paste", self)
         self._past_action.setShortcuts(QtGui.QKeySequence.keyBindings(QtGui.QKeySequence.Paste))
         cast(QtCore.SignalInstance, self._past_action.triggered).connect(self.paste)
@@ -204,6 +228,8 @@ class EditorWidget(QtWidgets.QGraphicsView):
         # Listeners
         cast(QtCore.SignalInstance, self.zoom_level_changed).connect(self.on_zoom_change)
         cast(QtCore.SignalInstance, self.customContextMenuRequested).connect(self.context_menu)
+        cast(QtCore.SignalInstance, evaluation_scheduler().progress_changed).connect(self.on_eval_progress_changed)
+        cast(QtCore.SignalInstance, evaluation_scheduler().run_finished).connect(self.on_eval_run_finished)
 
     @property
     def zoom_level(self) -> int:
@@ -295,8 +321,9 @@ class EditorWidget(QtWidgets.QGraphicsView):
             self._lm_pressed: bool = True
 
             if event.modifiers() != QtCore.Qt.ShiftModifier:
-                if type(self.itemAt(event.pos())) == PinItem:
-                    self._last_pin: PinItem = self.itemAt(event.pos())
+                pressed_item: Optional[QtWidgets.QGraphicsItem] = self.itemAt(event.pos())
+                if type(pressed_item) == PinItem:
+                    self._last_pin: PinItem = pressed_item
 
                     if (not self._last_pin.socket_widget.is_input or
                             (self._last_pin.socket_widget.is_input and not self._last_pin.has_edges())):
@@ -341,14 +368,15 @@ class EditorWidget(QtWidgets.QGraphicsView):
         super().mouseMoveEvent(event)
 
         if self._mode == "EDGE_ADD":
-            if type(self.itemAt(event.pos())) == PinItem:
-                temp_pin: PinItem = self.itemAt(event.pos())
+            temp_pin: Optional[PinItem] = self.scene().pin_at(self.mapToScene(event.pos()))
+            if temp_pin is not None:
                 snapping_pos: QtCore.QPointF = temp_pin.parentItem().mapToScene(
                     temp_pin.pos()
                 )
-                snap_x: float = snapping_pos.x() + self.itemAt(event.pos()).size / 2
-                snap_y: float = snapping_pos.y() + self.itemAt(event.pos()).size / 2
+                snap_x: float = snapping_pos.x() + temp_pin.size / 2
+                snap_y: float = snapping_pos.y() + temp_pin.size / 2
                 self._temp_edge.end_pin.setPos(snap_x, snap_y)
+                self._temp_edge.update_geometry()
 
                 if self._temp_edge.is_valid(eval_target=temp_pin):
                     self._temp_edge.color = self._temp_edge.start_pin.color
@@ -357,6 +385,7 @@ class EditorWidget(QtWidgets.QGraphicsView):
             else:
                 self._temp_edge.color = self._temp_edge.start_pin.color
                 self._temp_edge.end_pin.setPos(self.mapToScene(event.pos()))
+                self._temp_edge.update_geometry()
                 self.ensureVisible(self._temp_edge.end_pin, self._scroll_border, self._scroll_border)
 
         if self._mode == "SCENE_DRAG":
@@ -370,11 +399,9 @@ class EditorWidget(QtWidgets.QGraphicsView):
             current_pos: QtCore.QPoint = self.mapToScene(event.pos())
             self._cutter.end_point = current_pos
 
-            selected_items: list[QtWidgets.QGraphicsItem] = self.scene().collidingItems(self._cutter)
-
-            for item in selected_items:
-                if type(item) is EdgeItem:
-                    self._undo_stack.push(RemoveEdgeCommand(self.scene(), cast(EdgeItem, item)))
+            cut_edges: list[EdgeItem] = self.scene().edges_crossing(self._cutter.start_point, current_pos)
+            for edge in cut_edges:
+                self._undo_stack.push(RemoveEdgeCommand(self.scene(), edge))
 
         if self._mode == "NODE_POSITIONING":
             current_pos: QtCore.QPoint = self.mapToScene(event.pos())
@@ -412,9 +439,10 @@ class EditorWidget(QtWidgets.QGraphicsView):
                     node.moved = False
 
         if self._mode == "EDGE_ADD":
-            if type(self.itemAt(event.pos())) == PinItem:
-                if self._temp_edge.is_valid(eval_target=self.itemAt(event.pos())):
-                    self._temp_edge.end_pin = self.itemAt(event.pos())
+            target_pin: Optional[PinItem] = self.scene().pin_at(self.mapToScene(event.pos()))
+            if target_pin is not None:
+                if self._temp_edge.is_valid(eval_target=target_pin):
+                    self._temp_edge.end_pin = target_pin
                     self._temp_edge.end_pin.add_edge(self._temp_edge)
                     self._temp_edge.end_pin.socket_widget.update_stylesheets()
 
@@ -592,6 +620,10 @@ class EditorWidget(QtWidgets.QGraphicsView):
             context_menu.addAction(self._undo_action)
             context_menu.addAction(self._redo_action)
             context_menu.addAction(self._fit_action)
+            self._cancel_eval_action.setEnabled(evaluation_scheduler().is_busy())
+            context_menu.addAction(self._cancel_eval_action)
+            context_menu.addAction(self._timing_action)
+            context_menu.addAction(self._export_trace_action)
             context_menu.addSeparator()
 
             selected_items: list[Any] = self.scene().selectedItems()
@@ -636,6 +668,7 @@ class EditorWidget(QtWidgets.QGraphicsView):
             self._resolve_grp_node_action.setEnabled(True)
             self._open_sub_action.setEnabled(True)
             self._close_sub_action.setEnabled(True)
+            self._cancel_eval_action.setEnabled(True)
 
     # --------------- Viewport, focus and zoom ---------------
 
@@ -680,6 +713,17 @@ class EditorWidget(QtWidgets.QGraphicsView):
             else:
                 self.setWindowTitle(self._file_path + " *")
 
+    def on_eval_progress_changed(self, finished_count: int, eval_count: int) -> None:
+        self._eval_progress.setMaximum(max(eval_count, 1))
+        self._eval_progress.setValue(finished_count)
+        self._eval_progress.move(10, self.height() - self._eval_progress.height() - 10)
+        self._eval_progress.setVisible(finished_count < eval_count)
+
+    def on_eval_run_finished(self, run: Any, future: Any) -> None:
+        # Also hides the progress of cancelled runs, the scheduler already started the next run if there is one
+        if evaluation_scheduler().current_run is None:
+            self._eval_progress.hide()
+
     def add_node_from_action(self) -> None:
         node_cls: type = self.sender().data()
 
@@ -707,9 +751,13 @@ class EditorWidget(QtWidgets.QGraphicsView):
             self._prop_scroller.hide()
             self.zoom_min()
 
-            with open(self._file_path, "r", encoding="utf8") as json_file:
-                data_dict: dict = json.load(json_file)
-                self.scene().deserialize(data_dict)
+            if is_project_file(self._file_path):
+                project_file: ProjectFile = ProjectFile(self._file_path)
+                self.scene().deserialize(project_file.root())
+            else:
+                with open(self._file_path, "r", encoding="utf8") as json_file:
+                    data_dict: dict = json.load(json_file)
+                    self.scene().deserialize(data_dict)
 
             self.fit_content()
             self._dag_scene_changed: bool = False
@@ -718,18 +766,24 @@ class EditorWidget(QtWidgets.QGraphicsView):
     def save(self) -> None:
         if self._file_path is None:
             self._file_path: str = os.path.normpath(
-                QtWidgets.QFileDialog.getSaveFileName(self, dir="untitled.json")[0]
+                QtWidgets.QFileDialog.getSaveFileName(self, dir="untitled" + FILE_SUFFIX)[0]
             )
 
         if self._file_path != ".":
-            with open(self._file_path, "w", encoding="utf8") as json_file:
-                json.dump(self.scene().serialize(), json_file, indent=4)
+            # JSON files are still written as plain JSON
+            if self._file_path.endswith(".json"):
+                with open(self._file_path, "w", encoding="utf8") as json_file:
+                    json.dump(self.scene().serialize(), json_file, indent=4)
+            else:
+                write_project(self._file_path, self.scene().serialize(), self.scene().stored_results())
 
             self.setWindowTitle(self._file_path)
             self._dag_scene_changed: bool = False
 
     def save_as(self) -> None:
-        self._file_path: str = os.path.normpath(QtWidgets.QFileDialog.getSaveFileName(self, dir="untitled.json")[0])
+        self._file_path: str = os.path.normpath(
+            QtWidgets.QFileDialog.getSaveFileName(self, dir="untitled" + FILE_SUFFIX)[0]
+        )
         self.save()
 
     def copy(self) -> None:
@@ -793,35 +847,53 @@ class EditorWidget(QtWidgets.QGraphicsView):
                 replace_key_values(clipboard_state, "End Node UUID", k, v)
                 replace_key_values(clipboard_state, "Framed Nodes UUID's", k, v)
 
-            nodes: list[NodeItem] = self.scene().deserialize_nodes(clipboard_state["Nodes"])
-            edges: list[EdgeItem] = self.scene().deserialize_edges(clipboard_state["Edges"])
-            frames: list[FrameItem] = self.scene().deserialize_frames(clipboard_state["Frames"])
+            with self.scene().batch():
+                nodes: list[NodeItem] = self.scene().deserialize_nodes(clipboard_state["Nodes"])
+                edges: list[EdgeItem] = self.scene().deserialize_edges(clipboard_state["Edges"])
+                frames: list[FrameItem] = self.scene().deserialize_frames(clipboard_state["Frames"])
 
-            scene_bbox: QtCore.QRectF = self.scene().bounding_rect(nodes)
-            scene_center: QtCore.QPointF = QtCore.QPointF(
-                scene_bbox.x() + scene_bbox.width() / 2,
-                scene_bbox.y() + scene_bbox.height() / 2
-            )
-            dx: float = paste_pos.x() - scene_center.x()
-            dy: float = paste_pos.y() - scene_center.y()
+                scene_bbox: QtCore.QRectF = self.scene().bounding_rect(nodes)
+                scene_center: QtCore.QPointF = QtCore.QPointF(
+                    scene_bbox.x() + scene_bbox.width() / 2,
+                    scene_bbox.y() + scene_bbox.height() / 2
+                )
+                dx: float = paste_pos.x() - scene_center.x()
+                dy: float = paste_pos.y() - scene_center.y()
 
-            for node in nodes:
-                node.setPos(dx + node.x(), dy + node.y())
-                node.last_position = QtCore.QPointF(dx + node.x(), dy + node.y())
-                if type(node) == ShapeViewer:
-                    node.compound_name = ""
+                for node in nodes:
+                    node.setPos(dx + node.x(), dy + node.y())
+                    node.last_position = QtCore.QPointF(dx + node.x(), dy + node.y())
+                    if type(node) == ShapeViewer:
+                        node.compound_name = ""
 
-            self.scene().clearSelection()
-            to_be_selected: list[Any] = cast(list[QtWidgets.QGraphicsItem], nodes) + cast(
-                list[QtWidgets.QGraphicsItem], frames)
-            for item in to_be_selected:
-                item.setSelected(True)
+                self.scene().clearSelection()
+                to_be_selected: list[Any] = cast(list[QtWidgets.QGraphicsItem], nodes) + cast(
+                    list[QtWidgets.QGraphicsItem], frames)
+                for item in to_be_selected:
+                    item.setSelected(True)
 
-            self._undo_stack.push(PasteClipboardCommand(self.scene(), nodes, edges, frames))
+                self._undo_stack.push(PasteClipboardCommand(self.scene(), nodes, edges, frames))
 
         except json.JSONDecodeError:
             print("Pasting failed!")
 
+    def cancel_evaluation(self) -> None:
+        # Nodes of the cancelled run stay marked invalid until they are evaluated again
+        evaluation_scheduler().cancel()
+
+    def show_timings(self, checked: bool) -> None:
+        # The overlay is a setting of the top level scene, sub scenes follow it
+        root_scene: QtWidgets.QGraphicsScene = self.scene()
+        while root_scene.parent_node is not None:
+            root_scene: QtWidgets.QGraphicsScene = root_scene.parent_node.scene()
+        root_scene.timing_overlay = checked
+        self.scene().update()
+
+    def export_trace(self) -> None:
+        file_path: str = os.path.normpath(QtWidgets.QFileDialog.getSaveFileName(self, dir="trace.json")[0])
+        if file_path != ".":
+            PROFILER.export_chrome_trace(file_path)
+
     def delete_selected(self) -> None:
         nodes: list[NodeItem] = [node for node in self.scene().selected_nodes() if not node.is_grp_interface()]
         edges: list[EdgeItem] = self.scene().selected_edges()
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2023 Ronny Scharf-W. <ronny.scharf08@gmail.com>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from __future__ import annotations
+from typing import Any, Optional
+from collections import deque
+import threading
+import json
+import time
+import os
+
+
+HISTORY_SIZE: int = 4096
+
+# Cache outcomes of an eval
+CACHE_HIT: str = "hit"  # Unchanged inputs, the node cache was served
+CACHE_MEMO: str = "memo"  # Served from the result cache
+CACHE_MISS: str = "miss"  # Evaluated
+
+
+class EvalRecord:
+    __slots__ = (
+        "node_uuid", "node_name", "eval_idx", "start", "duration", "input_count", "output_count", "cache_state",
+        "thread_id"
+    )
+
+    def __init__(self, node_uuid: str, node_name: str, eval_idx: int, start: float, duration: float,
+                 input_count: int, output_count: int, cache_state: str, thread_id: int) -> None:
+        self.node_uuid: str = node_uuid
+        self.node_name: str = node_name
+        self.eval_idx: int = eval_idx
+        self.start: float = start
+        self.duration: float = duration
+        self.input_count: int = input_count
+        self.output_count: int = output_count
+        self.cache_state: str = cache_state
+        self.thread_id: int = thread_id
+
+
+class EvalProfiler:
+    # Ring buffer of node eval records, filled by NodeItem.eval_socket from any evaluation thread. Wall times are
+    # summed per node along the way, so the timing overlay can be painted without walking the records.
+    def __init__(self, history_size: int = HISTORY_SIZE) -> None:
+        self._records: deque[EvalRecord] = deque(maxlen=history_size)
+        self._node_times: dict[str, float] = {}
+        self._node_calls: dict[str, int] = {}
+        self._max_node_time: Optional[float] = 0.
+        self._is_enabled: bool = True
+        self._origin: float = time.perf_counter()
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._is_enabled
+
+    @is_enabled.setter
+    def is_enabled(self, value: bool) -> None:
+        self._is_enabled: bool = value
+
+    def record(self, node_uuid: str, node_name: str, eval_idx: int, start: float, end: float, input_count: int,
+               output_count: int, cache_state: str) -> None:
+        if not self._is_enabled:
+            return
+
+        new_record: EvalRecord = EvalRecord(
+            node_uuid, node_name, eval_idx, start - self._origin, end - start, input_count, output_count,
+            cache_state, threading.get_ident()
+        )
+
+        with self._lock:
+            if len(self._records) == self._records.maxlen:
+                self.forget(self._records[0])
+            self._records.append(new_record)
+
+            self._node_times[node_uuid] = self._node_times.get(node_uuid, 0.) + new_record.duration
+            self._node_calls[node_uuid] = self._node_calls.get(node_uuid, 0) + 1
+            if self._max_node_time is not None:
+                self._max_node_time: Optional[float] = max(self._max_node_time, self._node_times[node_uuid])
+
+    def forget(self, old_record: EvalRecord) -> None:
+        # Takes a record that drops out of the ring buffer out of the node sums
+        self._node_times[old_record.node_uuid] -= old_record.duration
+        self._node_calls[old_record.node_uuid] -= 1
+        if self._node_calls[old_record.node_uuid] == 0:
+            del self._node_times[old_record.node_uuid]
+            del self._node_calls[old_record.node_uuid]
+        self._max_node_time: Optional[float] = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._node_times: dict[str, float] = {}
+            self._node_calls: dict[str, int] = {}
+            self._max_node_time: Optional[float] = 0.
+
+    def records(self) -> list[EvalRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def node_time(self, node_uuid: str) -> float:
+        return self._node_times.get(node_uuid, 0.)
+
+    def node_calls(self, node_uuid: str) -> int:
+        return self._node_calls.get(node_uuid, 0)
+
+    def heat(self, node_uuid: str) -> float:
+        # Recorded wall time of the node relative to the slowest node, between 0 and 1
+        with self._lock:
+            if self._max_node_time is None:
+                self._max_node_time: Optional[float] = max(self._node_times.values(), default=0.)
+            max_node_time: float = self._max_node_time
+
+        if max_node_time <= 0:
+            return 0.
+        return self.node_time(node_uuid) / max_node_time
+
+    # --------------- Export ---------------
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        # Trace event format of chrome://tracing and Perfetto, times in microseconds
+        trace_events: list[dict[str, Any]] = [
+            {
+                "name": eval_record.node_name, "cat": eval_record.cache_state, "ph": "X",
+                "ts": 1e6 * eval_record.start, "dur": 1e6 * eval_record.duration,
+                "pid": os.getpid(), "tid": eval_record.thread_id,
+                "args": {
+                    "uuid": eval_record.node_uuid, "output": eval_record.eval_idx,
+                    "input elements": eval_record.input_count, "output elements": eval_record.output_count
+                }
+            }
+            for eval_record in self.records()
+        ]
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, file_path: str) -> None:
+        with open(file_path, "w", encoding="utf8") as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file)
+
+
+PROFILER: EvalProfiler = EvalProfiler()
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2023 Ronny Scharf-W. <ronny.scharf08@gmail.com>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Optional, cast
+from concurrent.futures import ThreadPoolExecutor, Future
+import threading
+
+from dask.local import get_sync
+
+import PySide2.QtCore as QtCore
+
+from executors import scheduler
+from node_item import QUALITY_PREVIEW, QUALITY_FULL
+
+if TYPE_CHECKING:
+    from dag_scene import DAGScene
+    from node_item import NodeItem
+
+
+DISPATCH_DELAY: int = 16  # ms, collects the requests of one frame before a run starts
+IDLE_DELAY: int = 400  # ms without requests before previews are refined
+
+
+class EvaluationCancelled(Exception):
+    pass
+
+
+def task_node(task: tuple) -> Optional[NodeItem]:
+    return getattr(task[0], "__self__", None)
+
+
+def is_worker_task(task: tuple) -> bool:
+    # Evals of pure nodes and reads of cached or stored outputs are safe to run beside the Qt thread
+    node: Optional[NodeItem] = task_node(task)
+    return node is None or node.IS_PURE or task[0] in (node.cached_output, node.stored_output)
+
+
+def is_eval_task(task: tuple) -> bool:
+    node: Optional[NodeItem] = task_node(task)
+    return node is not None and task[0] == node.eval_socket
+
+
+def task_dependencies(key_ids: dict[int, Any], task: tuple) -> list:
+    # Keys referenced by the task arguments, which are single keys or lists of keys. Keys are looked up by id, as
+    # arguments may be unhashable.
+    dependencies: list = []
+    for arg in task[1:]:
+        for item in (arg if type(arg) is list else [arg]):
+            if id(item) in key_ids.keys():
+                dependencies.append(key_ids[id(item)])
+    return dependencies
+
+
+class EvaluationRun:
+    # One evaluation of a task graph. Tasks of pure nodes and everything they depend on run on the worker thread, the
+    # remaining tasks, e.g. viewers writing to the FreeCAD document, run on the Qt thread once the worker part is done.
+    def __init__(self, scene: DAGScene, changed_nodes: list[NodeItem], quality: int, dsk: dict, end_keys: list,
+                 dirty_nodes: list[NodeItem], on_task_started: Optional[Callable] = None,
+                 on_task_finished: Optional[Callable] = None) -> None:
+        self._scene: DAGScene = scene
+        self._changed_nodes: list[NodeItem] = changed_nodes
+        self._quality: int = quality
+        self._dsk: dict = dsk
+        self._end_keys: list = end_keys
+        self._executor: str = scene.executor
+        self._dirty_nodes: list[NodeItem] = dirty_nodes
+        self._on_task_started: Optional[Callable] = on_task_started
+        self._on_task_finished: Optional[Callable] = on_task_finished
+
+        self._worker_keys: list = self.find_worker_keys()
+        self._is_cancelled: bool = False
+        self._running_tasks: int = 0
+        self._condition: threading.Condition = threading.Condition()
+
+    @property
+    def scene(self) -> DAGScene:
+        return self._scene
+
+    @property
+    def changed_nodes(self) -> list[NodeItem]:
+        return self._changed_nodes
+
+    @property
+    def quality(self) -> int:
+        return self._quality
+
+    @property
+    def dirty_nodes(self) -> list[NodeItem]:
+        return self._dirty_nodes
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._is_cancelled
+
+    def cancel(self) -> None:
+        # Tasks that already started finish, no further task is started
+        with self._condition:
+            self._is_cancelled: bool = True
+
+    def find_worker_keys(self) -> list:
+        key_ids: dict[int, Any] = {id(key): key for key in self._dsk.keys()}
+        is_worker_key: dict[Any, bool] = {}
+
+        def visit(key: Any) -> bool:
+            if key not in is_worker_key.keys():
+                task: tuple = self._dsk[key]
+                is_worker_key[key] = is_worker_task(task) and all(
+                    [visit(dependency) for dependency in task_dependencies(key_ids, task)]
+                )
+            return is_worker_key[key]
+
+        return [key for key in self._dsk.keys() if visit(key)]
+
+    @property
+    def eval_count(self) -> int:
+        return len([task for task in self._dsk.values() if is_eval_task(task)])
+
+    def run_task(self, fn: Callable, *args) -> Any:
+        with self._condition:
+            if self._is_cancelled:
+                raise EvaluationCancelled()
+            self._running_tasks += 1
+
+        # Start and finish of node evals are reported, reads of cached outputs are not
+        node: Optional[NodeItem] = task_node((fn, *args))
+        is_eval: bool = is_eval_task((fn, *args))
+        if is_eval and self._on_task_started is not None:
+            self._on_task_started(node)
+
+        try:
+            return fn(*args)
+        finally:
+            if is_eval and self._on_task_finished is not None:
+                self._on_task_finished(node)
+
+            with self._condition:
+                self._running_tasks -= 1
+                self._condition.notify_all()
+
+    def run_worker(self) -> list:
+        # Runs on the worker thread and returns after the last started task, even if the run was cancelled meanwhile
+        try:
+            worker_dsk: dict = {key: (self.run_task, *self._dsk[key]) for key in self._worker_keys}
+            return scheduler(self._executor)(worker_dsk, self._worker_keys)
+        finally:
+            with self._condition:
+                self._condition.wait_for(lambda: self._running_tasks == 0)
+
+    def run_gui(self, worker_results: list) -> None:
+        # Runs the remaining tasks on the Qt thread, with the worker results as inputs
+        gui_dsk: dict = {key: (self.run_task, *task) for key, task in self._dsk.items()}
+        gui_dsk.update(zip(self._worker_keys, worker_results))
+        get_sync(gui_dsk, self._end_keys)
+
+
+class EvaluationScheduler(QtCore.QObject):
+    # Coalesces evaluation requests, so that only the latest graph state is evaluated. A request during a run cancels
+    # it, the superseded results are discarded and the accumulated changes are evaluated right after. Scenes with
+    # preview enabled are evaluated at preview quality first, the full quality pass follows once no requests came in
+    # for IDLE_DELAY.
+    run_finished: QtCore.Signal = QtCore.Signal(object, object)
+    node_started: QtCore.Signal = QtCore.Signal(object)
+    node_finished: QtCore.Signal = QtCore.Signal(object)
+    progress_changed: QtCore.Signal = QtCore.Signal(int, int)
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+
+        self._pending: dict[tuple[DAGScene, int], list[NodeItem]] = {}
+        self._unrefined: dict[DAGScene, list[NodeItem]] = {}
+        self._current_run: Optional[EvaluationRun] = None
+        self._eval_count: int = 0
+        self._finished_count: int = 0
+        self._worker: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="codelink-eval")
+
+        self._dispatch_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self._dispatch_timer.setSingleShot(True)
+        self._dispatch_timer.setInterval(DISPATCH_DELAY)
+
+        self._idle_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(IDLE_DELAY)
+
+        # Listeners
+        cast(QtCore.SignalInstance, self._dispatch_timer.timeout).connect(self.dispatch)
+        cast(QtCore.SignalInstance, self._idle_timer.timeout).connect(self.refine)
+        cast(QtCore.SignalInstance, self.run_finished).connect(self.on_run_finished)
+        cast(QtCore.SignalInstance, self.node_started).connect(self.on_node_started)
+        cast(QtCore.SignalInstance, self.node_finished).connect(self.on_node_finished)
+
+    @property
+    def current_run(self) -> Optional[EvaluationRun]:
+        return self._current_run
+
+    def is_busy(self) -> bool:
+        return self._current_run is not None or len(self._pending) > 0 or len(self._unrefined) > 0
+
+    def add_pending(self, scene: DAGScene, node: NodeItem, quality: int) -> None:
+        changed_nodes: list[NodeItem] = self._pending.setdefault((scene, quality), [])
+        if node not in changed_nodes:
+            changed_nodes.append(node)
+
+    def request(self, scene: DAGScene, node: NodeItem) -> None:
+        if scene.preview:
+            self.add_pending(scene, node, QUALITY_PREVIEW)
+            unrefined_nodes: list[NodeItem] = self._unrefined.setdefault(scene, [])
+            if node not in unrefined_nodes:
+                unrefined_nodes.append(node)
+            self._idle_timer.start()
+        else:
+            self.add_pending(scene, node, QUALITY_FULL)
+
+        if self._current_run is not None:
+            if not self._current_run.is_cancelled:
+                # The superseded changes are evaluated again together with the new ones
+                self._current_run.cancel()
+                for changed_node in self._current_run.changed_nodes:
+                    self.request(self._current_run.scene, changed_node)
+        elif not self._dispatch_timer.isActive():
+            self._dispatch_timer.start()
+
+    def refine(self) -> None:
+        for scene, changed_nodes in self._unrefined.items():
+            for node in changed_nodes:
+                self.add_pending(scene, node, QUALITY_FULL)
+        self._unrefined: dict[DAGScene, list[NodeItem]] = {}
+        self.dispatch()
+
+    def cancel(self) -> None:
+        self._pending: dict[tuple[DAGScene, int], list[NodeItem]] = {}
+        self._unrefined: dict[DAGScene, list[NodeItem]] = {}
+        self._idle_timer.stop()
+        if self._current_run is not None:
+            self._current_run.cancel()
+
+    def dispatch(self) -> None:
+        if self._current_run is not None or len(self._pending) == 0:
+            return
+
+        # Scenes are evaluated one after another, the changes of each scene and quality in one run
+        scene, quality = next(iter(self._pending.keys()))
+        changed_nodes: list[NodeItem] = self._pending.pop((scene, quality))
+
+        dsk, end_keys, dirty_nodes = scene.evaluation_graph(changed_nodes, quality)
+        for node in dirty_nodes:
+            node.update()
+
+        if len(end_keys) == 0:
+            self.dispatch()
+            return
+
+        # Node events are emitted on the worker thread and queued to the Qt thread
+        run: EvaluationRun = EvaluationRun(
+            scene, changed_nodes, quality, dsk, end_keys, dirty_nodes,
+            on_task_started=cast(QtCore.SignalInstance, self.node_started).emit,
+            on_task_finished=cast(QtCore.SignalInstance, self.node_finished).emit
+        )
+        self._current_run: Optional[EvaluationRun] = run
+        self._eval_count: int = run.eval_count
+        self._finished_count: int = 0
+        cast(QtCore.SignalInstance, self.progress_changed).emit(self._finished_count, self._eval_count)
+
+        # The signal is queued to the Qt thread
+        future: Future = self._worker.submit(run.run_worker)
+        future.add_done_callback(lambda done_future: self.run_finished.emit(run, done_future))
+
+    def on_run_finished(self, run: EvaluationRun, future: Future) -> None:
+        self._current_run: Optional[EvaluationRun] = None
+
+        if not run.is_cancelled:
+            try:
+                run.run_gui(future.result())
+            except EvaluationCancelled:
+                pass
+            except Exception as e:
+                print(e)
+
+        for node in run.dirty_nodes:
+            node.update()
+
+        self.dispatch()
+
+    def on_node_started(self, node: NodeItem) -> None:
+        node.is_running = True
+        node.update()
+
+    def on_node_finished(self, node: NodeItem) -> None:
+        node.is_running = False
+        node.update()
+
+        self._finished_count += 1
+        cast(QtCore.SignalInstance, self.progress_changed).emit(
+            min(self._finished_count, self._eval_count), self._eval_count
+        )
+
+
+_evaluation_scheduler: Optional[EvaluationScheduler] = None
+
+
+def evaluation_scheduler() -> EvaluationScheduler:
+    global _evaluation_scheduler
+    if _evaluation_scheduler is None:
+        _evaluation_scheduler = EvaluationScheduler()
+    return _evaluation_scheduler
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2023 Ronny Scharf-W. <ronny.scharf08@gmail.com>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from dag_scene import DAGScene
+    from node_item import NodeItem
+    from socket_widget import SocketWidget
+    from pin_item import PinItem
+
+
+class ExecutionGraph:
+    # Pin level view of a scene and all of its sub scenes with every group boundary resolved. Each input socket of a
+    # leaf node maps directly to the output pins it reads from, or to the socket whose value it falls back to. Only the
+    # structure is compiled, socket values are read when the tasks are built. Group nodes whose sub graph is still
+    # deferred in the project file are not loaded, they are compiled like leaf nodes with opaque outputs.
+    def __init__(self, scene: DAGScene) -> None:
+        self._sources: dict[SocketWidget, list[PinItem]] = {}
+        self._default_sockets: dict[SocketWidget, SocketWidget] = {}
+        self._predecessors: dict[NodeItem, list[NodeItem]] = {}
+        self._successors: dict[NodeItem, list[NodeItem]] = {}
+
+        self.compile(scene)
+
+    def compile(self, scene: DAGScene) -> None:
+        for node in scene.nodes:
+            self._predecessors.setdefault(node, [])
+            self._successors.setdefault(node, [])
+
+            if node.has_sub_scene() and node.is_sub_scene_loaded():
+                # Group nodes keep their neighbours inside the sub scene, so changes to them reach the inner nodes
+                self._predecessors[node] = list(dict.fromkeys(node.predecessors()))
+                self._successors[node] = list(dict.fromkeys(node.successors()))
+                self.compile(node.sub_scene)
+                continue
+
+            for socket_widget in node.input_socket_widgets:
+                sources, default_socket = self.resolve(socket_widget)
+                self._sources[socket_widget] = sources
+                self._default_sockets[socket_widget] = default_socket
+
+                for pin in sources:
+                    pre_node: NodeItem = pin.parent_node
+                    if pre_node not in self._predecessors[node]:
+                        self._predecessors[node].append(pre_node)
+                    pre_successors: list[NodeItem] = self._successors.setdefault(pre_node, [])
+                    if node not in pre_successors:
+                        pre_successors.append(node)
+
+    @staticmethod
+    def resolve(socket_widget: SocketWidget) -> tuple[list[PinItem], SocketWidget]:
+        # Same lookup as SocketWidget.input_data, walking up the group links instead of recursing
+        current: SocketWidget = socket_widget
+        while True:
+            if current.pin.has_edges():
+                sources: list[PinItem] = []
+                for edge in current.pin.edges:
+                    pre_node: NodeItem = edge.start_pin.parent_node
+                    if pre_node.has_sub_scene() and pre_node.is_sub_scene_loaded():
+                        sources.append(pre_node.linked_lowest_socket(edge.start_pin.socket_widget).pin)
+                    else:
+                        sources.append(edge.start_pin)
+                return sources, current
+
+            linked_highest: SocketWidget = current.parent_node.linked_highest_socket(current)
+            if linked_highest == current:
+                return [], current
+            current: SocketWidget = linked_highest
+
+    def input_data(self, socket_widget: SocketWidget) -> list[Any]:
+        sources: list[PinItem] = self._sources.get(socket_widget, [])
+        if len(sources) > 0:
+            return list(sources)
+        return [self._default_sockets.get(socket_widget, socket_widget).default_data()]
+
+    def predecessors(self, node: NodeItem) -> list[NodeItem]:
+        return self._predecessors.get(node, [])
+
+    def successors(self, node: NodeItem) -> list[NodeItem]:
+        return self._successors.get(node, [])
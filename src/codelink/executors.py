@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2023 Ronny Scharf-W. <ronny.scharf08@gmail.com>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from __future__ import annotations
+from typing import Any, Callable, Optional
+from concurrent.futures import ProcessPoolExecutor, Future
+import multiprocessing
+import sys
+import os
+import math
+
+from dask.threaded import get
+from dask.local import get_sync
+
+import Part
+
+from utils import shape_from_brep
+
+
+THREADED: str = "Threaded"
+MULTIPROCESS: str = "Multiprocess"
+SYNCHRONOUS: str = "Synchronous"
+EXECUTORS: tuple[str, ...] = (THREADED, MULTIPROCESS, SYNCHRONOUS)
+
+
+def scheduler(executor: str) -> Callable:
+    # Dask scheduler for the node graph. Node tasks are bound to Qt items and can not leave the process, so the
+    # multiprocess executor schedules them on threads and sends the per element kernels to the process pool.
+    if executor == SYNCHRONOUS:
+        return get_sync
+    return get
+
+
+# --------------- Process pool ---------------
+
+class BrepShape:
+    # Part.Shape on its way to or from a worker process
+    def __init__(self, shape: Part.Shape) -> None:
+        self._brep: str = shape.exportBrepToString()
+
+    def shape(self) -> Part.Shape:
+        return shape_from_brep(self._brep)
+
+
+def to_picklable(value: Any, memo: dict[int, Any]) -> Any:
+    # Shapes referenced several times are only converted once per memo, which also keeps them alive to keep ids unique
+    if isinstance(value, Part.Shape):
+        if id(value) not in memo.keys():
+            memo[id(value)] = (value, BrepShape(value))
+        return memo[id(value)][1]
+    elif type(value) in (list, tuple):
+        return type(value)(to_picklable(item, memo) for item in value)
+    return value
+
+
+def from_picklable(value: Any, memo: dict[int, Any]) -> Any:
+    if isinstance(value, BrepShape):
+        if id(value) not in memo.keys():
+            memo[id(value)] = (value, value.shape())
+        return memo[id(value)][1]
+    elif type(value) in (list, tuple):
+        return type(value)(from_picklable(item, memo) for item in value)
+    return value
+
+
+_is_worker: bool = False
+
+
+def init_worker(sys_path: list[str]) -> None:
+    # Lets the worker import FreeCAD and the node modules like the editor process
+    global _is_worker
+    sys.path[:] = sys_path
+    _is_worker = True
+
+
+def run_chunk(kernel: Callable, picklable_chunk: list) -> list:
+    chunk: list = from_picklable(picklable_chunk, {})
+    return to_picklable([kernel(param) for param in chunk], {})
+
+
+def worker_executable() -> Optional[str]:
+    # Embedded in FreeCAD, sys.executable is the FreeCAD binary, which can not bootstrap a worker. The interpreter
+    # shipped next to it is used instead, None if there is none.
+    if os.path.basename(sys.executable).lower().startswith("python"):
+        return sys.executable
+
+    for name in ("python3", "python", "python.exe"):
+        candidate_path: str = os.path.join(os.path.dirname(sys.executable), name)
+        if os.path.isfile(candidate_path):
+            return candidate_path
+    return None
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def process_pool() -> Optional[ProcessPoolExecutor]:
+    # None if no interpreter for the workers was found, callers fall back to running serially then
+    global _process_pool
+    if _process_pool is None:
+        executable: Optional[str] = worker_executable()
+        if executable is None:
+            return None
+
+        # Spawned workers do not inherit the Qt and OCC state of the editor process
+        mp_context: multiprocessing.context.SpawnContext = multiprocessing.get_context("spawn")
+        mp_context.set_executable(executable)
+        _process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=mp_context, initializer=init_worker, initargs=(list(sys.path),)
+        )
+    return _process_pool
+
+
+def parallel_map(kernel: Callable, params: list, use_processes: bool = False,
+                 chunk_size: Optional[int] = None) -> list:
+    # Applies a module level kernel to each parameter tuple. With use_processes the parameters are split into chunks
+    # that run on the process pool, the results are returned in parameter order.
+    # Workers already run in parallel, e.g. the variants of a sweep, and do not start pools of their own
+    pool: Optional[ProcessPoolExecutor] = (
+        process_pool() if use_processes and len(params) >= 2 and not _is_worker else None
+    )
+    if pool is None:
+        return [kernel(param) for param in params]
+
+    if chunk_size is None:
+        chunk_size: int = max(1, math.ceil(len(params) / (4 * os.cpu_count())))
+
+    send_memo: dict[int, Any] = {}
+    futures: list[Future] = [
+        pool.submit(run_chunk, kernel, to_picklable(params[start:start + chunk_size], send_memo))
+        for start in range(0, len(params), chunk_size)
+    ]
+
+    results: list = []
+    for future in futures:
+        results.extend(from_picklable(future.result(), {}))
+    return results
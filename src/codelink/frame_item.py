@@ -82,7 +82,10 @@ class FrameItem(QtWidgets.QGraphicsItem):
 
     @uuid.setter
     def uuid(self, value: str) -> None:
+        old_uuid: str = self._uuid
         self._uuid: str = value
+        if self.scene() is not None:
+            self.scene().rename_dag_item(self, old_uuid)
 
     @property
     def prop_model(self) -> PropertyModel:
@@ -145,6 +148,6 @@ class FrameItem(QtWidgets.QGraphicsItem):
         return data_dict
 
     def __setstate__(self, state: dict):
-        self._uuid = state["UUID"]
+        self.uuid = state["UUID"]
         self._prop_model.__setstate__(state["Properties"])
         self.update()
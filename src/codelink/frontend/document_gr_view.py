@@ -56,6 +56,9 @@ class DocumentGrView(QtWidgets.QGraphicsView):
         self._pressed_pin: Optional[QtWidgets.QGraphicsEllipseItem] = None
         self._temp_edge: Optional[EdgeGrItem] = None
 
+        # Graphics items by the uuid of their model item, kept up to date by the row signals
+        self._graphics_items: dict[str, QtWidgets.QGraphicsItem] = {}
+
         # self.setViewport(QtWidgets.QOpenGLWidget())
         self.setViewportUpdateMode(QtWidgets.QGraphicsView.NoViewportUpdate)
         self.setCacheMode(cast(QtWidgets.QGraphicsView.CacheMode, QtWidgets.QGraphicsView.CacheNone))
@@ -65,16 +68,14 @@ class DocumentGrView(QtWidgets.QGraphicsView):
                             QtGui.QPainter.TextAntialiasing | QtGui.QPainter.SmoothPixmapTransform)
 
     def graphics_item_from_index(self, index: QtCore.QModelIndex) -> Optional[QtWidgets.QGraphicsItem]:
-        graphics_items: list[QtWidgets.QGraphicsItem] = []
-        for graphics_item in self.scene().items():
-            if hasattr(graphics_item, "index"):
-                if graphics_item.index() == index or self._model.has_parent_recursively(index, graphics_item.index()):
-                    graphics_items.append(graphics_item)
-
-        if len(graphics_items) > 0:
-            return graphics_items[0]
-        else:
-            return None
+        # Indexes below a node, e.g. its properties, resolve to the graphics item of the node
+        while index.isValid():
+            graphics_item: Optional[QtWidgets.QGraphicsItem] = self._graphics_items.get(index.data(UserRoles.UUID))
+            if graphics_item is not None:
+                return graphics_item
+            index: QtCore.QModelIndex = index.parent()
+
+        return None
 
     def select(self, item_selection: QtCore.QItemSelection):
         self.scene().clearSelection()
@@ -90,6 +91,7 @@ class DocumentGrView(QtWidgets.QGraphicsView):
         if isinstance(item, NodeItem):
             node_gr_item: NodeGrItem = NodeGrItem(QtCore.QPersistentModelIndex(index))
             self.scene().addItem(node_gr_item)
+            self._graphics_items[item.uuid] = node_gr_item
             node_gr_item.update()
 
         elif type(item) == EdgeItem:  # and not type(item.parent.parent) is GroupItem:
@@ -107,7 +109,9 @@ class DocumentGrView(QtWidgets.QGraphicsView):
             destination_pin_row: int = destination_index.parent().row() - 1
             destination_pin: PinGrItem = destination_node_gr_item.pins[0][destination_index.row()]
 
-            self.scene().addItem(EdgeGrItem(source_pin, destination_pin, QtCore.QPersistentModelIndex(index)))
+            edge_gr_item: EdgeGrItem = EdgeGrItem(source_pin, destination_pin, QtCore.QPersistentModelIndex(index))
+            self.scene().addItem(edge_gr_item)
+            self._graphics_items[item.uuid] = edge_gr_item
 
     # noinspection PyUnusedLocal
     def on_model_begin_remove_rows(self, parent: QtCore.QModelIndex, first_row: int, last_row: int) -> None:
@@ -115,6 +119,7 @@ class DocumentGrView(QtWidgets.QGraphicsView):
         gr_item: Optional[QtWidgets.QGraphicsItem] = self.graphics_item_from_index(index)
         if gr_item:
             self.scene().removeItem(gr_item)
+            self._graphics_items.pop(gr_item.index().data(UserRoles.UUID), None)
 
     # noinspection PyUnusedLocal
     def on_model_data_changed(self, top_left: QtCore.QModelIndex, bottom_right: QtCore.QModelIndex,
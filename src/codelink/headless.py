@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2023 Ronny Scharf-W. <ronny.scharf08@gmail.com>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from __future__ import annotations
+from typing import Any, Optional
+import inspect
+import types
+import json
+
+import awkward as ak
+
+import nodes
+import sockets
+from utils import map_value
+from nested_data import NestedData, NestedVector
+from project_file import ProjectFile, SubGraphChunk, is_project_file
+from executors import THREADED, scheduler
+from node_item import NodeItem, QUALITY_FULL
+from socket_widget import SocketWidget
+
+
+# Stand ins for the node and socket widgets of a DAGScene. They hold the serialized state only and borrow the eval,
+# socket and caching methods from the widget classes, so graphs are evaluated by the same code as in the editor.
+
+_stand_in_classes: dict[tuple[type, type], type] = {}
+
+
+def stand_in_class(base_cls: type, widget_cls: type) -> type:
+    # Stand in classes carry the names of the widget classes, which are part of the eval states and result cache keys
+    if (base_cls, widget_cls) not in _stand_in_classes.keys():
+        _stand_in_classes[(base_cls, widget_cls)] = type(widget_cls.__name__, (base_cls, ), {"WIDGET_CLS": widget_cls})
+    return _stand_in_classes[(base_cls, widget_cls)]
+
+
+def borrowed_attribute(item: Any, name: str) -> Any:
+    # Class attributes of the widget class, with methods and properties bound to the stand in
+    if name.startswith("__"):
+        raise AttributeError(name)
+
+    try:
+        attribute: Any = inspect.getattr_static(item.WIDGET_CLS, name)
+    except AttributeError:
+        raise AttributeError(type(item).__name__ + " has no attribute " + name) from None
+
+    if hasattr(type(attribute), "__get__"):
+        return attribute.__get__(item, item.WIDGET_CLS)
+    return attribute
+
+
+def plain_data(data: Any) -> Any:
+    # JSON compatible form of socket data, shapes and other objects are represented by their string
+    if isinstance(data, ak.Array):
+        return ak.to_list(data)
+    elif isinstance(data, NestedVector):
+        return ak.to_list(data.to_record())
+    elif isinstance(data, NestedData):
+        return map_value(lambda idx: str(data.data[idx]), ak.to_list(data.structure))
+    elif isinstance(data, (list, tuple)):
+        return [plain_data(item) for item in data]
+    elif isinstance(data, (bool, int, float, str)) or data is None:
+        return data
+    else:
+        return str(data)
+
+
+class HeadlessOptionBox:
+    # Selected option of a node, answers the calls evals make on the OptionBoxWidget
+    def __init__(self, options: list[str], index: int) -> None:
+        self._options: list[str] = options
+        self._index: int = index
+
+    def count(self) -> int:
+        return len(self._options)
+
+    def currentIndex(self) -> int:
+        return self._index
+
+    def currentText(self) -> str:
+        return self._options[self._index]
+
+    def setCurrentIndex(self, index: int) -> None:
+        self._index: int = index
+
+
+class HeadlessSocket:
+    WIDGET_CLS: type = SocketWidget
+
+    def __init__(self, state: dict, parent_node: HeadlessNode) -> None:
+        self._properties: dict = dict(state["Properties"])
+        self._is_input: bool = bool(state["Is Input"])
+        self._link: tuple[str, int] = tuple(state["Link"])
+        self._parent_node: HeadlessNode = parent_node
+
+        # Connected output sockets of an input socket
+        self._sources: list[HeadlessSocket] = []
+
+    @property
+    def name(self) -> str:
+        return self._properties["Name"]
+
+    @property
+    def value(self) -> Any:
+        return self._properties["Value"]
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._properties["Value"] = value
+
+    @property
+    def is_input(self) -> bool:
+        return self._is_input
+
+    @property
+    def link(self) -> tuple[str, int]:
+        return self._link
+
+    @property
+    def parent_node(self) -> HeadlessNode:
+        return self._parent_node
+
+    @property
+    def sources(self) -> list[HeadlessSocket]:
+        return self._sources
+
+    def path(self) -> str:
+        return self._parent_node.path() + "." + self.name
+
+    def is_connected(self) -> bool:
+        return len(self._sources) > 0 or self._parent_node.linked_highest_socket(self) is not self
+
+    def socket_options_state(self) -> list[bool]:
+        return [bool(self._properties["Flatten"]), bool(self._properties["Simplify"]), bool(self._properties["Graft"])]
+
+    def input_data(self) -> list:
+        # Output sockets or the default data of the socket, with group nodes resolved like in SocketWidget.input_data
+        result: list = []
+        if len(self._sources) > 0:
+            for source in self._sources:
+                result.append(source.parent_node.linked_lowest_socket(source))
+        else:
+            linked_highest: HeadlessSocket = self._parent_node.linked_highest_socket(self)
+            if linked_highest is not self:
+                result.extend(linked_highest.input_data())
+
+        if len(result) == 0:
+            result.append(self.default_data())
+
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        return borrowed_attribute(self, name)
+
+
+class HeadlessNode:
+    WIDGET_CLS: type = NodeItem
+
+    def __init__(self, state: dict, graph: HeadlessGraph) -> None:
+        self._uuid: str = state["UUID"]
+        self._name: str = state["Properties"]["Name"]
+        self._graph: HeadlessGraph = graph
+
+        self._socket_widgets: list[HeadlessSocket] = [
+            stand_in_class(HeadlessSocket, getattr(sockets, socket_dict["Class"]))(socket_dict, self)
+            for socket_dict in state["Sockets"]
+        ]
+        self._option_box: Optional[HeadlessOptionBox] = None
+        if "Option Idx" in state.keys():
+            self._option_box: Optional[HeadlessOptionBox] = HeadlessOptionBox(self.OPTIONS, state["Option Idx"])
+
+        self._evals: list[types.MethodType] = [
+            types.MethodType(eval_fn, self) for eval_fn in self.WIDGET_CLS.eval_functions()
+        ]
+        self._cache: list[Any] = [None] * len(self._evals)
+        self._input_fingerprints: list[Any] = [None] * len(self._evals)
+        self._result_keys: list[Optional[str]] = [None] * len(self._evals)
+        self._is_dirty: bool = False
+        self._is_invalid: bool = True
+
+        sub_graph_dict: dict = state["Subgraph"]
+        if isinstance(sub_graph_dict, SubGraphChunk):
+            sub_graph_dict: dict = sub_graph_dict.load()
+        self._sub_graph: Optional[HeadlessGraph] = None
+        if len(sub_graph_dict["Nodes"]) > 0:
+            self._sub_graph: Optional[HeadlessGraph] = HeadlessGraph(sub_graph_dict, self)
+
+    @property
+    def uuid(self) -> str:
+        return self._uuid
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def socket_widgets(self) -> list[HeadlessSocket]:
+        return self._socket_widgets
+
+    @property
+    def sub_graph(self) -> Optional[HeadlessGraph]:
+        return self._sub_graph
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._is_dirty
+
+    def scene(self) -> HeadlessGraph:
+        return self._graph
+
+    def path(self) -> str:
+        # Node names from the top level graph down to the node
+        if self._graph.parent_node is not None:
+            return self._graph.parent_node.path() + "/" + self._name
+        return self._name
+
+    def has_sub_graph(self) -> bool:
+        return self._sub_graph is not None
+
+    def linked_lowest_socket(self, socket: HeadlessSocket) -> HeadlessSocket:
+        if self._sub_graph is not None:
+            linked_node: HeadlessNode = self._sub_graph.node(socket.link[0])
+            return linked_node.linked_lowest_socket(linked_node.socket_widgets[socket.link[1]])
+        return socket
+
+    def linked_highest_socket(self, socket: HeadlessSocket) -> HeadlessSocket:
+        parent_node: Optional[HeadlessNode] = self._graph.parent_node
+        if parent_node is not None and socket.link[0] == parent_node.uuid:
+            return parent_node.linked_highest_socket(parent_node.socket_widgets[socket.link[1]])
+        return socket
+
+    def predecessors(self) -> list[HeadlessNode]:
+        return [
+            item.parent_node for socket_widget in self.input_socket_widgets for item in socket_widget.input_data()
+            if isinstance(item, HeadlessSocket)
+        ]
+
+    def __getattr__(self, name: str) -> Any:
+        return borrowed_attribute(self, name)
+
+
+class HeadlessGraph:
+    # Evaluates serialized DAGScenes without a QApplication, e.g. on render or CI machines
+    def __init__(self, dag_dict: dict, parent_node: Optional[HeadlessNode] = None) -> None:
+        self._parent_node: Optional[HeadlessNode] = parent_node
+        self._executor: str = THREADED
+
+        self._nodes: dict[str, HeadlessNode] = {}
+        for node_dict in dag_dict["Nodes"]:
+            node_cls: type = getattr(nodes, node_dict["Class"])
+            self._nodes[node_dict["UUID"]] = stand_in_class(HeadlessNode, node_cls)(node_dict, self)
+
+        for edge_dict in dag_dict["Edges"]:
+            start_socket: HeadlessSocket = self._nodes[edge_dict["Start Node UUID"]].socket_widgets[
+                edge_dict["Start Socket Idx"]
+            ]
+            end_socket: HeadlessSocket = self._nodes[edge_dict["End Node UUID"]].socket_widgets[
+                edge_dict["End Socket Idx"]
+            ]
+            if start_socket.is_input:
+                start_socket, end_socket = end_socket, start_socket
+            end_socket.sources.append(start_socket)
+
+    @classmethod
+    def load(cls, file_path: str) -> HeadlessGraph:
+        # Project files and the plain JSON files of earlier versions, like EditorWidget.open
+        if is_project_file(file_path):
+            return cls(ProjectFile(file_path).root())
+
+        with open(file_path, "r", encoding="utf8") as json_file:
+            return cls(json.load(json_file))
+
+    @property
+    def parent_node(self) -> Optional[HeadlessNode]:
+        return self._parent_node
+
+    @property
+    def executor(self) -> str:
+        if self._parent_node is not None:
+            return self._parent_node.scene().executor
+        return self._executor
+
+    @executor.setter
+    def executor(self, value: str) -> None:
+        self._executor: str = value
+
+    @property
+    def nodes(self) -> list[HeadlessNode]:
+        return list(self._nodes.values())
+
+    def node(self, uuid: str) -> HeadlessNode:
+        return self._nodes[uuid]
+
+    def all_nodes(self) -> list[HeadlessNode]:
+        # Nodes of this graph and of all sub graphs
+        result: list[HeadlessNode] = []
+        for node in self._nodes.values():
+            result.append(node)
+            if node.has_sub_graph():
+                result.extend(node.sub_graph.all_nodes())
+        return result
+
+    # --------------- Sockets ---------------
+
+    def find_node(self, key: str) -> HeadlessNode:
+        # Nodes are addressed by UUID, name or path, e.g. "Group Node/Box"
+        matches: list[HeadlessNode] = [node for node in self.all_nodes() if key in (node.uuid, node.name, node.path())]
+        if len(matches) == 0:
+            raise KeyError("No node " + key)
+        if len(matches) > 1:
+            raise KeyError("Ambiguous node " + key + ", use its path or UUID")
+        return matches[0]
+
+    def find_socket(self, socket_path: str, is_input: bool) -> HeadlessSocket:
+        # Socket paths are the node key and the socket name, e.g. "Box.L"
+        node_key, _, socket_name = socket_path.rpartition(".")
+        node: HeadlessNode = self.find_node(node_key)
+        if not node.IS_HEADLESS:
+            raise ValueError(node.path() + " can not be evaluated headless")
+
+        for socket_widget in node.socket_widgets:
+            if socket_widget.name == socket_name and socket_widget.is_input == is_input:
+                return socket_widget
+        raise KeyError("No " + ("input" if is_input else "output") + " socket " + socket_path)
+
+    def set_value(self, socket_path: str, value: Any) -> None:
+        socket_widget: HeadlessSocket = self.find_socket(socket_path, True)
+        if socket_widget.is_connected():
+            raise ValueError("Socket " + socket_path + " is connected")
+        socket_widget.value = value
+
+    def result_sockets(self) -> list[HeadlessSocket]:
+        # Outputs of headless nodes that do not feed another headless node, i.e. the results shown in the editor's
+        # viewers and unconnected outputs
+        leaf_nodes: list[HeadlessNode] = [
+            node for node in self.all_nodes() if not node.has_sub_graph() and node.IS_HEADLESS
+        ]
+        consumed: set[HeadlessSocket] = {
+            item for node in leaf_nodes for socket_widget in node.input_socket_widgets
+            for item in socket_widget.input_data() if isinstance(item, HeadlessSocket)
+        }
+        return [
+            socket_widget for node in leaf_nodes for socket_widget in node.output_socket_widgets
+            if socket_widget not in consumed
+        ]
+
+    # --------------- Evaluation ---------------
+
+    def to_dsk(self, visited_node: HeadlessNode, graph_dict: dict, quality: int = QUALITY_FULL) -> dict:
+        if not visited_node.IS_HEADLESS:
+            raise ValueError(visited_node.path() + " can not be evaluated headless")
+
+        visited_sockets: list[HeadlessSocket] = visited_node.output_socket_widgets
+        if len(visited_sockets) > 0 and all([socket_widget in graph_dict for socket_widget in visited_sockets]):
+            return graph_dict
+
+        for node in visited_node.predecessors():
+            self.to_dsk(node, graph_dict, quality)
+
+        task_inputs: list = [socket_widget.input_data() for socket_widget in visited_node.input_socket_widgets]
+        for idx, socket_widget in enumerate(visited_sockets):
+            graph_dict[socket_widget] = (visited_node.eval_socket, idx, quality, *task_inputs)
+
+        return graph_dict
+
+    def evaluate(self, targets: Optional[list[HeadlessSocket]] = None,
+                 quality: int = QUALITY_FULL) -> dict[HeadlessSocket, Any]:
+        # Node results are kept between calls, so only nodes downstream of changed values are evaluated again
+        if targets is None:
+            targets: list[HeadlessSocket] = self.result_sockets()
+
+        graph_dict: dict = {}
+        for socket_widget in targets:
+            self.to_dsk(socket_widget.parent_node, graph_dict, quality)
+
+        results: tuple = scheduler(self.executor)(graph_dict, targets)
+        return dict(zip(targets, results))
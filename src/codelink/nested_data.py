@@ -1,9 +1,10 @@
+from __future__ import annotations
 from typing import Any, Optional, Union
 
 import awkward as ak
 import numpy as np
 
-from utils import global_index
+from utils import broadcast_params, nest_by_offsets, nesting_offsets, record_columns, unflatten_like
 
 
 class NestedData:
@@ -13,6 +14,7 @@ class NestedData:
 
 		self._data: list[Any] = data
 		self._structure: ak.Array = structure
+		self._fingerprint: Optional[str] = None
 
 	@property
 	def data(self) -> list[Any]:
@@ -21,6 +23,7 @@ class NestedData:
 	@data.setter
 	def data(self, value: list[Any]) -> None:
 		self._data: list[Any] = value
+		self._fingerprint: Optional[str] = None
 
 	@property
 	def structure(self) -> ak.Array:
@@ -29,60 +32,179 @@ class NestedData:
 	@structure.setter
 	def structure(self, value: ak.Array) -> None:
 		self._structure: ak.Array = value
+		self._fingerprint: Optional[str] = None
+
+	@property
+	def fingerprint(self) -> Optional[str]:
+		return self._fingerprint
+
+	@fingerprint.setter
+	def fingerprint(self, value: Optional[str]) -> None:
+		self._fingerprint: Optional[str] = value
 
 	def __str__(self) -> str:
 		return "Data: " + str(self._data) + " / Structure: " + str(self._structure)
 
 
 class NestedVector:
-	def __init__(self, vector: ak.Array = ak.Array([{"x": 0., "y": 0., "z": 0.}])):
-		self._vector: ak.Array = vector
-		self._structure: ak.Array = ak.transform(global_index, vector.x)
+	# Columnar vectors: a contiguous (n, 3) float64 coordinate array and one offsets array per nesting level, outermost
+	# first. Vector math works on whole columns instead of rebuilding awkward x/y/z records per operation.
+	def __init__(self, coords: Optional[np.ndarray] = None, offsets: Optional[list[np.ndarray]] = None):
+		if coords is None:
+			coords: np.ndarray = np.zeros((1, 3))
+		if offsets is None:
+			offsets: list[np.ndarray] = []
+
+		self._coords: np.ndarray = np.ascontiguousarray(coords, dtype=np.float64).reshape(-1, 3)
+		self._offsets: list[np.ndarray] = [np.asarray(level_offsets, dtype=np.int64) for level_offsets in offsets]
+		self._structure: Optional[ak.Array] = None
+		self._fingerprint: Optional[str] = None
+
+	@classmethod
+	def from_template(cls, coords: np.ndarray, template: ak.Array) -> NestedVector:
+		# One coordinate row per template leaf, e.g. the template returned by broadcast_params
+		return cls(coords, nesting_offsets(template))
+
+	@classmethod
+	def from_record(cls, record: ak.Array) -> NestedVector:
+		return cls(record_columns(record), nesting_offsets(record[record.fields[0]]))
+
+	@classmethod
+	def concatenate(cls, vectors: list[NestedVector]) -> NestedVector:
+		# Joins vectors along the outermost axis, shallower ones are wrapped into single item lists first
+		max_depth: int = max(vector.depth for vector in vectors)
+
+		# Offset arrays per level and the number of items referenced by each level so far
+		level_offsets: list[list[np.ndarray]] = [[] for _ in range(max_depth)]
+		level_sizes: list[int] = [0] * max_depth
+		for vector in vectors:
+			wrapped_offsets: list[np.ndarray] = vector.offsets
+			while len(wrapped_offsets) < max_depth:
+				outer_length: int = len(wrapped_offsets[0]) - 1 if len(wrapped_offsets) > 0 else len(vector.coords)
+				wrapped_offsets: list[np.ndarray] = [np.array([0, outer_length], dtype=np.int64)] + wrapped_offsets
+
+			for level, offsets in enumerate(wrapped_offsets):
+				shifted_offsets: np.ndarray = offsets + level_sizes[level]
+				level_offsets[level].append(shifted_offsets if len(level_offsets[level]) == 0 else shifted_offsets[1:])
+				level_sizes[level] += int(offsets[-1])
+
+		return cls(
+			np.concatenate([vector.coords for vector in vectors]),
+			[np.concatenate(offsets) for offsets in level_offsets]
+		)
 
 	@property
-	def vector(self) -> ak.Array:
-		return self._vector
+	def coords(self) -> np.ndarray:
+		return self._coords
 
-	@vector.setter
-	def vector(self, value: ak.Array) -> None:
-		self._vector: ak.Array = value
-		self._structure: ak.Array = ak.transform(global_index, self._vector.x)
+	@property
+	def offsets(self) -> list[np.ndarray]:
+		return self._offsets
+
+	@property
+	def depth(self) -> int:
+		return len(self._offsets)
 
 	@property
 	def structure(self) -> ak.Array:
+		if self._structure is None:
+			self._structure: ak.Array = nest_by_offsets(np.arange(len(self._coords)), self._offsets)
 		return self._structure
 
-	def simplified(self, as_tuple: bool = False) -> tuple[Union[list[list[tuple]], ak.Array], Union[int, ak.Array]]:
-		depth: int = self._vector.layout.minmax_depth[0]
-
-		simplified_vector: ak.Array = ak.copy(self._vector)
-		nesting_axes: np.ndarray = np.arange(1, depth - 1)
-		for nesting_axis in nesting_axes[::-1]:
-			simplified_vector: ak.Array = ak.flatten(simplified_vector, axis=nesting_axis)
-
-		if as_tuple:
-			simplified_vector: ak.Array = ak.zip([simplified_vector.x, simplified_vector.y, simplified_vector.z])
-			simplified_vector: list[list[tuple]] = ak.to_list(simplified_vector)
-
-		if depth > 1:
-			simplified_structure: ak.Array = ak.transform(global_index, ak.max(self._structure, axis=-1))
-		else:
-			simplified_structure: int = 0
-
-		return simplified_vector, simplified_structure
-
-	def flat(self, as_tuple: bool = False) -> tuple[Union[list[tuple], ak.Array], Union[float, ak.Array]]:
-		if not as_tuple:
-			flat_vector: ak.Array = ak.zip({
-				"x": ak.flatten(self._vector.x, axis=None),
-				"y": ak.flatten(self._vector.y, axis=None),
-				"z": ak.flatten(self._vector.z, axis=None)
-			})
-		else:
-			flat_vector: ak.Array = ak.to_list(ak.zip([
-				ak.flatten(self._vector.x, axis=None),
-				ak.flatten(self._vector.y, axis=None),
-				ak.flatten(self._vector.z, axis=None)
-			]))
-
-		return flat_vector, self._structure
+	@property
+	def fingerprint(self) -> Optional[str]:
+		return self._fingerprint
+
+	@fingerprint.setter
+	def fingerprint(self, value: Optional[str]) -> None:
+		self._fingerprint: Optional[str] = value
+
+	@property
+	def x(self) -> ak.Array:
+		return nest_by_offsets(self._coords[:, 0], self._offsets)
+
+	@property
+	def y(self) -> ak.Array:
+		return nest_by_offsets(self._coords[:, 1], self._offsets)
+
+	@property
+	def z(self) -> ak.Array:
+		return nest_by_offsets(self._coords[:, 2], self._offsets)
+
+	def nested(self, flat_data: np.ndarray) -> ak.Array:
+		# Per vector values, e.g. lengths, nested like the vectors
+		return nest_by_offsets(flat_data, self._offsets)
+
+	def to_record(self) -> ak.Array:
+		return ak.zip({"x": self.x, "y": self.y, "z": self.z})
+
+	# --------------- Socket operations ---------------
+
+	def flattened(self) -> NestedVector:
+		return NestedVector(self._coords)
+
+	def simplified(self) -> NestedVector:
+		# Keeps the outermost list level only, like simplify_array
+		if self.depth < 2:
+			return self
+
+		simple_offsets: np.ndarray = self._offsets[0]
+		for level_offsets in self._offsets[1:]:
+			simple_offsets: np.ndarray = level_offsets[simple_offsets]
+		return NestedVector(self._coords, [simple_offsets])
+
+	def grafted(self) -> NestedVector:
+		return NestedVector(self._coords, self._offsets + [np.arange(len(self._coords) + 1, dtype=np.int64)])
+
+	# --------------- Vector kernels ---------------
+
+	def broadcast(self, other: Union[NestedVector, ak.Array]) -> tuple[np.ndarray, np.ndarray, ak.Array]:
+		# Broadcasts both operands like awkward would and gathers their flat rows in one go
+		if isinstance(other, NestedVector):
+			columns, template = broadcast_params({"a": self.structure, "b": other.structure})
+			return self._coords[columns["a"]], other.coords[columns["b"]], template
+
+		columns, template = broadcast_params({"a": self.structure, "b": other})
+		return self._coords[columns["a"]], columns["b"].astype(np.float64)[:, np.newaxis], template
+
+	def __add__(self, other: NestedVector) -> NestedVector:
+		a, b, template = self.broadcast(other)
+		return NestedVector.from_template(a + b, template)
+
+	def __sub__(self, other: NestedVector) -> NestedVector:
+		a, b, template = self.broadcast(other)
+		return NestedVector.from_template(a - b, template)
+
+	def __mul__(self, other: Union[NestedVector, ak.Array]) -> NestedVector:
+		# Component wise product, or scaling if other holds scalar factors
+		a, b, template = self.broadcast(other)
+		return NestedVector.from_template(a * b, template)
+
+	def __truediv__(self, other: Union[NestedVector, ak.Array]) -> NestedVector:
+		a, b, template = self.broadcast(other)
+		return NestedVector.from_template(a / b, template)
+
+	def cross(self, other: NestedVector) -> NestedVector:
+		a, b, template = self.broadcast(other)
+		return NestedVector.from_template(np.cross(a, b), template)
+
+	def dot(self, other: NestedVector) -> ak.Array:
+		a, b, template = self.broadcast(other)
+		return unflatten_like(np.einsum("ij,ij->i", a, b), template)
+
+	def length(self) -> ak.Array:
+		return self.nested(np.linalg.norm(self._coords, axis=1))
+
+	def normalized(self) -> NestedVector:
+		# Zero vectors stay zero
+		lengths: np.ndarray = np.linalg.norm(self._coords, axis=1)[:, np.newaxis]
+		unit_coords: np.ndarray = np.divide(
+			self._coords, lengths, out=np.zeros_like(self._coords), where=lengths > 0
+		)
+		return NestedVector(unit_coords, self._offsets)
+
+	def __len__(self) -> int:
+		return len(self._coords)
+
+	def __str__(self) -> str:
+		return str(self.to_record())
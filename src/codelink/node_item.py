@@ -21,12 +21,16 @@
 # ***************************************************************************
 
 from __future__ import annotations
-from typing import Optional, Union, Callable, cast
+from typing import Any, Optional, Union, Callable, cast
 import sys
 import importlib
+import functools
 import inspect
+import warnings
+import time
 from itertools import chain
 
+import numpy as np
 import awkward as ak
 
 import PySide2.QtCore as QtCore
@@ -34,8 +38,14 @@ import PySide2.QtWidgets as QtWidgets
 import PySide2.QtGui as QtGui
 
 from app_style import NODE_STYLE
-from utils import crop_text, global_index, unwrap_list
-from nested_data import NestedData
+from utils import (
+    crop_text, global_index, unwrap_list, data_fingerprint, is_unknown_fingerprint, data_length, unflatten_like
+)
+from nested_data import NestedData, NestedVector
+from result_cache import RESULT_CACHE, SESSION_KEY_PREFIX
+from eval_profiler import PROFILER, CACHE_HIT, CACHE_MEMO, CACHE_MISS
+from project_file import SubGraphChunk
+from executors import MULTIPROCESS, parallel_map
 from property_model import PropertyModel
 from frame_item import FrameItem
 from sockets import *
@@ -43,8 +53,56 @@ from socket_widget import SocketWidget
 from edge_item import EdgeItem
 
 
+# Quality levels of an evaluation, evals opt in to cheaper previews with a quality argument
+QUALITY_PREVIEW: int = 0
+QUALITY_FULL: int = 1
+
+# Below these zoom levels node contents and, further out, the node headers are not drawn
+DETAIL_ZOOM_LEVEL: int = 8
+OVERVIEW_ZOOM_LEVEL: int = 7
+
+
+def node_eval(output_idx: int) -> Callable:
+    # Marks a node method as the eval of the output socket with output_idx, which is also its cache slot. The wrapper
+    # serves cached results and handles dirty flags and warning capture for all nodes.
+    def decorator(eval_fn: Callable) -> Callable:
+        takes_quality: bool = "quality" in inspect.signature(eval_fn).parameters.keys()
+
+        @functools.wraps(eval_fn)
+        def wrapper(self: NodeItem, *args, quality: int = QUALITY_FULL) -> Any:
+            if self._is_invalid or self._cache[output_idx] is None:
+                with warnings.catch_warnings():
+                    warnings.filterwarnings("error")
+                    try:
+                        if takes_quality:
+                            result: Any = eval_fn(self, *args, quality=quality)
+                        else:
+                            result: Any = eval_fn(self, *args)
+
+                        self._is_dirty: bool = False
+                        self._is_invalid: bool = False
+                        self._cache[output_idx] = self.output_data(output_idx, result)
+
+                    except Exception as e:  # Warnings are raised as errors
+                        self._is_dirty: bool = True
+                        print(e)
+
+            return self._cache[output_idx]
+
+        wrapper.output_idx = output_idx
+        wrapper.takes_quality = takes_quality
+        return wrapper
+
+    return decorator
+
+
 class NodeItem(QtWidgets.QGraphicsItem):
     REG_NAME: str = "Node Item"
+    IS_PURE: bool = False  # Eval results only depend on the inputs and eval_state, without side effects
+    IS_PARALLEL: bool = False  # Large element maps run chunked on the process pool, regardless of the executor
+    PARALLEL_MIN_ELEMENTS: int = 256
+    IS_HEADLESS: bool = True  # Evals only use sockets and OPTIONS, so the headless runner can evaluate the node
+    OPTIONS: list[str] = []  # Items of the option box, if the node has one
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = "Node Item",
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -70,14 +128,15 @@ class NodeItem(QtWidgets.QGraphicsItem):
         self._undo_stack: QtWidgets.QUndoStack = undo_stack
 
         self._parent_frame: Optional[FrameItem] = None
-        dag_scene_cls: type = getattr(importlib.import_module("dag_scene"), "DAGScene")  # Hack: Prevents cyclic import
-        self._sub_scene: dag_scene_cls = dag_scene_cls(self._undo_stack)
-        self._sub_scene.background_color = QtGui.QColor("#383838")
-        self._sub_scene.parent_node = self
+        self._sub_scene: Optional[Any] = None  # Created on first access, leaf nodes never get one
+        self._pending_sub_graph: Optional[SubGraphChunk] = None
 
         self._socket_widgets: list[SocketWidget] = []
         self._evals: list[Callable] = []
         self._cache: list[Any] = []
+        self._input_fingerprints: list[Any] = []
+        self._result_keys: list[Optional[str]] = []
+        self._output_result_keys: list[Optional[str]] = []  # Outputs of a deferred sub graph, as saved with the group
 
         self._mode: str = ""
         self._lm_pressed: bool = False
@@ -88,6 +147,7 @@ class NodeItem(QtWidgets.QGraphicsItem):
         self._zoom_level: Optional[int] = None
         self._is_dirty: bool = False
         self._is_invalid: bool = False
+        self._is_running: bool = False
 
         # Node geometry
         self._title_left_padding: int = 20
@@ -109,9 +169,15 @@ class NodeItem(QtWidgets.QGraphicsItem):
 
         self._default_border_pen: QtGui.QPen = QtGui.QPen(self._default_border_color)
         self._dirty_pen: QtGui.QPen = QtGui.QPen(self._dirty_border_color)
+        self._running_pen: QtGui.QPen = QtGui.QPen(self._dirty_border_color)
+        self._running_pen.setStyle(QtCore.Qt.DashLine)
+        self._running_pen.setWidthF(1.5)
         self._selected_border_pen: QtGui.QPen = QtGui.QPen(self._selected_border_color)
         self._selected_border_pen.setWidthF(1.5)
 
+        self._cold_timing_color: QtGui.QColor = QtGui.QColor("#2E7D32")
+        self._hot_timing_color: QtGui.QColor = QtGui.QColor("#C62828")
+
         self._header_font: QtGui.QFont = QtGui.QFont()
 
         self._collapse_img_down: QtGui.QImage = QtGui.QImage("icon:images_dark-light/down_arrow_light.svg")
@@ -163,6 +229,11 @@ class NodeItem(QtWidgets.QGraphicsItem):
         self._content_proxy.setFocusPolicy(QtCore.Qt.ClickFocus)
         self._content_proxy.setWidget(self._content_widget)
 
+        # Static parts are repainted from pixmaps while the view is panned
+        self._collapse_btn.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+        self._name_item.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+        self._content_proxy.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+
         self.update_all()
 
         # Widget setup
@@ -181,7 +252,10 @@ class NodeItem(QtWidgets.QGraphicsItem):
 
     @uuid.setter
     def uuid(self, value: str) -> None:
+        old_uuid: str = self._uuid
         self._uuid: str = value
+        if self.scene() is not None:
+            self.scene().rename_dag_item(self, old_uuid)
 
     @property
     def prop_model(self) -> PropertyModel:
@@ -209,11 +283,16 @@ class NodeItem(QtWidgets.QGraphicsItem):
 
     @property
     def sub_scene(self) -> Any:
+        if self._sub_scene is None:
+            self.create_sub_scene()
+        if self._pending_sub_graph is not None:
+            self.load_sub_scene()
         return self._sub_scene
 
     @sub_scene.setter
     def sub_scene(self, value: Any) -> None:
         self._sub_scene: Any = value
+        self._pending_sub_graph: Optional[SubGraphChunk] = None
 
     @property
     def content_widget(self) -> QtWidgets.QWidget:
@@ -259,6 +338,10 @@ class NodeItem(QtWidgets.QGraphicsItem):
     def cache(self, value: list[Any]) -> None:
         self._cache: list[Any] = value
 
+    @property
+    def result_keys(self) -> list[Optional[str]]:
+        return self._result_keys
+
     @property
     def is_invalid(self) -> bool:
         return self._is_invalid
@@ -267,6 +350,14 @@ class NodeItem(QtWidgets.QGraphicsItem):
     def is_invalid(self, value: bool) -> None:
         self._is_invalid: bool = value
 
+    @property
+    def is_running(self) -> bool:
+        return self._is_running
+
+    @is_running.setter
+    def is_running(self, value: bool) -> None:
+        self._is_running: bool = value
+
     @property
     def header_height(self) -> int:
         return self._header_height
@@ -311,14 +402,25 @@ class NodeItem(QtWidgets.QGraphicsItem):
         self._zoom_level: int = value
 
     # --------------- Socket widget editing ---------------
+    @classmethod
+    def eval_functions(cls) -> list[Callable]:
+        # Collects the node_eval decorated methods once per class, ordered by output index
+        if "_eval_functions" not in cls.__dict__:
+            eval_fns: dict[int, Callable] = {}
+            for base_cls in reversed(cls.__mro__):
+                for attr in vars(base_cls).values():
+                    if callable(attr) and hasattr(attr, "output_idx"):
+                        eval_fns[attr.output_idx] = attr
+            cls._eval_functions: list[Callable] = [eval_fns[idx] for idx in sorted(eval_fns.keys())]
+
+        return cls._eval_functions
+
     def register_evals(self):
-        eval_methods = [
-            getattr(self, attr) for attr in dir(self) if (
-                    attr.startswith("eval_") and inspect.ismethod(getattr(self, attr))
-            )
-        ]
+        eval_methods: list[Callable] = [getattr(self, eval_fn.__name__) for eval_fn in self.eval_functions()]
         self._evals: list[Callable] = eval_methods
         self._cache: list[Any] = [None] * len(self._evals)
+        self._input_fingerprints: list[Any] = [None] * len(self._evals)
+        self._result_keys: list[Optional[str]] = [None] * len(self._evals)
 
     def register_sockets(self):
         self._content_widget.hide()
@@ -339,6 +441,8 @@ class NodeItem(QtWidgets.QGraphicsItem):
         cast(QtCore.SignalInstance, socket_widget.prop_model.dataChanged).connect(
                 lambda: self.scene().execute_dag(socket_widget.parent_node)
         )
+        if self.scene() is not None:
+            self.scene().invalidate_execution_graph()
 
     def remove_socket_widget(self, remove_idx: int = 0):
         if 0 <= remove_idx < len(self._socket_widgets):
@@ -359,6 +463,7 @@ class NodeItem(QtWidgets.QGraphicsItem):
 
             self._content_widget.show()
             self.update_all()
+            self.scene().invalidate_execution_graph()
 
     def clear_socket_widgets(self):
         while len(self.socket_widgets) > 0:
@@ -383,7 +488,7 @@ class NodeItem(QtWidgets.QGraphicsItem):
 
         # Sort socket widget links
         for idx, sorted_socket in enumerate(self._socket_widgets):
-            linked_node: NodeItem = self._sub_scene.dag_item(sorted_socket.link[0])
+            linked_node: NodeItem = self.sub_scene.dag_item(sorted_socket.link[0])
             linked_socket: SocketWidget = linked_node.socket_widgets[sorted_socket.link[1]]
             linked_socket.link = (self.uuid, idx)
 
@@ -411,7 +516,7 @@ class NodeItem(QtWidgets.QGraphicsItem):
         return False
 
     def linked_lowest_socket(self, socket: SocketWidget) -> Optional[SocketWidget]:
-        if len(self._sub_scene.nodes) > 0:
+        if self.has_sub_scene():
             linked_node: NodeItem = self.sub_scene.dag_item(socket.link[0])
             linked_socket: SocketWidget = linked_node.socket_widgets[socket.link[1]]
             return linked_node.linked_lowest_socket(linked_socket)
@@ -433,7 +538,7 @@ class NodeItem(QtWidgets.QGraphicsItem):
                 if len(socket_widget.pin.edges) > 0:
                     for edge in socket_widget.pin.edges:
                         pre_node: NodeItem = edge.start_pin.parent_node
-                        if len(pre_node.sub_scene.nodes) > 0:
+                        if pre_node.has_sub_scene():
                             linked_lowest: SocketWidget = pre_node.linked_lowest_socket(edge.start_pin.socket_widget)
                             result.append(linked_lowest.parent_node)
                         else:
@@ -459,7 +564,7 @@ class NodeItem(QtWidgets.QGraphicsItem):
                 if len(socket_widget.pin.edges) > 0:
                     for edge in socket_widget.pin.edges:
                         suc_node: NodeItem = edge.end_pin.parent_node
-                        if len(suc_node.sub_scene.nodes) > 0:
+                        if suc_node.has_sub_scene():
                             linked_lowest: SocketWidget = suc_node.linked_lowest_socket(edge.end_pin.socket_widget)
                             result.append(linked_lowest.parent_node)
                         else:
@@ -478,7 +583,29 @@ class NodeItem(QtWidgets.QGraphicsItem):
         return result
 
     def has_sub_scene(self) -> bool:
-        return len(self._sub_scene.nodes) > 0
+        # Does not load a deferred sub graph, project files only defer non empty ones
+        if self._pending_sub_graph is not None:
+            return True
+        return self._sub_scene is not None and len(self._sub_scene.nodes) > 0
+
+    def is_sub_scene_loaded(self) -> bool:
+        return self._pending_sub_graph is None
+
+    def create_sub_scene(self) -> None:
+        dag_scene_cls: type = getattr(importlib.import_module("dag_scene"), "DAGScene")  # Hack: Prevents cyclic import
+        self._sub_scene: Optional[Any] = dag_scene_cls(self._undo_stack)
+        self._sub_scene.background_color = QtGui.QColor("#383838")
+        self._sub_scene.parent_node = self
+
+    def load_sub_scene(self) -> None:
+        sub_graph: dict = self._pending_sub_graph.load()
+        self._pending_sub_graph: Optional[SubGraphChunk] = None
+
+        if self._sub_scene is None:
+            self.create_sub_scene()
+        self._sub_scene.deserialize(sub_graph)
+        for sub_node in self._sub_scene.nodes:
+            sub_node.scene().parent_node = self
 
     def is_grp_interface(self) -> bool:
         has_links: bool = any([True for socket in self._socket_widgets if socket.link != ("", -1)])
@@ -488,7 +615,7 @@ class NodeItem(QtWidgets.QGraphicsItem):
 
     # --------------- Data processing methods ---------------
 
-    def input_data(self, socket_index: int, args: tuple[Any, ...]) -> Union[list, ak.Array, NestedData]:
+    def input_data(self, socket_index: int, args: tuple[Any, ...]) -> Union[list, ak.Array, NestedData, NestedVector]:
         socket_data: Union[list, ak.Array] = []
         if 0 <= socket_index < len(self.input_socket_widgets):
             # Awkward array handling
@@ -535,6 +662,13 @@ class NodeItem(QtWidgets.QGraphicsItem):
             elif type(unwrap_list(args[socket_index])) == NestedData:
                 socket_data: NestedData = args[socket_index][0]
 
+            # NestedVector handling
+            elif len(args[socket_index]) > 1 and all([type(item) == NestedVector for item in args[socket_index]]):
+                socket_data: NestedVector = NestedVector.concatenate(args[socket_index])
+
+            elif type(unwrap_list(args[socket_index])) == NestedVector:
+                socket_data: NestedVector = args[socket_index][0]
+
             # List handling
             elif len(args[socket_index]) > 1 and all([type(item) == list for item in args[socket_index]]):
                 socket_data: list = []
@@ -556,6 +690,140 @@ class NodeItem(QtWidgets.QGraphicsItem):
         socket_data: Union[list, ak.Array] = self.output_socket_widgets[socket_index].perform_socket_operation(args)
         return socket_data
 
+    def eval_socket(self, eval_idx: int, quality: int, *args) -> Any:
+        # Skips the evaluation if the socket inputs did not change since the last run. Evals without a preview variant
+        # always run at full quality.
+        if not self._evals[eval_idx].takes_quality:
+            quality: int = QUALITY_FULL
+
+        start: float = time.perf_counter()
+        input_fingerprint: Any = data_fingerprint(args)
+        if (self._cache[eval_idx] is not None and
+                (input_fingerprint, quality) == self._input_fingerprints[eval_idx]):
+            self._is_invalid: bool = False
+            self.record_eval(eval_idx, start, args, self._cache[eval_idx], CACHE_HIT)
+            return self._cache[eval_idx]
+
+        # Serves results of earlier evaluations with the same node state and inputs, e.g. after undo. Previews are
+        # cheap and not memoized, neither are results of inputs without a value equality key.
+        result_key: Optional[str] = None
+        if self.IS_PURE and quality == QUALITY_FULL and not is_unknown_fingerprint(input_fingerprint):
+            result_key: Optional[str] = RESULT_CACHE.key(
+                type(self).__name__, eval_idx, self.eval_state(), input_fingerprint
+            )
+            result: Any = RESULT_CACHE.get(result_key)
+            if result is not None:
+                self._is_dirty: bool = False
+                self._is_invalid: bool = False
+                self._cache[eval_idx] = result
+                self._input_fingerprints[eval_idx] = (input_fingerprint, quality)
+                self._result_keys[eval_idx] = result_key
+                self.record_eval(eval_idx, start, args, result, CACHE_MEMO)
+                return result
+
+        self._cache[eval_idx] = None
+        self._result_keys[eval_idx] = None
+        result: Any = self._evals[eval_idx](*args, quality=quality)
+        self._input_fingerprints[eval_idx] = (input_fingerprint, quality) if result is not None else None
+
+        if result_key is not None and result is not None and not self._is_dirty:
+            # Session keys are only valid while the entry holds the input shapes, so results do not carry them
+            if (isinstance(result, (NestedData, NestedVector)) and result.fingerprint is None and
+                    not result_key.startswith(SESSION_KEY_PREFIX)):
+                result.fingerprint = result_key
+            RESULT_CACHE.put(result_key, result, input_fingerprint)
+            self._result_keys[eval_idx] = result_key
+
+        self.record_eval(eval_idx, start, args, result, CACHE_MISS)
+        return result
+
+    def record_eval(self, eval_idx: int, start: float, args: tuple, result: Any, cache_state: str) -> None:
+        # Hands the wall time and data sizes of an eval to the profiler, which backs the timing overlay
+        if not PROFILER.is_enabled:
+            return
+
+        PROFILER.record(
+            self._uuid, self.name, eval_idx, start, time.perf_counter(), data_length(args), data_length(result),
+            cache_state
+        )
+
+    def map_elements(self, kernel: Callable, params: list) -> list:
+        # Runs a module level kernel per parameter tuple, on worker processes for pure nodes of multiprocess scenes
+        # and for large inputs of parallel nodes
+        if not self.IS_PURE:
+            return parallel_map(kernel, params)
+
+        scene_parallel: bool = self.scene() is not None and self.scene().executor == MULTIPROCESS
+        node_parallel: bool = self.IS_PARALLEL and len(params) >= self.PARALLEL_MIN_ELEMENTS
+        return parallel_map(kernel, params, scene_parallel or node_parallel)
+
+    def map_nested(self, kernel: Callable, params: list, template: ak.Array) -> NestedData:
+        # Maps the kernel over the broadcast parameters and nests the results like the broadcast template
+        flat_data: list = self.map_elements(kernel, params)
+        return NestedData(data=flat_data, structure=unflatten_like(np.arange(len(flat_data)), template))
+
+    def eval_state(self) -> tuple:
+        # Node state besides the socket inputs that the eval results depend on
+        socket_state: tuple = tuple(
+            (type(socket_widget).__name__, socket_widget.is_input, tuple(socket_widget.socket_options_state()))
+            for socket_widget in self._socket_widgets
+        )
+        option_box: Optional[QtWidgets.QComboBox] = getattr(self, "_option_box", None)
+        option_idx: int = option_box.currentIndex() if option_box is not None else -1
+
+        return socket_state, option_idx
+
+    def has_preview(self) -> bool:
+        return any([eval_fn.takes_quality for eval_fn in self._evals])
+
+    def cached_output(self, eval_idx: int) -> Any:
+        return self._cache[eval_idx]
+
+    def is_cached(self) -> bool:
+        return all([value is not None for value in self._cache])
+
+    def output_result(self, eval_idx: int) -> tuple[Optional[str], Any]:
+        # Result key and value of an output, for group nodes those of the inner socket the output is linked to
+        if not self.is_sub_scene_loaded():
+            if eval_idx < len(self._output_result_keys):
+                return self._output_result_keys[eval_idx], self.stored_output(eval_idx)
+            return None, None
+
+        if self.has_sub_scene():
+            socket_widget: SocketWidget = self.output_socket_widgets[eval_idx]
+            linked_node: NodeItem = self.sub_scene.dag_item(socket_widget.link[0])
+            linked_socket: SocketWidget = linked_node.socket_widgets[socket_widget.link[1]]
+            return linked_node.output_result(linked_node.output_socket_widgets.index(linked_socket))
+
+        result_key: Optional[str] = self._result_keys[eval_idx]
+        if result_key is None or result_key.startswith(SESSION_KEY_PREFIX):
+            return None, None
+        return result_key, self._cache[eval_idx]
+
+    def output_result_keys(self) -> list[Optional[str]]:
+        return [self.output_result(idx)[0] for idx in range(len(self.output_socket_widgets))]
+
+    def stored_output(self, eval_idx: int) -> Any:
+        # Output of a group with deferred sub graph, served from the results stored with its project file. These
+        # results are never added to the result cache, as their keys can not be checked against the file content.
+        if (self._pending_sub_graph is not None and eval_idx < len(self._output_result_keys) and
+                self._output_result_keys[eval_idx] is not None):
+            return self._pending_sub_graph.result(self._output_result_keys[eval_idx])
+        return None
+
+    def has_stored_outputs(self) -> bool:
+        return (len(self._output_result_keys) == len(self.output_socket_widgets) and
+                all([self.stored_output(idx) is not None for idx in range(len(self._output_result_keys))]))
+
+    def stored_results(self) -> dict[str, Any]:
+        # Group outputs by result key, as stored in project files
+        results: dict[str, Any] = {}
+        for idx in range(len(self.output_socket_widgets)):
+            result_key, value = self.output_result(idx)
+            if result_key is not None and value is not None:
+                results[result_key] = value
+        return results
+
     # --------------- Overwrites ---------------
 
     def scene(self) -> Any:
@@ -725,7 +993,10 @@ class NodeItem(QtWidgets.QGraphicsItem):
     def update_details(self, zoom_level: int) -> None:
         self._zoom_level = zoom_level
 
-        if self._zoom_level < 8:
+        self._name_item.setVisible(self._zoom_level >= OVERVIEW_ZOOM_LEVEL)
+        self._collapse_btn.setVisible(self._zoom_level >= OVERVIEW_ZOOM_LEVEL)
+
+        if self._zoom_level < DETAIL_ZOOM_LEVEL:
             # self.setEnabled(False)
             self.content_widget.clearFocus()
             self.content_widget.hide()
@@ -772,6 +1043,8 @@ class NodeItem(QtWidgets.QGraphicsItem):
         painter.setBrush(QtCore.Qt.NoBrush)
         if self.isSelected():
             painter.setPen(self._selected_border_pen)
+        elif self._is_running:
+            painter.setPen(self._running_pen)
         elif self._is_dirty:
             painter.setPen(self._dirty_border_color)
         elif self._is_invalid:
@@ -781,6 +1054,33 @@ class NodeItem(QtWidgets.QGraphicsItem):
         # painter.drawRoundedRect(self.boundingRect(), self._corner_radius, self._corner_radius)
         painter.drawRect(self.boundingRect())
 
+        if self.scene() is not None and self.scene().timing_overlay:
+            self.paint_timing(painter)
+
+    def paint_timing(self, painter: QtGui.QPainter) -> None:
+        # Heat bar below the header, from cold (fast) to hot (slowest node), and the recorded wall time in the header
+        heat: float = PROFILER.heat(self._uuid)
+        heat_color: QtGui.QColor = QtGui.QColor.fromRgbF(
+            (1 - heat) * self._cold_timing_color.redF() + heat * self._hot_timing_color.redF(),
+            (1 - heat) * self._cold_timing_color.greenF() + heat * self._hot_timing_color.greenF(),
+            (1 - heat) * self._cold_timing_color.blueF() + heat * self._hot_timing_color.blueF()
+        )
+
+        bar_rect: QtCore.QRectF = QtCore.QRectF(
+            0, self._header_height, self._prop_model.properties["Width"], self._content_padding
+        )
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(heat_color)
+        painter.drawRect(bar_rect)
+
+        painter.setPen(self._font_color)
+        painter.setFont(self._header_font)
+        painter.drawText(
+            QtCore.QRectF(0, 0, self._prop_model.properties["Width"] - self._content_padding, self._header_height),
+            QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter,
+            "{number:.{digits}f} ms".format(number=1000 * PROFILER.node_time(self._uuid), digits=2)
+        )
+
     # --------------- Serialization ---------------
 
     def __getstate__(self) -> dict:
@@ -795,12 +1095,20 @@ class NodeItem(QtWidgets.QGraphicsItem):
             sockets_list.append(socket_widget.__getstate__())
         data_dict["Sockets"] = sockets_list
 
-        data_dict["Subgraph"] = self.sub_scene.serialize()
+        if self._pending_sub_graph is not None:
+            data_dict["Subgraph"] = self._pending_sub_graph.expanded()
+        elif self._sub_scene is not None:
+            data_dict["Subgraph"] = self._sub_scene.serialize()
+        else:
+            data_dict["Subgraph"] = {"Nodes": [], "Edges": [], "Frames": []}
+
+        if self.has_sub_scene():
+            data_dict["Output Keys"] = self.output_result_keys()
 
         return data_dict
 
     def __setstate__(self, state: dict):
-        self._uuid = state["UUID"]
+        self.uuid = state["UUID"]
         self.prop_model.__setstate__(state["Properties"])
 
         # Add socket widgets from state
@@ -824,12 +1132,16 @@ class NodeItem(QtWidgets.QGraphicsItem):
 
             new_socket_widget.update_all()
 
-        # Reset sub graph content_value
-        self.sub_scene.deserialize(state["Subgraph"])
-
-        if self.has_sub_scene():
-            # If custom node with sub scene
-            for sub_node in self.sub_scene.nodes:
-                sub_node.scene().parent_node = self
+        # Reset sub graph content_value, project files defer it until the sub scene is opened or evaluated
+        self._output_result_keys: list[Optional[str]] = list(state.get("Output Keys", []))
+        if isinstance(state["Subgraph"], SubGraphChunk):
+            self._pending_sub_graph: Optional[SubGraphChunk] = state["Subgraph"]
+        elif len(state["Subgraph"]["Nodes"]) > 0 or self._sub_scene is not None:
+            self.sub_scene.deserialize(state["Subgraph"])
+
+            if self.has_sub_scene():
+                # If custom node with sub scene
+                for sub_node in self.sub_scene.nodes:
+                    sub_node.scene().parent_node = self
 
         # self.update()
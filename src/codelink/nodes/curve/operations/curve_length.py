@@ -22,9 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
@@ -36,7 +33,7 @@ import PySide2.QtWidgets as QtWidgets
 
 from utils import unflatten_array_like
 from nested_data import NestedData
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from sockets.shape_none import ShapeNone
 from sockets.value_line import ValueLine
 
@@ -45,11 +42,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class CurveLength(NodeItem):
     REG_NAME: str = "Curve Length"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -65,40 +60,15 @@ class CurveLength(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> NestedData:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        curve: NestedData = self.input_data(0, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        flat_result: list[float] = []
-                        for shp in curve.data:
-                            if len(shp.Vertexes) > 0 and (len(shp.Wires) > 0 or len(shp.Edges) > 0):
-                                flat_result.append(shp.Length)
-
-                        result: ak.Array = unflatten_array_like(ak.Array(flat_result), curve.structure)
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Curve Length executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                           digits=2), "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        curve: NestedData = self.input_data(0, args)
+
+        flat_result: list[float] = []
+        for shp in curve.data:
+            if len(shp.Vertexes) > 0 and (len(shp.Wires) > 0 or len(shp.Edges) > 0):
+                flat_result.append(shp.Length)
+
+        result: ak.Array = unflatten_array_like(ak.Array(flat_result), curve.structure)
+
+        return result
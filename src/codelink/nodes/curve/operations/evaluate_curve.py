@@ -22,10 +22,8 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
+import numpy as np
 import awkward as ak
 
 # noinspection PyUnresolvedReferences
@@ -35,9 +33,9 @@ import Points  # noqa
 
 import PySide2.QtWidgets as QtWidgets
 
-from utils import flatten_record, unflatten_record_like
-from nested_data import NestedData
-from node_item import NodeItem
+from utils import broadcast_params
+from nested_data import NestedData, NestedVector
+from node_item import NodeItem, node_eval
 from sockets.shape_none import ShapeNone
 from sockets.value_line import ValueLine
 from sockets.vector_none import VectorNone
@@ -47,11 +45,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class EvaluateCurve(NodeItem):
     REG_NAME: str = "Evaluate Curve"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -70,94 +66,26 @@ class EvaluateCurve(NodeItem):
 
     # --------------- Node eval methods ---------------
 
-    def eval_0(self, *args) -> NestedData:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        curve: NestedData = self.input_data(0, args)
-                        value: ak.Array = self.input_data(1, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        broadcasted_params: ak.Array = ak.zip({"x": curve.structure, "y": value,
-                                                               "z": ak.Array([0])})
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                        flat_x, flat_y, flat_z = ([], [], [])
-                        for param_tuple in flat_params:
-                            crv: Part.Shape = curve.data[param_tuple["0"]]
-                            if len(crv.Vertexes) > 0 and type(crv) == Part.Edge:
-                                pos: FreeCAD.Vector = curve.data[param_tuple["0"]].valueAt(param_tuple["1"])
-                                flat_x.append(pos.x), flat_y.append(pos.y), flat_z.append(pos.z)
-
-                        if len(flat_x) > 0:
-                            flat_result: ak.Array = ak.Array({"x": flat_x, "y": flat_y, "z": flat_z})
-                        else:
-                            flat_result: ak.Array = ak.Array([{"x": 0, "y": 0, "z": 0}])
-
-                        result: ak.Array = unflatten_record_like(flat_result, broadcasted_params)
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Evaluate Curve executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                             digits=2), "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
-
-    def eval_1(self, *args) -> NestedData:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        curve: NestedData = self.input_data(0, args)
-                        value: ak.Array = self.input_data(1, args)
-
-                        broadcasted_params: ak.Array = ak.zip({"x": curve.structure, "y": value,
-                                                               "z": ak.Array([0])})
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                        flat_x, flat_y, flat_z = ([], [], [])
-                        for param_tuple in flat_params:
-                            crv: Part.Shape = curve.data[param_tuple["0"]]
-                            if len(crv.Vertexes) > 0 and type(crv) == Part.Edge:
-                                pos: FreeCAD.Vector = curve.data[param_tuple["0"]].tangentAt(param_tuple["1"])
-                                flat_x.append(pos.x), flat_y.append(pos.y), flat_z.append(pos.z)
-
-                        if len(flat_x) > 0:
-                            flat_result: ak.Array = ak.Array({"x": flat_x, "y": flat_y, "z": flat_z})
-                        else:
-                            flat_result: ak.Array = ak.Array([{"x": 0, "y": 0, "z": 0}])
-
-                        result: ak.Array = unflatten_record_like(flat_result, broadcasted_params)
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+    def evaluate_curves(self, args: tuple, operation: str) -> NestedVector:
+        curve: NestedData = self.input_data(0, args)
+        value: ak.Array = self.input_data(1, args)
+
+        columns, template = broadcast_params({"curve": curve.structure, "value": value})
+
+        flat_vectors: np.ndarray = np.zeros((len(columns["curve"]), 3))
+        for row, (curve_idx, param) in enumerate(zip(columns["curve"].tolist(), columns["value"].tolist())):
+            crv: Part.Shape = curve.data[curve_idx]
+            if len(crv.Vertexes) > 0 and type(crv) == Part.Edge:
+                flat_vectors[row] = tuple(getattr(crv, operation)(param))
+
+        result: NestedVector = NestedVector.from_template(flat_vectors, template)
+
+        return result
+
+    @node_eval(0)
+    def eval_0(self, *args) -> NestedVector:
+        return self.evaluate_curves(args, "valueAt")
+
+    @node_eval(1)
+    def eval_1(self, *args) -> NestedVector:
+        return self.evaluate_curves(args, "tangentAt")
@@ -23,9 +23,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, cast
 import importlib
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
@@ -39,7 +36,7 @@ import PySide2.QtWidgets as QtWidgets
 
 from nested_data import NestedData
 from utils import record_structure, flatten_record
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from input_widgets import OptionBoxWidget
 from sockets.shape_none import ShapeNone
 from sockets.value_line import ValueLine
@@ -49,11 +46,10 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG: bool = True
-
-
 class Arc(NodeItem):
     REG_NAME: str = "Arc"
+    IS_PURE: bool = True
+    OPTIONS: list[str] = ["Degree", "3 Points"]
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -63,7 +59,7 @@ class Arc(NodeItem):
         self._option_box: OptionBoxWidget = OptionBoxWidget(undo_stack)
         self._option_box.setFocusPolicy(QtCore.Qt.NoFocus)
         self._option_box.setMinimumWidth(5)
-        self._option_box.addItems(["Degree", "3 Points"])
+        self._option_box.addItems(self.OPTIONS)
         for option_idx in range(self._option_box.count()):
             self._option_box.model().setData(self._option_box.model().index(option_idx, 0), QtCore.QSize(160, 24),
                                              QtCore.Qt.SizeHintRole)
@@ -155,81 +151,56 @@ class Arc(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        a: ak.Array = self.input_data(0, args)
-                        b: ak.Array = self.input_data(1, args)
-                        c: ak.Array = self.input_data(2, args)
-
-                        if DEBUG:
-                            x: float = time.time()
-
-                        if self._option_box.currentText() == "Degree":
-                            broadcasted_params: ak.Array = ak.zip({"rad": a, "deg_1": b, "deg_2": c})
-                            flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                            flat_data: list[Part.Shape] = []
-                            for param_tuple in flat_params:
-                                flat_data.append(Part.makeCircle(
-                                    param_tuple["0"], FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1),
-                                    param_tuple["1"],
-                                    param_tuple["2"]
-                                ))
-
-                            result: NestedData = NestedData(
-                                data=flat_data,
-                                structure=record_structure(broadcasted_params)
-                            )
-
-                        elif self._option_box.currentText() == "3 Points":
-                            flat_a, struct_a = (ak.to_list(flatten_record(a, True)), record_structure(a))
-                            flat_b, struct_b = (ak.to_list(flatten_record(b, True)), record_structure(b))
-                            flat_c, struct_c = (ak.to_list(flatten_record(c, True)), record_structure(c))
-
-                            broadcasted_struct: ak.Array = ak.zip({
-                                "a": struct_a, "b": struct_b, "c": struct_c}, right_broadcast=True
-                            )
-
-                            flat_struct: ak.Array = flatten_record(nested_record=broadcasted_struct, as_tuple=True)
-
-                            flat_data: list[Part.Shape] = []
-                            for param_tuple in flat_struct:
-                                arc_pts: Points.Points = Points.Points()
-                                arc_pts.addPoints(
-                                    [flat_a[param_tuple["0"]], flat_b[param_tuple["1"]], flat_c[param_tuple["2"]]]
-                                )
-                                flat_data.append(Part.Edge(
-                                    Part.Arc(arc_pts.Points[0], arc_pts.Points[1], arc_pts.Points[2])
-                                ))
-
-                            result: NestedData = NestedData(
-                                data=flat_data,
-                                structure=record_structure(broadcasted_struct)
-                            )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            y: float = time.time()
-                            print("Arc executed in", "{number:.{digits}f}".format(number=1000 * (y - x), digits=2),
-                                  "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        a: ak.Array = self.input_data(0, args)
+        b: ak.Array = self.input_data(1, args)
+        c: ak.Array = self.input_data(2, args)
+
+        if self._option_box.currentText() == "Degree":
+            broadcasted_params: ak.Array = ak.zip({"rad": a, "deg_1": b, "deg_2": c})
+            flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
+
+            flat_data: list[Part.Shape] = []
+            for param_tuple in flat_params:
+                flat_data.append(Part.makeCircle(
+                    param_tuple["0"], FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1),
+                    param_tuple["1"],
+                    param_tuple["2"]
+                ))
+
+            result: NestedData = NestedData(
+                data=flat_data,
+                structure=record_structure(broadcasted_params)
+            )
+
+        elif self._option_box.currentText() == "3 Points":
+            flat_a, struct_a = ([tuple(coord) for coord in a.coords.tolist()], a.structure)
+            flat_b, struct_b = ([tuple(coord) for coord in b.coords.tolist()], b.structure)
+            flat_c, struct_c = ([tuple(coord) for coord in c.coords.tolist()], c.structure)
+
+            broadcasted_struct: ak.Array = ak.zip({
+                "a": struct_a, "b": struct_b, "c": struct_c}, right_broadcast=True
+            )
+
+            flat_struct: ak.Array = flatten_record(nested_record=broadcasted_struct, as_tuple=True)
+
+            flat_data: list[Part.Shape] = []
+            for param_tuple in flat_struct:
+                arc_pts: Points.Points = Points.Points()
+                arc_pts.addPoints(
+                    [flat_a[param_tuple["0"]], flat_b[param_tuple["1"]], flat_c[param_tuple["2"]]]
+                )
+                flat_data.append(Part.Edge(
+                    Part.Arc(arc_pts.Points[0], arc_pts.Points[1], arc_pts.Points[2])
+                ))
+
+            result: NestedData = NestedData(
+                data=flat_data,
+                structure=record_structure(broadcasted_struct)
+            )
+
+        return result
 
 # --------------- Serialization ---------------
 
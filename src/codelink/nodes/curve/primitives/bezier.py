@@ -22,10 +22,7 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, cast
-import warnings
 import importlib
-import inspect
-import time
 
 import awkward as ak
 
@@ -39,7 +36,7 @@ import PySide2.QtWidgets as QtWidgets
 
 from utils import simplify_record, simplified_rec_struct
 from nested_data import NestedData
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from input_widgets import OptionBoxWidget
 from sockets.vector_none import VectorNone
 from sockets.shape_none import ShapeNone
@@ -49,11 +46,10 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class Bezier(NodeItem):
     REG_NAME: str = "Bezier"
+    IS_PURE: bool = True
+    OPTIONS: list[str] = ["Open", "Cyclic"]
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -63,7 +59,7 @@ class Bezier(NodeItem):
         self._option_box: OptionBoxWidget = OptionBoxWidget(undo_stack)
         self._option_box.setFocusPolicy(QtCore.Qt.NoFocus)
         self._option_box.setMinimumWidth(5)
-        self._option_box.addItems(["Open", "Cyclic"])
+        self._option_box.addItems(self.OPTIONS)
         item_list_view: QtWidgets.QListView = cast(QtWidgets.QListView, self._option_box.view())
         item_list_view.setSpacing(2)
         self._content_widget.hide()
@@ -99,68 +95,43 @@ class Bezier(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> NestedData:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        is_cyclic: bool = False
-                        if self._option_box.currentText() == "Cyclic":
-                            is_cyclic: bool = True
-
-                        vectors:  ak.Array = self.input_data(0, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        simple_vec, struct_vec = (simplify_record(vectors, True), simplified_rec_struct(vectors))
-
-                        flat_data: list[Part.Shape] = []
-                        if type(struct_vec) is int:
-                            ctrl_pts: Points.Points = Points.Points()
-                            ctrl_pts.addPoints(ak.to_list(simple_vec))
-                            if is_cyclic:
-                                ctrl_pts.addPoints([ctrl_pts.Points[0]])
-
-                            bezier: Part.BezierCurve = Part.BezierCurve()
-                            bezier.setPoles(ctrl_pts.Points)
-                            flat_data.append(Part.Edge(bezier))
-                        else:
-                            for ctrl_pts_list in simple_vec:
-                                ctrl_pts: Points.Points = Points.Points()
-                                ctrl_pts.addPoints(ak.to_list(ctrl_pts_list))
-                                if is_cyclic:
-                                    ctrl_pts.addPoints([ctrl_pts.Points[0]])
-
-                                bezier: Part.BezierCurve = Part.BezierCurve()
-                                bezier.setPoles(ctrl_pts.Points)
-                                flat_data.append(Part.Edge(bezier))
-
-                        result: NestedData = NestedData(
-                            data=flat_data,
-                            structure=struct_vec if type(struct_vec) == ak.Array else ak.Array([0])
-                        )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Bezier executed in", "{number:.{digits}f}".format(number=1000 * (b - a), digits=2),
-                                  "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        is_cyclic: bool = False
+        if self._option_box.currentText() == "Cyclic":
+            is_cyclic: bool = True
+
+        vectors:  ak.Array = self.input_data(0, args).to_record()
+
+        simple_vec, struct_vec = (simplify_record(vectors, True), simplified_rec_struct(vectors))
+
+        flat_data: list[Part.Shape] = []
+        if type(struct_vec) is int:
+            ctrl_pts: Points.Points = Points.Points()
+            ctrl_pts.addPoints(ak.to_list(simple_vec))
+            if is_cyclic:
+                ctrl_pts.addPoints([ctrl_pts.Points[0]])
+
+            bezier: Part.BezierCurve = Part.BezierCurve()
+            bezier.setPoles(ctrl_pts.Points)
+            flat_data.append(Part.Edge(bezier))
+        else:
+            for ctrl_pts_list in simple_vec:
+                ctrl_pts: Points.Points = Points.Points()
+                ctrl_pts.addPoints(ak.to_list(ctrl_pts_list))
+                if is_cyclic:
+                    ctrl_pts.addPoints([ctrl_pts.Points[0]])
+
+                bezier: Part.BezierCurve = Part.BezierCurve()
+                bezier.setPoles(ctrl_pts.Points)
+                flat_data.append(Part.Edge(bezier))
+
+        result: NestedData = NestedData(
+            data=flat_data,
+            structure=struct_vec if type(struct_vec) == ak.Array else ak.Array([0])
+        )
+
+        return result
 
 # --------------- Serialization ---------------
 
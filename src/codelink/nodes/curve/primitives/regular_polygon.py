@@ -22,9 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import numpy as np
 import awkward as ak
@@ -38,7 +35,7 @@ import PySide2.QtWidgets as QtWidgets
 
 from nested_data import NestedData
 from utils import record_structure, flatten_record
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from sockets.shape_none import ShapeNone
 from sockets.value_line import ValueLine
 
@@ -46,11 +43,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG: bool = True
-
-
 class RegularPolygon(NodeItem):
     REG_NAME: str = "Regular Polygon"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -66,51 +61,26 @@ class RegularPolygon(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        radius: ak.Array = self.input_data(0, args)
-                        sides: ak.Array = self.input_data(1, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        broadcasted_params: ak.Array = ak.zip({"radius": radius, "sides": sides})
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                        flat_data: list[Part.Shape] = []
-                        for param_tuple in flat_params:
-                            phi: np.ndarray = np.arange(0, 2 * np.pi, 2 * np.pi / int(param_tuple["1"]))
-                            vectors = ak.zip([param_tuple["0"] * np.cos(phi), param_tuple["0"] * np.sin(phi), 0])
-
-                            ctrl_pts: Points.Points = Points.Points()
-                            ctrl_pts.addPoints(ak.to_list(vectors))
-                            flat_data.append(Part.makePolygon(ctrl_pts.Points, True))
-
-                        result: NestedData = NestedData(
-                            data=flat_data,
-                            structure=record_structure(broadcasted_params)
-                        )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Regular Polygon executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                              digits=2), "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        radius: ak.Array = self.input_data(0, args)
+        sides: ak.Array = self.input_data(1, args)
+
+        broadcasted_params: ak.Array = ak.zip({"radius": radius, "sides": sides})
+        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
+
+        flat_data: list[Part.Shape] = []
+        for param_tuple in flat_params:
+            phi: np.ndarray = np.arange(0, 2 * np.pi, 2 * np.pi / int(param_tuple["1"]))
+            vectors = ak.zip([param_tuple["0"] * np.cos(phi), param_tuple["0"] * np.sin(phi), 0])
+
+            ctrl_pts: Points.Points = Points.Points()
+            ctrl_pts.addPoints(ak.to_list(vectors))
+            flat_data.append(Part.makePolygon(ctrl_pts.Points, True))
+
+        result: NestedData = NestedData(
+            data=flat_data,
+            structure=record_structure(broadcasted_params)
+        )
+
+        return result
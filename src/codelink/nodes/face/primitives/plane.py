@@ -22,9 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
@@ -36,18 +33,16 @@ import PySide2.QtWidgets as QtWidgets
 
 from nested_data import NestedData
 from utils import flatten_record, record_structure
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from sockets.value_line import ValueLine
 from sockets.shape_none import ShapeNone
 
 if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
-DEBUG = True
-
-
 class Plane(NodeItem):
     REG_NAME: str = "Plane"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -63,46 +58,21 @@ class Plane(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> list:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        length: ak.Array = self.input_data(0, args)
-                        width: ak.Array = self.input_data(1, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        broadcasted_params: ak.Array = ak.zip({"length": length, "width": width})
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                        flat_data: list[Part.Shape] = []
-                        for param_tuple in flat_params:
-                            flat_data.append(Part.makePlane(param_tuple["0"], param_tuple["1"]))
-
-                        result: NestedData = NestedData(
-                            data=flat_data,
-                            structure=record_structure(broadcasted_params)
-                        )
+        length: ak.Array = self.input_data(0, args)
+        width: ak.Array = self.input_data(1, args)
 
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
+        broadcasted_params: ak.Array = ak.zip({"length": length, "width": width})
+        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
 
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Plane executed in", "{number:.{digits}f}".format(number=1000 * (b - a), digits=2),
-                                  "ms")
+        flat_data: list[Part.Shape] = []
+        for param_tuple in flat_params:
+            flat_data.append(Part.makePlane(param_tuple["0"], param_tuple["1"]))
 
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
+        result: NestedData = NestedData(
+            data=flat_data,
+            structure=record_structure(broadcasted_params)
+        )
 
-        return self._cache[cache_idx]
+        return result
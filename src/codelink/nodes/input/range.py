@@ -22,28 +22,23 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import numpy as np
 import awkward as ak
 
 import PySide2.QtWidgets as QtWidgets
 
-from utils import flatten_record, unflatten_array_like
-from node_item import NodeItem
+from utils import broadcast_params, unflatten_like
+from node_item import NodeItem, node_eval
 from sockets.value_line import ValueLine
 
 if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG: bool = True
-
-
 class Range(NodeItem):
     REG_NAME: str = "Range"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -61,49 +56,22 @@ class Range(NodeItem):
     # --------------- Node eval methods ---------------
 
     @staticmethod
-    def make_range(parameter_zip: ak.Array) -> np.ndarray:
-        return np.arange(parameter_zip["0"], parameter_zip["1"], parameter_zip["2"])
-
-    def eval_socket_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        start: ak.Array = self.input_data(0, args)
-                        stop: ak.Array = self.input_data(1, args)
-                        step: ak.Array = self.input_data(2, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        broadcasted_params: ak.Array = ak.zip(
-                            {"start": start, "stop": stop, "step": step}, right_broadcast=True
-                        )
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                        result: list[np.ndarray] = []
-                        for param_tuple in flat_params:
-                            result.append(self.make_range(param_tuple))
-
-                        result: ak.Array = unflatten_array_like(result, broadcasted_params)
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0,  ak.flatten(result, axis=-1))
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Range executed in", "{number:.{digits}f}".format(number=1000 * (b - a), digits=2),
-                                  "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+    def make_ranges(start: np.ndarray, stop: np.ndarray, step: np.ndarray) -> ak.Array:
+        # Element wise np.arange(start, stop, step) for all parameter rows at once
+        counts: np.ndarray = np.maximum(np.ceil((stop - start) / step), 0).astype(np.int64)
+        offsets: np.ndarray = np.repeat(np.cumsum(counts) - counts, counts)
+        element_idx: np.ndarray = np.arange(np.sum(counts)) - offsets
+        flat_values: np.ndarray = np.repeat(start, counts) + np.repeat(step, counts) * element_idx
+        return ak.unflatten(flat_values, counts)
+
+    @node_eval(0)
+    def eval_0(self, *args) -> ak.Array:
+        start: ak.Array = self.input_data(0, args)
+        stop: ak.Array = self.input_data(1, args)
+        step: ak.Array = self.input_data(2, args)
+
+        columns, template = broadcast_params({"start": start, "stop": stop, "step": step}, right_broadcast=True)
+        ranges: ak.Array = self.make_ranges(columns["start"], columns["stop"], columns["step"])
+        result: ak.Array = unflatten_like(ranges, template)
+
+        return ak.flatten(result, axis=-1)
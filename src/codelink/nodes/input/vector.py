@@ -22,15 +22,15 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
+import numpy as np
 import awkward as ak
 
 import PySide2.QtWidgets as QtWidgets
 
-from node_item import NodeItem
+from nested_data import NestedVector
+from utils import broadcast_params
+from node_item import NodeItem, node_eval
 from sockets.value_line import ValueLine
 from sockets.vector_none import VectorNone
 
@@ -38,11 +38,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class Vector(NodeItem):
     REG_NAME: str = "Vector"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name=REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -59,37 +57,15 @@ class Vector(NodeItem):
 
     # --------------- Node eval methods ---------------
 
-    def eval_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        x: ak.Array = self.input_data(0, args)
-                        y: ak.Array = self.input_data(1, args)
-                        z: ak.Array = self.input_data(2, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        result: ak.Array = ak.zip({"x": x, "y": y, "z": z})
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Vector executed in", "{number:.{digits}f}".format(number=1000 * (b - a), digits=2),
-                                  "ms")
+    @node_eval(0)
+    def eval_0(self, *args) -> NestedVector:
+        x: ak.Array = self.input_data(0, args)
+        y: ak.Array = self.input_data(1, args)
+        z: ak.Array = self.input_data(2, args)
 
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
+        columns, template = broadcast_params({"x": x, "y": y, "z": z})
+        result: NestedVector = NestedVector.from_template(
+            np.column_stack([columns["x"], columns["y"], columns["z"]]), template
+        )
 
-        return self._cache[cache_idx]
+        return result
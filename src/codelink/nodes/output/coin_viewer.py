@@ -22,9 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import FreeCADGui as Gui
 # noinspection PyPackageRequirements
@@ -33,17 +30,15 @@ from pivy import coin
 import PySide2.QtWidgets as QtWidgets
 
 from nested_data import NestedData
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from sockets.coin_none import CoinNone
 
 if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
-DEBUG = True
-
-
 class CoinViewer(NodeItem):
     REG_NAME: str = "Coin Viewer"
+    IS_HEADLESS: bool = False
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -61,54 +56,29 @@ class CoinViewer(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> NestedData:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        nested_data: NestedData = self.input_data(0, args)
-
-                        if DEBUG:
-                            a: float = time.time()
+        nested_data: NestedData = self.input_data(0, args)
 
-                        if hasattr(Gui, "ActiveDocument"):
-                            flat_coin_seps: list[coin.SoSeparator] = nested_data.data
-                            sg = Gui.ActiveDocument.ActiveView.getSceneGraph()
-
-                            if self._coin_sep is not None:
-                                sg.removeChild(self._coin_sep)
-                                # self._coin_sep: Optional[coin.SoSeparator] = None
-
-                            self._coin_sep: coin.SoSeparator = coin.SoSeparator()
-                            for child in flat_coin_seps:
-                                self._coin_sep.addChild(child)
-
-                            sg.addChild(self._coin_sep)
-                        else:
-                            self.on_remove()
+        if hasattr(Gui, "ActiveDocument"):
+            flat_coin_seps: list[coin.SoSeparator] = nested_data.data
+            sg = Gui.ActiveDocument.ActiveView.getSceneGraph()
 
-                        result: NestedData = nested_data
+            if self._coin_sep is not None:
+                sg.removeChild(self._coin_sep)
+                # self._coin_sep: Optional[coin.SoSeparator] = None
 
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
+            self._coin_sep: coin.SoSeparator = coin.SoSeparator()
+            for child in flat_coin_seps:
+                self._coin_sep.addChild(child)
 
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Coin Viewer executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                          digits=2), "ms")
+            sg.addChild(self._coin_sep)
+        else:
+            self.on_remove()
 
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
+        result: NestedData = nested_data
 
-        return self._cache[cache_idx]
+        return result
 
     def on_remove(self):
         if hasattr(Gui, "ActiveDocument") and self._coin_sep is not None:
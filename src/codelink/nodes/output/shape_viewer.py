@@ -22,9 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 # noinspection PyUnresolvedReferences
 import FreeCAD as App
@@ -34,18 +31,23 @@ import Part
 import PySide2.QtWidgets as QtWidgets
 
 from nested_data import NestedData
-from node_item import NodeItem
+from node_item import NodeItem, node_eval, QUALITY_PREVIEW, QUALITY_FULL
 from sockets.shape_none import ShapeNone
 
 if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
+# Tessellation of the displayed compound, coarse while previewing
+DEVIATION: float = 0.5
+ANGULAR_DEFLECTION: float = 28.5
+PREVIEW_DEVIATION: float = 5.
+PREVIEW_ANGULAR_DEFLECTION: float = 60.
 
 
 class ShapeViewer(NodeItem):
     REG_NAME: str = "Shape Viewer"
+    IS_HEADLESS: bool = False
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -71,57 +73,39 @@ class ShapeViewer(NodeItem):
 
     # --------------- Node eval methods ---------------
 
-    def eval_0(self, *args) -> NestedData:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        nested_data: NestedData = self.input_data(0, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        if hasattr(Gui, "ActiveDocument"):
-                            flat_shapes: list[Part.Shape] = nested_data.data
-
-                            if len(flat_shapes) > 0 and len(flat_shapes[0].Vertexes) > 0:
-                                if self._compound_name == "":
-                                    compound_obj = App.ActiveDocument.addObject("Part::Feature", "CViewer")
-                                    self._compound_name: str = compound_obj.Name
-                                else:
-                                    if App.ActiveDocument.getObject(self._compound_name) is not None:
-                                        compound_obj = App.ActiveDocument.getObject(self._compound_name)
-                                    else:
-                                        compound_obj = App.ActiveDocument.addObject("Part::Feature", "CViewer")
-
-                                compound_obj.Shape = Part.makeCompound(flat_shapes)
-                                compound_obj.setPropertyStatus("Shape", ["Transient", "Output"])
-                                App.activeDocument().recompute()
-                            else:
-                                self.on_remove()
-
-                        result: NestedData = nested_data
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Shape Viewer executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                           digits=2), "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+    @node_eval(0)
+    def eval_0(self, *args, quality: int = QUALITY_FULL) -> NestedData:
+        nested_data: NestedData = self.input_data(0, args)
+
+        if hasattr(Gui, "ActiveDocument"):
+            flat_shapes: list[Part.Shape] = nested_data.data
+
+            if len(flat_shapes) > 0 and len(flat_shapes[0].Vertexes) > 0:
+                if self._compound_name == "":
+                    compound_obj = App.ActiveDocument.addObject("Part::Feature", "CViewer")
+                    self._compound_name: str = compound_obj.Name
+                else:
+                    if App.ActiveDocument.getObject(self._compound_name) is not None:
+                        compound_obj = App.ActiveDocument.getObject(self._compound_name)
+                    else:
+                        compound_obj = App.ActiveDocument.addObject("Part::Feature", "CViewer")
+
+                if quality == QUALITY_PREVIEW:
+                    compound_obj.ViewObject.Deviation = PREVIEW_DEVIATION
+                    compound_obj.ViewObject.AngularDeflection = PREVIEW_ANGULAR_DEFLECTION
+                else:
+                    compound_obj.ViewObject.Deviation = DEVIATION
+                    compound_obj.ViewObject.AngularDeflection = ANGULAR_DEFLECTION
+
+                compound_obj.Shape = Part.makeCompound(flat_shapes)
+                compound_obj.setPropertyStatus("Shape", ["Transient", "Output"])
+                App.activeDocument().recompute()
+            else:
+                self.on_remove()
+
+        result: NestedData = nested_data
+
+        return result
 
     def on_remove(self):
         if hasattr(Gui, "ActiveDocument") and self._compound_name != "":
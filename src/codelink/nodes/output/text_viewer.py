@@ -22,25 +22,19 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, Any
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
 import PySide2.QtWidgets as QtWidgets
 
-from nested_data import NestedData
-from node_item import NodeItem
+from nested_data import NestedData, NestedVector
+from node_item import NodeItem, node_eval
 from sockets.any_none import AnyNone
 
 if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class TextViewer(NodeItem):
     REG_NAME: str = "Text Viewer"
 
@@ -58,42 +52,19 @@ class TextViewer(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> list:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        if DEBUG:
-                            a: float = time.time()
-
-                        result: Any = self.input_data(0, args)
-                        if isinstance(result, ak.Array):
-                            result.show(200, 100)
-                        elif isinstance(result, NestedData):
-                            print("Nested data:", result)
-                        else:
-                            print(
-                                "Domain size: " + str(len(self.input_data(0, args))) + "->",
-                                [str(input_item) for input_item in self.input_data(0, args)]
-                            )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Text Viewer executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                          digits=2), "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        result: Any = self.input_data(0, args)
+        if isinstance(result, ak.Array):
+            result.show(200, 100)
+        elif isinstance(result, NestedVector):
+            result.to_record().show(200, 100)
+        elif isinstance(result, NestedData):
+            print("Nested data:", result)
+        else:
+            print(
+                "Domain size: " + str(len(self.input_data(0, args))) + "->",
+                [str(input_item) for input_item in self.input_data(0, args)]
+            )
+
+        return result
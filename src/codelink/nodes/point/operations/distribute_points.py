@@ -23,9 +23,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, cast
 import importlib
-import warnings
-import inspect
-import time
 
 import numpy as np
 import awkward as ak
@@ -37,9 +34,9 @@ import Part
 import PySide2.QtCore as QtCore
 import PySide2.QtWidgets as QtWidgets
 
-from nested_data import NestedData
-from utils import flatten_record, unflatten_array_like
-from node_item import NodeItem
+from nested_data import NestedData, NestedVector
+from utils import broadcast_params, nesting_offsets
+from node_item import NodeItem, node_eval, QUALITY_PREVIEW, QUALITY_FULL
 from input_widgets import OptionBoxWidget
 from sockets.shape_none import ShapeNone
 from sockets.value_line import ValueLine
@@ -49,13 +46,16 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG: bool = True
 BATCH_SIZE: int = 100
 MAX_ITERATIONS: int = 100
+PREVIEW_MAX_COUNT: int = 25
 
 
 class DistributePoints(NodeItem):
     REG_NAME: str = "Distribute Points"
+    IS_PURE: bool = True
+    IS_PARALLEL: bool = True
+    OPTIONS: list[str] = ["Face", "Solid"]
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -65,7 +65,7 @@ class DistributePoints(NodeItem):
         self._option_box: OptionBoxWidget = OptionBoxWidget(undo_stack)
         self._option_box.setFocusPolicy(QtCore.Qt.NoFocus)
         self._option_box.setMinimumWidth(5)
-        self._option_box.addItems(["Face", "Solid"])
+        self._option_box.addItems(self.OPTIONS)
         for option_idx in range(self._option_box.count()):
             self._option_box.model().setData(self._option_box.model().index(option_idx, 0), QtCore.QSize(160, 24),
                                              QtCore.Qt.SizeHintRole)
@@ -121,10 +121,12 @@ class DistributePoints(NodeItem):
 
         return ok
 
-    def populate_positions_solid(self, parameter_zip: tuple[Part.Shape, float, float]) -> ak.Array:
+    @staticmethod
+    def populate_positions_solid(parameter_zip: tuple[Part.Shape, float, float, list[int]]) -> np.ndarray:
         target: Part.Shape = parameter_zip[0]
         count: int = int(parameter_zip[1])
         distance: float = parameter_zip[2]
+        rng: np.random.Generator = np.random.default_rng(parameter_zip[3])
 
         if len(target.Solids) > 0 and len(target.Vertexes) > 0:
             target: Part.Solid = Part.Solid(target.Solids[0])
@@ -139,20 +141,18 @@ class DistributePoints(NodeItem):
 
             while done < count:
                 iterations += 1
-
-                if DEBUG:
-                    print("Iteration no.:", iterations)
-
                 if iterations > MAX_ITERATIONS:
                     raise ValueError("Maximum number of iterations reached.", MAX_ITERATIONS)
 
                 left: int = count - done
                 batch_size: int = min(BATCH_SIZE, left)
 
-                batch_x: np.ndarray = np.random.uniform(low=x_min, high=x_max, size=batch_size)
-                batch_y: np.ndarray = np.random.uniform(low=y_min, high=y_max, size=batch_size)
-                batch_z: np.ndarray = np.random.uniform(low=z_min, high=z_max, size=batch_size)
-                batch_list: list[tuple[float, float, float]] = ak.to_list(ak.zip([batch_x, batch_y, batch_z]))
+                batch_x: np.ndarray = rng.uniform(low=x_min, high=x_max, size=batch_size)
+                batch_y: np.ndarray = rng.uniform(low=y_min, high=y_max, size=batch_size)
+                batch_z: np.ndarray = rng.uniform(low=z_min, high=z_max, size=batch_size)
+                batch_list: list[tuple[float, float, float]] = list(
+                    zip(batch_x.tolist(), batch_y.tolist(), batch_z.tolist())
+                )
 
                 candidates: list[tuple[float, float, float]] = [
                     coordinate for coordinate in batch_list if target.isInside(FreeCAD.Vector(coordinate), 0.1, True)
@@ -164,22 +164,24 @@ class DistributePoints(NodeItem):
                     else:
                         good_positions: list[tuple[float, float, float]] = []
                         for candidate in candidates:
-                            if self.check_min_radius(candidate, generated_positions + good_positions, distance):
+                            if DistributePoints.check_min_radius(
+                                    candidate, generated_positions + good_positions, distance
+                            ):
                                 good_positions.append(candidate)
 
                     generated_positions.extend(good_positions)
                     done += len(good_positions)
 
-            return ak.zip({"x": np.array(generated_positions)[:, 0],
-                           "y": np.array(generated_positions)[:, 1],
-                           "z": np.array(generated_positions)[:, 2]})
+            return np.array(generated_positions, dtype=np.float64)
         else:
-            return ak.Array([{"x": 0, "y": 0, "z": 0}])
+            return np.zeros((1, 3))
 
-    def populate_positions_face(self, parameter_zip: tuple[Part.Shape, float, float]) -> ak.Array:
+    @staticmethod
+    def populate_positions_face(parameter_zip: tuple[Part.Shape, float, float, list[int]]) -> np.ndarray:
         target: Part.Shape = parameter_zip[0]
         count: int = int(parameter_zip[1])
         distance: float = parameter_zip[2]
+        rng: np.random.Generator = np.random.default_rng(parameter_zip[3])
 
         if len(target.Faces) > 0 and len(target.Vertexes) > 0:
             target: Part.Face = Part.Face(target.Faces[0])
@@ -193,19 +195,15 @@ class DistributePoints(NodeItem):
 
             while done < count:
                 iterations += 1
-
-                if DEBUG:
-                    print("Iteration no.:", iterations)
-
                 if iterations > MAX_ITERATIONS:
                     raise ValueError("Maximum number of iterations reached.", MAX_ITERATIONS)
 
                 left: int = count - done
                 batch_size: int = min(BATCH_SIZE, left)
 
-                batch_u: np.ndarray = np.random.uniform(low=u_range[0], high=u_range[1], size=batch_size)
-                batch_v: np.ndarray = np.random.uniform(low=v_range[0], high=v_range[1], size=batch_size)
-                batch_list: list[tuple[float, float]] = ak.to_list(ak.zip([batch_u, batch_v]))
+                batch_u: np.ndarray = rng.uniform(low=u_range[0], high=u_range[1], size=batch_size)
+                batch_v: np.ndarray = rng.uniform(low=v_range[0], high=v_range[1], size=batch_size)
+                batch_list: list[tuple[float, float]] = list(zip(batch_u.tolist(), batch_v.tolist()))
 
                 candidates: list[tuple[float, float, float]] = [
                     target.valueAt(uv[0], uv[1]) for uv in batch_list if
@@ -218,73 +216,56 @@ class DistributePoints(NodeItem):
                     else:
                         good_positions: list[tuple[float, float, float]] = []
                         for candidate in candidates:
-                            if self.check_min_radius(candidate, generated_positions + good_positions, distance):
+                            if DistributePoints.check_min_radius(
+                                    candidate, generated_positions + good_positions, distance
+                            ):
                                 good_positions.append(candidate)
 
                     generated_positions.extend(good_positions)
                     done += len(good_positions)
 
-            return ak.zip({"x": np.array(generated_positions)[:, 0],
-                           "y": np.array(generated_positions)[:, 1],
-                           "z": np.array(generated_positions)[:, 2]})
+            return np.array(generated_positions, dtype=np.float64)
         else:
-            return ak.Array([{"x": 0, "y": 0, "z": 0}])
+            return np.zeros((1, 3))
 
     # --------------- Node eval methods ---------------
 
-    def eval_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        shape: NestedData = self.input_data(0, args)
-                        count: ak.Array = self.input_data(1, args)
-                        distance: ak.Array = self.input_data(2, args)
-                        seed: ak.Array = self.input_data(3, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        np.random.seed(int(ak.flatten(seed, axis=None)[0]))
-
-                        broadcasted_params: ak.Array = ak.zip(
-                            {"shape": shape.structure, "count": count, "distance": distance}
-                        )
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                        result: list[ak.Array] = []
-                        for param_tuple in flat_params:
-                            if self._option_box.currentText() == "Face":
-                                result.append(self.populate_positions_face(
-                                    (shape.data[param_tuple["0"]], param_tuple["1"], param_tuple["2"])
-                                ))
-                            elif self._option_box.currentText() == "Solid":
-                                result.append(self.populate_positions_solid(
-                                    (shape.data[param_tuple["0"]], param_tuple["1"], param_tuple["2"])
-                                ))
-
-                        result: ak.Array = unflatten_array_like(result, broadcasted_params)
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0,  ak.flatten(result, axis=-1))
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Point dist executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                         digits=2), "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+    @node_eval(0)
+    def eval_0(self, *args, quality: int = QUALITY_FULL) -> NestedVector:
+        shape: NestedData = self.input_data(0, args)
+        count: ak.Array = self.input_data(1, args)
+        distance: ak.Array = self.input_data(2, args)
+        seed: ak.Array = self.input_data(3, args)
+
+        columns, template = broadcast_params({"shape": shape.structure, "count": count, "distance": distance})
+        if quality == QUALITY_PREVIEW:
+            columns["count"] = np.minimum(columns["count"], PREVIEW_MAX_COUNT)
+
+        # Every element draws from its own seeded generator, so results do not depend on the execution order
+        seed_value: int = int(ak.flatten(seed, axis=None)[0])
+        params: list[tuple[Part.Shape, float, float, list[int]]] = [
+            (shape.data[shape_idx], count_value, distance_value, [seed_value, element_idx])
+            for element_idx, (shape_idx, count_value, distance_value) in enumerate(zip(
+                columns["shape"].tolist(), columns["count"].tolist(), columns["distance"].tolist()
+            ))
+        ]
+
+        if self._option_box.currentText() == "Face":
+            positions: list[np.ndarray] = self.map_elements(self.populate_positions_face, params)
+        else:
+            positions: list[np.ndarray] = self.map_elements(self.populate_positions_solid, params)
+
+        # The positions of each element replace it in its innermost list
+        position_counts: list[int] = [len(item) for item in positions]
+        position_offsets: np.ndarray = np.concatenate([[0], np.cumsum(position_counts, dtype=np.int64)])
+        offsets: list[np.ndarray] = nesting_offsets(template)
+        if len(offsets) > 0:
+            offsets[-1] = position_offsets[offsets[-1]]
+
+        flat_positions: np.ndarray = np.concatenate(positions) if len(positions) > 0 else np.zeros((0, 3))
+        result: NestedVector = NestedVector(flat_positions, offsets)
+
+        return result
 
 # --------------- Serialization ---------------
 
@@ -22,11 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
-
-import awkward as ak
 
 # noinspection PyUnresolvedReferences
 import FreeCAD
@@ -35,9 +30,8 @@ import Points  # noqa
 
 import PySide2.QtWidgets as QtWidgets
 
-from nested_data import NestedData
-from utils import flatten_record, record_structure
-from node_item import NodeItem
+from nested_data import NestedData, NestedVector
+from node_item import NodeItem, node_eval
 from sockets.vector_none import VectorNone
 from sockets.shape_none import ShapeNone
 
@@ -45,11 +39,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class Point(NodeItem):
     REG_NAME: str = "Point"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -65,46 +57,20 @@ class Point(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> list:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        pos: ak.Array = self.input_data(0, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        flat_pos: ak.Array = flatten_record(nested_record=pos, as_tuple=True)
-                        flat_pts: Points.Points = Points.Points()
-                        flat_pts.addPoints(ak.to_list(flat_pos))
-
-                        flat_data: list[Part.Shape] = []
-                        for pts in flat_pts.Points:
-                            flat_data.append(Part.Point(pts).toShape())
-
-                        result: NestedData = NestedData(
-                            data=flat_data,
-                            structure=record_structure(pos)
-                        )
+        pos: NestedVector = self.input_data(0, args)
 
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
+        flat_pts: Points.Points = Points.Points()
+        flat_pts.addPoints([tuple(coord) for coord in pos.coords.tolist()])
 
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Point executed in", "{number:.{digits}f}".format(number=1000 * (b - a), digits=2),
-                                  "ms")
+        flat_data: list[Part.Shape] = []
+        for pts in flat_pts.Points:
+            flat_data.append(Part.Point(pts).toShape())
 
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
+        result: NestedData = NestedData(
+            data=flat_data,
+            structure=pos.structure
+        )
 
-        return self._cache[cache_idx]
+        return result
@@ -22,15 +22,12 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
 import PySide2.QtWidgets as QtWidgets
 
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from sockets.value_line import ValueLine
 from sockets.e6_axis_none import E6AxisNone
 
@@ -38,9 +35,6 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class E6Axis(NodeItem):
     REG_NAME: str = "E6Axis"
 
@@ -62,40 +56,15 @@ class E6Axis(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        a1: ak.Array = self.input_data(0, args)
-                        a2: ak.Array = self.input_data(1, args)
-                        a3: ak.Array = self.input_data(2, args)
-                        a4: ak.Array = self.input_data(3, args)
-                        a5: ak.Array = self.input_data(4, args)
-                        a6: ak.Array = self.input_data(5, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        result: ak.Array = ak.zip({"a1": a1, "a2": a2, "a3": a3, "a4": a4, "a5": a5, "a6": a6})
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("E6Axis executed in", "{number:.{digits}f}".format(number=1000 * (b - a), digits=2),
-                                  "ms")
+        a1: ak.Array = self.input_data(0, args)
+        a2: ak.Array = self.input_data(1, args)
+        a3: ak.Array = self.input_data(2, args)
+        a4: ak.Array = self.input_data(3, args)
+        a5: ak.Array = self.input_data(4, args)
+        a6: ak.Array = self.input_data(5, args)
 
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
+        result: ak.Array = ak.zip({"a1": a1, "a2": a2, "a3": a3, "a4": a4, "a5": a5, "a6": a6})
 
-        return self._cache[cache_idx]
+        return result
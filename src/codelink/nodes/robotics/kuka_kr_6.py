@@ -23,9 +23,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 from pathlib import Path
-import warnings
-import inspect
-import time
 import os
 
 import awkward as ak
@@ -44,7 +41,7 @@ import PySide2.QtWidgets as QtWidgets
 
 from utils import populate_coin_scene, flatten_record
 from nested_data import NestedData
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from sockets.vector_none import VectorNone
 from sockets.value_line import ValueLine
 from sockets.coin_none import CoinNone
@@ -54,11 +51,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class KukaKr6(NodeItem):
     REG_NAME: str = "KUKA KR 6"
+    IS_HEADLESS: bool = False
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -129,68 +124,43 @@ class KukaKr6(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        origin:  ak.Array = self.input_data(0, args)
-                        rotation: ak.Array = self.input_data(1, args)
-                        target:  ak.Array = self.input_data(2, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        flat_orig: np.ndarray = ak.to_numpy(ak.to_list(flatten_record(origin, True)[0]))
-                        flat_rotation: np.ndarray = np.radians(ak.flatten(rotation, axis=None)[0])
-                        flat_target: np.ndarray = ak.to_numpy(ak.to_list(flatten_record(target, True)[0]))
-
-                        forward_rotation: Rotation = Rotation.from_quat(
-                            [0, 0, np.sin(-flat_rotation / 2), np.cos(-flat_rotation / 2)]
-                        )
-
-                        flat_target: np.ndarray = (forward_rotation.apply(flat_target - flat_orig)
-                                                   if np.any(flat_target > 0)
-                                                   else np.array([930, 0, 1205]))
-
-                        axis_radians: list = self._kuka_kr_6_chain.inverse_kinematics(
-                            target_position=flat_target,
-                            target_orientation=np.degrees([1, 0, 0]),
-                            orientation_mode="Z"
-                        )[1:]
-
-                        self._rotation.angle = flat_rotation
-                        self._trans.translation.setValue(ak.to_list(flatten_record(origin, True)[0]))
-
-                        self._a1_rot.angle = axis_radians[0]
-                        self._a2_rot.angle = axis_radians[1]
-                        self._a3_rot.angle = axis_radians[2]
-                        self._a4_rot.angle = axis_radians[3]
-                        self._a5_rot.angle = axis_radians[4]
-                        self._a6_rot.angle = axis_radians[5]
-
-                        result: NestedData = NestedData(
-                            data=[self._coin_sep],
-                            structure=ak.Array([0])
-                        )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("KUKA executed in", "{number:.{digits}f}".format(number=1000 * (b - a), digits=2),
-                                  "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        origin:  ak.Array = self.input_data(0, args).to_record()
+        rotation: ak.Array = self.input_data(1, args)
+        target:  ak.Array = self.input_data(2, args).to_record()
+
+        flat_orig: np.ndarray = ak.to_numpy(ak.to_list(flatten_record(origin, True)[0]))
+        flat_rotation: np.ndarray = np.radians(ak.flatten(rotation, axis=None)[0])
+        flat_target: np.ndarray = ak.to_numpy(ak.to_list(flatten_record(target, True)[0]))
+
+        forward_rotation: Rotation = Rotation.from_quat(
+            [0, 0, np.sin(-flat_rotation / 2), np.cos(-flat_rotation / 2)]
+        )
+
+        flat_target: np.ndarray = (forward_rotation.apply(flat_target - flat_orig)
+                                   if np.any(flat_target > 0)
+                                   else np.array([930, 0, 1205]))
+
+        axis_radians: list = self._kuka_kr_6_chain.inverse_kinematics(
+            target_position=flat_target,
+            target_orientation=np.degrees([1, 0, 0]),
+            orientation_mode="Z"
+        )[1:]
+
+        self._rotation.angle = flat_rotation
+        self._trans.translation.setValue(ak.to_list(flatten_record(origin, True)[0]))
+
+        self._a1_rot.angle = axis_radians[0]
+        self._a2_rot.angle = axis_radians[1]
+        self._a3_rot.angle = axis_radians[2]
+        self._a4_rot.angle = axis_radians[3]
+        self._a5_rot.angle = axis_radians[4]
+        self._a6_rot.angle = axis_radians[5]
+
+        result: NestedData = NestedData(
+            data=[self._coin_sep],
+            structure=ak.Array([0])
+        )
+
+        return result
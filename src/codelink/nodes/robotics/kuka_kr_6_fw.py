@@ -23,9 +23,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 from pathlib import Path
-import warnings
-import inspect
-import time
 import os
 
 import awkward as ak
@@ -39,7 +36,7 @@ import PySide2.QtWidgets as QtWidgets
 
 from utils import populate_coin_scene, flatten_record
 from nested_data import NestedData
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from sockets.vector_none import VectorNone
 from sockets.value_line import ValueLine
 from sockets.e6_axis_none import E6AxisNone
@@ -50,11 +47,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class KukaKr6Fw(NodeItem):
     REG_NAME: str = "KUKA KR 6 (Fw)"
+    IS_HEADLESS: bool = False
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -108,61 +103,36 @@ class KukaKr6Fw(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        origin:  ak.Array = self.input_data(0, args)
-                        rotation: ak.Array = self.input_data(1, args)
-                        e6_axis:  ak.Array = self.input_data(2, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        flat_orig: np.ndarray = ak.to_numpy(ak.to_list(flatten_record(origin, True)[0]))
-                        flat_rotation: np.ndarray = np.radians(ak.flatten(rotation, axis=None)[0])
-                        flat_axis: ak.Array = flatten_record(e6_axis, False)[0]
-
-                        self._rotation.angle = flat_rotation
-                        self._trans.translation.setValue(flat_orig)
-                        self._a1_rot.angle = np.radians(flat_axis.a1)
-                        self._a2_rot.angle = np.radians(flat_axis.a2)
-                        self._a3_rot.angle = np.radians(flat_axis.a3)
-                        self._a4_rot.angle = np.radians(flat_axis.a4)
-                        self._a5_rot.angle = np.radians(flat_axis.a5)
-                        self._a6_rot.angle = np.radians(flat_axis.a6)
-
-                        if hasattr(Gui, "ActiveDocument"):
-                            sg = Gui.ActiveDocument.ActiveView.getSceneGraph()
-                            if self._coin_sep not in sg.getChildren():
-                                sg.addChild(self._coin_sep)
-
-                        result: NestedData = NestedData(
-                            data=[self._coin_sep],
-                            structure=ak.Array([0])
-                        )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("KUKA (Fw) executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                        digits=2), "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        origin:  ak.Array = self.input_data(0, args).to_record()
+        rotation: ak.Array = self.input_data(1, args)
+        e6_axis:  ak.Array = self.input_data(2, args)
+
+        flat_orig: np.ndarray = ak.to_numpy(ak.to_list(flatten_record(origin, True)[0]))
+        flat_rotation: np.ndarray = np.radians(ak.flatten(rotation, axis=None)[0])
+        flat_axis: ak.Array = flatten_record(e6_axis, False)[0]
+
+        self._rotation.angle = flat_rotation
+        self._trans.translation.setValue(flat_orig)
+        self._a1_rot.angle = np.radians(flat_axis.a1)
+        self._a2_rot.angle = np.radians(flat_axis.a2)
+        self._a3_rot.angle = np.radians(flat_axis.a3)
+        self._a4_rot.angle = np.radians(flat_axis.a4)
+        self._a5_rot.angle = np.radians(flat_axis.a5)
+        self._a6_rot.angle = np.radians(flat_axis.a6)
+
+        if hasattr(Gui, "ActiveDocument"):
+            sg = Gui.ActiveDocument.ActiveView.getSceneGraph()
+            if self._coin_sep not in sg.getChildren():
+                sg.addChild(self._coin_sep)
+
+        result: NestedData = NestedData(
+            data=[self._coin_sep],
+            structure=ak.Array([0])
+        )
+
+        return result
 
     def on_remove(self):
         if hasattr(Gui, "ActiveDocument") and self._coin_sep is not None:
@@ -23,9 +23,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, cast
 import importlib
-import warnings
-import inspect
-import time
 
 import awkward as ak
 import numpy as np
@@ -38,10 +35,9 @@ import Points  # noqa
 import PySide2.QtCore as QtCore
 import PySide2.QtWidgets as QtWidgets
 
-from utils import simplified_array_structure, simplify_array
 from nested_data import NestedData
-from utils import record_structure, flatten_record
-from node_item import NodeItem
+from utils import simplified_array_structure, simplify_array, broadcast_params
+from node_item import NodeItem, node_eval, QUALITY_PREVIEW, QUALITY_FULL
 from input_widgets import OptionBoxWidget
 from sockets.shape_none import ShapeNone
 
@@ -49,11 +45,11 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class Boolean(NodeItem):
     REG_NAME: str = "Boolean"
+    IS_PURE: bool = True
+    IS_PARALLEL: bool = True
+    OPTIONS: list[str] = ["Union", "Subtraction", "Intersection", "Section", "Mass Union"]
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -63,7 +59,7 @@ class Boolean(NodeItem):
         self._option_box: OptionBoxWidget = OptionBoxWidget(undo_stack)
         self._option_box.setFocusPolicy(QtCore.Qt.NoFocus)
         self._option_box.setMinimumWidth(5)
-        self._option_box.addItems(["Union", "Subtraction", "Intersection", "Section", "Mass Union"])
+        self._option_box.addItems(self.OPTIONS)
         for option_idx in range(self._option_box.count()):
             self._option_box.model().setData(self._option_box.model().index(option_idx, 0), QtCore.QSize(160, 24),
                                              QtCore.Qt.SizeHintRole)
@@ -128,93 +124,80 @@ class Boolean(NodeItem):
 
     # --------------- Node eval methods ---------------
 
-    def eval_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        shape_a: NestedData = self.input_data(0, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        if len(args) == 1:
-                            simple_shapes, struct_shapes = (simplify_array(shape_a.structure),
-                                                            simplified_array_structure(shape_a.structure))
-                            flat_data: list[Part.Shape] = []
-                            if type(struct_shapes) is int:
-                                first: Part.Shape = shape_a.data[0]
-                                if len(shape_a.data) > 1:
-                                    rest: list[Part.Shape] = shape_a.data[1:]
-                                    flat_data.append(first.multiFuse(rest))
-                                else:
-                                    flat_data.append(first)
-                            else:
-                                shapes: np.ndarray = np.array(shape_a.data, dtype="object")
-                                for simple_idx in simple_shapes:
-                                    sub_shapes: np.ndarray = shapes[simple_idx]
-                                    first: Part.Shape = sub_shapes[0]
-                                    if len(sub_shapes) > 1:
-                                        rest: list[Part.Shape] = sub_shapes[1:]
-                                        flat_data.append(first.multiFuse(rest))
-                                    else:
-                                        flat_data.append(first)
-
-                            result: NestedData = NestedData(
-                                data=flat_data,
-                                structure=struct_shapes if type(struct_shapes) == ak.Array else ak.Array([0])
-                            )
-
-                        if len(args) == 2:
-                            shape_b: NestedData = self.input_data(1, args)
-
-                            broadcasted_params: ak.Array = ak.zip(
-                                {"shape_a": shape_a.structure, "shape_b": shape_b.structure}
-                            )
-                            flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                            flat_data: list[Part.Shape] = []
-                            for param_tuple in flat_params:
-                                copy_a: Part.Shape = Part.Shape(shape_a.data[param_tuple["0"]])
-                                copy_b: Part.Shape = Part.Shape(shape_b.data[param_tuple["1"]])
-
-                                if self._option_box.currentText() == "Union":
-                                    flat_data.append(copy_a.fuse(copy_b))
-
-                                elif self._option_box.currentText() == "Subtraction":
-                                    flat_data.append(copy_a.cut(copy_b))
-
-                                elif self._option_box.currentText() == "Intersection":
-                                    flat_data.append(copy_a.common(copy_b))
-
-                                elif self._option_box.currentText() == "Section":
-                                    flat_data.append(copy_a.section(copy_b))
-
-                            result: NestedData = NestedData(
-                                data=flat_data,
-                                structure=record_structure(broadcasted_params)
-                            )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Boolean executed in", "{number:.{digits}f}".format(number=1000 * (b - a), digits=2),
-                                  "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+    @staticmethod
+    def boolean_operation(parameter_zip: tuple[Part.Shape, Part.Shape, str]) -> Part.Shape:
+        copy_a: Part.Shape = Part.Shape(parameter_zip[0])
+        copy_b: Part.Shape = Part.Shape(parameter_zip[1])
+        operation: str = parameter_zip[2]
+
+        if operation == "Union":
+            return copy_a.fuse(copy_b)
+
+        elif operation == "Subtraction":
+            return copy_a.cut(copy_b)
+
+        elif operation == "Intersection":
+            return copy_a.common(copy_b)
+
+        elif operation == "Section":
+            return copy_a.section(copy_b)
+
+    @staticmethod
+    def preview_operation(parameter_zip: tuple[Part.Shape, Part.Shape, str]) -> Part.Shape:
+        # Both operands as they are, without the costly boolean
+        return Part.makeCompound([parameter_zip[0], parameter_zip[1]])
+
+    @node_eval(0)
+    def eval_0(self, *args, quality: int = QUALITY_FULL) -> ak.Array:
+        shape_a: NestedData = self.input_data(0, args)
+
+        if len(args) == 1:
+            simple_shapes, struct_shapes = (simplify_array(shape_a.structure),
+                                            simplified_array_structure(shape_a.structure))
+            flat_data: list[Part.Shape] = []
+            if type(struct_shapes) is int:
+                first: Part.Shape = shape_a.data[0]
+                if len(shape_a.data) > 1 and quality == QUALITY_PREVIEW:
+                    flat_data.append(Part.makeCompound(shape_a.data))
+                elif len(shape_a.data) > 1:
+                    rest: list[Part.Shape] = shape_a.data[1:]
+                    flat_data.append(first.multiFuse(rest))
+                else:
+                    flat_data.append(first)
+            else:
+                shapes: np.ndarray = np.array(shape_a.data, dtype="object")
+                for simple_idx in simple_shapes:
+                    sub_shapes: np.ndarray = shapes[simple_idx]
+                    first: Part.Shape = sub_shapes[0]
+                    if len(sub_shapes) > 1 and quality == QUALITY_PREVIEW:
+                        flat_data.append(Part.makeCompound(sub_shapes.tolist()))
+                    elif len(sub_shapes) > 1:
+                        rest: list[Part.Shape] = sub_shapes[1:]
+                        flat_data.append(first.multiFuse(rest))
+                    else:
+                        flat_data.append(first)
+
+            result: NestedData = NestedData(
+                data=flat_data,
+                structure=struct_shapes if type(struct_shapes) == ak.Array else ak.Array([0])
+            )
+
+        if len(args) == 2:
+            shape_b: NestedData = self.input_data(1, args)
+
+            columns, template = broadcast_params({"shape_a": shape_a.structure, "shape_b": shape_b.structure})
+
+            operation: str = self._option_box.currentText()
+            params: list[tuple[Part.Shape, Part.Shape, str]] = [
+                (shape_a.data[idx_a], shape_b.data[idx_b], operation)
+                for idx_a, idx_b in zip(columns["shape_a"].tolist(), columns["shape_b"].tolist())
+            ]
+            if quality == QUALITY_PREVIEW:
+                result: NestedData = self.map_nested(self.preview_operation, params, template)
+            else:
+                result: NestedData = self.map_nested(self.boolean_operation, params, template)
+
+        return result
 
 # --------------- Serialization ---------------
 
@@ -22,9 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
@@ -37,7 +34,7 @@ import PySide2.QtWidgets as QtWidgets
 
 from utils import unflatten_record_like, flatten_record
 from nested_data import NestedData
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from sockets.vector_none import VectorNone
 from sockets.shape_none import ShapeNone
 
@@ -45,11 +42,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class Center(NodeItem):
     REG_NAME: str = "Center"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -65,50 +60,25 @@ class Center(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> list:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        shape: NestedData = self.input_data(0, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        broadcasted_params: ak.Array = ak.zip({"x": shape.structure, "y": 0, "z": 0})
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                        flat_x, flat_y, flat_z = ([], [], [])
-                        for param_tuple in flat_params:
-                            shp: Part.Shape = shape.data[param_tuple["0"]]
-                            if len(shp.Vertexes) > 0:
-                                pos: FreeCAD.Vector = shp.CenterOfGravity
-                                flat_x.append(pos.x), flat_y.append(pos.y), flat_z.append(pos.z)
-
-                        if len(flat_x) > 0:
-                            flat_result: ak.Array = ak.Array({"x": flat_x, "y": flat_y, "z": flat_z})
-                        else:
-                            flat_result: ak.Array = ak.Array([{"x": 0, "y": 0, "z": 0}])
-
-                        result: ak.Array = unflatten_record_like(flat_result, broadcasted_params)
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("CoG executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                  digits=2), "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        shape: NestedData = self.input_data(0, args)
+
+        broadcasted_params: ak.Array = ak.zip({"x": shape.structure, "y": 0, "z": 0})
+        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
+
+        flat_x, flat_y, flat_z = ([], [], [])
+        for param_tuple in flat_params:
+            shp: Part.Shape = shape.data[param_tuple["0"]]
+            if len(shp.Vertexes) > 0:
+                pos: FreeCAD.Vector = shp.CenterOfGravity
+                flat_x.append(pos.x), flat_y.append(pos.y), flat_z.append(pos.z)
+
+        if len(flat_x) > 0:
+            flat_result: ak.Array = ak.Array({"x": flat_x, "y": flat_y, "z": flat_z})
+        else:
+            flat_result: ak.Array = ak.Array([{"x": 0, "y": 0, "z": 0}])
+
+        result: ak.Array = unflatten_record_like(flat_result, broadcasted_params)
+
+        return result
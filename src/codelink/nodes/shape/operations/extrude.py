@@ -22,9 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
@@ -37,7 +34,7 @@ import PySide2.QtWidgets as QtWidgets
 
 from utils import record_structure, flatten_record
 from nested_data import NestedData
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from sockets.vector_none import VectorNone
 from sockets.shape_none import ShapeNone
 
@@ -45,11 +42,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class Extrude(NodeItem):
     REG_NAME: str = "Extrude"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -67,56 +62,31 @@ class Extrude(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> list:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        shape: NestedData = self.input_data(0, args)
-                        direction: ak.Array = self.input_data(1, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        flat_dir, struct_dir = (ak.to_list(flatten_record(direction, True)),
-                                                record_structure(direction))
-                        flat_dir_vec: Points.Points = Points.Points()
-                        flat_dir_vec.addPoints(flat_dir)
-
-                        broadcasted_params: ak.Array = ak.zip({"shape": shape.structure, "dir": struct_dir},
-                                                              right_broadcast=True)
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                        flat_data: list[Part.Shape] = []
-                        for param_tuple in flat_params:
-                            copy: Part.Shape = Part.Shape(shape.data[param_tuple["0"]])
-                            if ((len(copy.Faces) > 0 or len(copy.Wires) or len(copy.Edges)) and len(copy.Vertexes) > 0
-                                    and flat_dir[param_tuple["1"]] != (0, 0, 0)):
-                                copy: Part.Shape = copy.extrude(flat_dir_vec.Points[param_tuple["1"]])
-                            flat_data.append(copy)
-
-                        result: NestedData = NestedData(
-                            data=flat_data,
-                            structure=record_structure(broadcasted_params)
-                        )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Extrude executed in", "{number:.{digits}f}".format(number=1000 * (b - a), digits=2),
-                                  "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        shape: NestedData = self.input_data(0, args)
+        direction: ak.Array = self.input_data(1, args).to_record()
+
+        flat_dir, struct_dir = (ak.to_list(flatten_record(direction, True)),
+                                record_structure(direction))
+        flat_dir_vec: Points.Points = Points.Points()
+        flat_dir_vec.addPoints(flat_dir)
+
+        broadcasted_params: ak.Array = ak.zip({"shape": shape.structure, "dir": struct_dir},
+                                              right_broadcast=True)
+        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
+
+        flat_data: list[Part.Shape] = []
+        for param_tuple in flat_params:
+            copy: Part.Shape = Part.Shape(shape.data[param_tuple["0"]])
+            if ((len(copy.Faces) > 0 or len(copy.Wires) or len(copy.Edges)) and len(copy.Vertexes) > 0
+                    and flat_dir[param_tuple["1"]] != (0, 0, 0)):
+                copy: Part.Shape = copy.extrude(flat_dir_vec.Points[param_tuple["1"]])
+            flat_data.append(copy)
+
+        result: NestedData = NestedData(
+            data=flat_data,
+            structure=record_structure(broadcasted_params)
+        )
+
+        return result
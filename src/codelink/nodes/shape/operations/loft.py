@@ -22,9 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
@@ -36,7 +33,7 @@ import PySide2.QtWidgets as QtWidgets
 
 from nested_data import NestedData
 from utils import simplified_array_structure, simplify_array, flatten_record, record_structure
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from sockets.shape_none import ShapeNone
 from sockets.bool_checkbox import BoolCheckBox
 
@@ -45,11 +42,10 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class Loft(NodeItem):
     REG_NAME: str = "Loft"
+    IS_PURE: bool = True
+    IS_PARALLEL: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -71,67 +67,41 @@ class Loft(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @staticmethod
+    def make_loft(parameter_zip: tuple[list[Part.Shape], bool, bool, bool]) -> Part.Shape:
+        return Part.makeLoft(parameter_zip[0], parameter_zip[1], parameter_zip[2], parameter_zip[3])
+
+    @node_eval(0)
     def eval_0(self, *args) -> NestedData:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        sections: NestedData = self.input_data(0, args)
-                        solid: ak.Array = self.input_data(1, args)
-                        ruled: ak.Array = self.input_data(2, args)
-                        closed: ak.Array = self.input_data(3, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        simple_sections, struct_sections = (simplify_array(sections.structure),
-                                                            simplified_array_structure(sections.structure))
-
-                        broadcasted_params: ak.Array = ak.zip(
-                            {"sections": struct_sections, "solid": solid, "ruled": ruled, "closed": closed},
-                            right_broadcast=True)
-
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                        flat_data: list[Part.Shape] = []
-                        for param_tuple in flat_params:
-                            if type(struct_sections) is int:
-                                flat_data.append(Part.makeLoft(
-                                    sections.data,
-                                    bool(param_tuple["1"]), bool(param_tuple["2"]), bool(param_tuple["3"])
-                                ))
-
-                            else:
-                                sub_sections: list[Part.Shape] = [
-                                    sections.data[idx] for idx in simple_sections[param_tuple["0"]]
-                                ]
-                                flat_data.append(Part.makeLoft(
-                                    sub_sections,
-                                    bool(param_tuple["1"]), bool(param_tuple["2"]), bool(param_tuple["3"])
-                                ))
-
-                        result: NestedData = NestedData(
-                            data=flat_data,
-                            structure=record_structure(broadcasted_params)
-                        )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Loft executed in", "{number:.{digits}f}".format(number=1000 * (b - a), digits=2),
-                                  "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        sections: NestedData = self.input_data(0, args)
+        solid: ak.Array = self.input_data(1, args)
+        ruled: ak.Array = self.input_data(2, args)
+        closed: ak.Array = self.input_data(3, args)
+
+        simple_sections, struct_sections = (simplify_array(sections.structure),
+                                            simplified_array_structure(sections.structure))
+
+        broadcasted_params: ak.Array = ak.zip(
+            {"sections": struct_sections, "solid": solid, "ruled": ruled, "closed": closed},
+            right_broadcast=True)
+
+        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
+
+        params: list[tuple[list[Part.Shape], bool, bool, bool]] = []
+        for param_tuple in flat_params:
+            if type(struct_sections) is int:
+                sub_sections: list[Part.Shape] = sections.data
+            else:
+                sub_sections: list[Part.Shape] = [
+                    sections.data[idx] for idx in simple_sections[param_tuple["0"]]
+                ]
+            params.append((sub_sections, bool(param_tuple["1"]), bool(param_tuple["2"]), bool(param_tuple["3"])))
+
+        flat_data: list[Part.Shape] = self.map_elements(self.make_loft, params)
+
+        result: NestedData = NestedData(
+            data=flat_data,
+            structure=record_structure(broadcasted_params)
+        )
+
+        return result
@@ -22,9 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
@@ -35,9 +32,9 @@ import Points  # noqa
 
 import PySide2.QtWidgets as QtWidgets
 
-from utils import record_structure, flatten_record
-from nested_data import NestedData
-from node_item import NodeItem
+from utils import broadcast_params
+from nested_data import NestedData, NestedVector
+from node_item import NodeItem, node_eval
 from sockets.vector_none import VectorNone
 from sockets.value_line import ValueLine
 from sockets.shape_none import ShapeNone
@@ -46,11 +43,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class Rotate(NodeItem):
     REG_NAME: str = "Rotate"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -71,57 +66,30 @@ class Rotate(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @staticmethod
+    def rotate_shape(parameter_zip: tuple[Part.Shape, list[float], list[float], float]) -> Part.Shape:
+        copy: Part.Shape = Part.Shape(parameter_zip[0])
+        copy.rotate(tuple(parameter_zip[1]), tuple(parameter_zip[2]), parameter_zip[3])
+        return copy
+
+    @node_eval(0)
     def eval_0(self, *args) -> list:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        shape: NestedData = self.input_data(0, args)
-                        rot_pivot: ak.Array = self.input_data(1, args)
-                        rot_axis: ak.Array = self.input_data(2, args)
-                        rot_angle: ak.Array = self.input_data(3, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        flat_pivot, struct_pivot = (ak.to_list(flatten_record(rot_pivot, True)),
-                                                    record_structure(rot_pivot))
-                        flat_axis, struct_axis = (ak.to_list(flatten_record(rot_axis, True)),
-                                                  record_structure(rot_axis))
-
-                        broadcasted_params: ak.Array = ak.zip(
-                            {"shape": shape.structure, "pivot": struct_pivot, "axis": struct_axis, "angle": rot_angle}
-                        )
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                        flat_data: list[Part.Shape] = []
-                        for param_tuple in flat_params:
-                            copy: Part.Shape = Part.Shape(shape.data[param_tuple["0"]])
-                            copy.rotate(flat_pivot[param_tuple["1"]], flat_axis[param_tuple["2"]], param_tuple["3"])
-                            flat_data.append(copy)
-
-                        result: NestedData = NestedData(
-                            data=flat_data,
-                            structure=record_structure(broadcasted_params)
-                        )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Rotate executed in", "{number:.{digits}f}".format(number=1000 * (b - a), digits=2),
-                                  "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        shape: NestedData = self.input_data(0, args)
+        rot_pivot: NestedVector = self.input_data(1, args)
+        rot_axis: NestedVector = self.input_data(2, args)
+        rot_angle: ak.Array = self.input_data(3, args)
+
+        columns, template = broadcast_params({
+            "shape": shape.structure, "pivot": rot_pivot.structure, "axis": rot_axis.structure,
+            "angle": rot_angle
+        })
+        pivots: list[list[float]] = rot_pivot.coords[columns["pivot"]].tolist()
+        axes: list[list[float]] = rot_axis.coords[columns["axis"]].tolist()
+
+        params: list[tuple[Part.Shape, list[float], list[float], float]] = [
+            (shape.data[shape_idx], pivot, axis, angle)
+            for shape_idx, pivot, axis, angle in zip(columns["shape"].tolist(), pivots, axes, columns["angle"].tolist())
+        ]
+        result: NestedData = self.map_nested(self.rotate_shape, params, template)
+
+        return result
@@ -22,9 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
@@ -35,9 +32,9 @@ import Points  # noqa
 
 import PySide2.QtWidgets as QtWidgets
 
-from utils import record_structure, flatten_record
-from nested_data import NestedData
-from node_item import NodeItem
+from utils import broadcast_params
+from nested_data import NestedData, NestedVector
+from node_item import NodeItem, node_eval
 from sockets.vector_none import VectorNone
 from sockets.shape_none import ShapeNone
 
@@ -45,11 +42,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class Scale(NodeItem):
     REG_NAME: str = "Scale"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -67,55 +62,29 @@ class Scale(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @staticmethod
+    def scale_shape(parameter_zip: tuple[Part.Shape, list[float]]) -> Part.Shape:
+        copy: Part.Shape = Part.Shape(parameter_zip[0])
+        factor_tuple: list[float] = parameter_zip[1]
+
+        if len(copy.Vertexes) > 0 and all(factor_tuple):
+            scale_matrix: FreeCAD.Matrix = FreeCAD.Matrix()
+            scale_matrix.scale(factor_tuple[0], factor_tuple[1], factor_tuple[2])
+            copy: Part.Shape = copy.transformGeometry(scale_matrix)
+
+        return copy
+
+    @node_eval(0)
     def eval_0(self, *args) -> list:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        shape: NestedData = self.input_data(0, args)
-                        factor: ak.Array = self.input_data(1, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        flat_factor, struct_factor = (ak.to_list(flatten_record(factor, True)),
-                                                      record_structure(factor))
-                        broadcasted_params: ak.Array = ak.zip({"shape": shape.structure, "factor": struct_factor})
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                        flat_data: list[Part.Shape] = []
-                        for param_tuple in flat_params:
-                            copy: Part.Shape = Part.Shape(shape.data[param_tuple["0"]])
-                            factor_tuple: tuple = flat_factor[param_tuple["1"]]
-
-                            if len(copy.Vertexes) > 0 and all(factor_tuple):
-                                scale_matrix: FreeCAD.Matrix = FreeCAD.Matrix()
-                                scale_matrix.scale(factor_tuple[0], factor_tuple[1], factor_tuple[2])
-                                copy: Part.Shape = copy.transformGeometry(scale_matrix)
-                            flat_data.append(copy)
-
-                        result: NestedData = NestedData(
-                            data=flat_data,
-                            structure=record_structure(broadcasted_params)
-                        )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Scale executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                    digits=2), "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        shape: NestedData = self.input_data(0, args)
+        factor: NestedVector = self.input_data(1, args)
+
+        columns, template = broadcast_params({"shape": shape.structure, "factor": factor.structure})
+        factors: list[list[float]] = factor.coords[columns["factor"]].tolist()
+
+        params: list[tuple[Part.Shape, list[float]]] = [
+            (shape.data[shape_idx], factor_tuple) for shape_idx, factor_tuple in zip(columns["shape"].tolist(), factors)
+        ]
+        result: NestedData = self.map_nested(self.scale_shape, params, template)
+
+        return result
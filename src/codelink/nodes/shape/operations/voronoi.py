@@ -23,12 +23,9 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, cast
 from collections import defaultdict
-from math import fabs
+from math import fabs, ceil
 import importlib
-import warnings
-import inspect
 import itertools
-import time
 
 import numpy as np
 from scipy.spatial import Voronoi
@@ -43,8 +40,8 @@ import PySide2.QtCore as QtCore
 import PySide2.QtWidgets as QtWidgets
 
 from nested_data import NestedData
-from utils import map_list, record_structure, flatten_record, simplify_record, simplified_rec_struct
-from node_item import NodeItem
+from utils import map_list, simplify_record, simplified_rec_struct, broadcast_params
+from node_item import NodeItem, node_eval, QUALITY_PREVIEW, QUALITY_FULL
 from input_widgets import OptionBoxWidget
 from sockets.shape_none import ShapeNone
 from sockets.value_line import ValueLine
@@ -54,11 +51,14 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
+PREVIEW_MAX_SITES: int = 50
 
 
 class VoronoiNode(NodeItem):
     REG_NAME: str = "Voronoi"
+    IS_PURE: bool = True
+    IS_PARALLEL: bool = True
+    OPTIONS: list[str] = ["Face", "Solid"]
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -68,7 +68,7 @@ class VoronoiNode(NodeItem):
         self._option_box: OptionBoxWidget = OptionBoxWidget(undo_stack)
         self._option_box.setFocusPolicy(QtCore.Qt.NoFocus)
         self._option_box.setMinimumWidth(5)
-        self._option_box.addItems(["Face", "Solid"])
+        self._option_box.addItems(self.OPTIONS)
         for option_idx in range(self._option_box.count()):
             self._option_box.model().setData(self._option_box.model().index(option_idx, 0), QtCore.QSize(160, 24),
                                              QtCore.Qt.SizeHintRole)
@@ -199,75 +199,42 @@ class VoronoiNode(NodeItem):
         else:
             return Part.Shape()
 
-    def eval_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        shape: NestedData = self.input_data(0, args)
-                        position: ak.Array = self.input_data(1, args)
-                        scale: ak.Array = self.input_data(2, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        simple_pos, struct_pos = (simplify_record(position, True), simplified_rec_struct(position))
-
-                        broadcasted_params: ak.Array = ak.zip(
-                            {"shape": shape.structure, "pos": struct_pos, "scale": scale}
-                        )
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                        flat_data: list[Part.Shape] = []
-                        for param_tuple in flat_params:
-
-                            if self._option_box.currentText() == "Face":
-                                if type(struct_pos) is int:
-                                    flat_data.append(self.voronoi_on_surface(
-                                        (shape.data[param_tuple["0"]], ak.to_list(simple_pos), param_tuple["2"])
-                                    ))
-                                else:
-                                    flat_data.append(self.voronoi_on_surface(
-                                        (shape.data[param_tuple["0"]], ak.to_list(simple_pos)[param_tuple["1"]],
-                                         param_tuple["2"])
-                                    ))
-
-                            elif self._option_box.currentText() == "Solid":
-                                if type(struct_pos) is int:
-                                    flat_data.append(self.voronoi_on_solid(
-                                        (shape.data[param_tuple["0"]], ak.to_list(simple_pos), param_tuple["2"])
-                                    ))
-                                else:
-                                    flat_data.append(self.voronoi_on_solid(
-                                        (shape.data[param_tuple["0"]], ak.to_list(simple_pos)[param_tuple["1"]],
-                                         param_tuple["2"])
-                                    ))
-
-                        result: NestedData = NestedData(
-                            data=flat_data,
-                            structure=record_structure(broadcasted_params)
-                        )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Voronoi executed in", "{number:.{digits}f}".format(number=1000 * (b - a), digits=2),
-                                  "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+    @staticmethod
+    def preview_sites(points: list) -> list:
+        # Evenly spread subset of the sites
+        step: int = ceil(len(points) / PREVIEW_MAX_SITES)
+        return points[::step] if step > 1 else points
+
+    @node_eval(0)
+    def eval_0(self, *args, quality: int = QUALITY_FULL) -> ak.Array:
+        shape: NestedData = self.input_data(0, args)
+        position: ak.Array = self.input_data(1, args).to_record()
+        scale: ak.Array = self.input_data(2, args)
+
+        simple_pos, struct_pos = (simplify_record(position, True), simplified_rec_struct(position))
+
+        columns, template = broadcast_params({"shape": shape.structure, "pos": struct_pos, "scale": scale})
+
+        points: list = ak.to_list(simple_pos)
+        if quality == QUALITY_PREVIEW:
+            if type(struct_pos) is int:
+                points: list = self.preview_sites(points)
+            else:
+                points: list = [self.preview_sites(pos_points) for pos_points in points]
+
+        params: list[tuple[Part.Shape, list, float]] = [
+            (shape.data[shape_idx], points if type(struct_pos) is int else points[pos_idx], scale_value)
+            for shape_idx, pos_idx, scale_value in zip(
+                columns["shape"].tolist(), columns["pos"].tolist(), columns["scale"].tolist()
+            )
+        ]
+
+        if self._option_box.currentText() == "Face":
+            result: NestedData = self.map_nested(self.voronoi_on_surface, params, template)
+        else:
+            result: NestedData = self.map_nested(self.voronoi_on_solid, params, template)
+
+        return result
 
 # --------------- Serialization ---------------
 
@@ -22,9 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
@@ -37,7 +34,7 @@ import PySide2.QtWidgets as QtWidgets
 
 from utils import simplify_array, simplified_array_structure
 from nested_data import NestedData
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from sockets.shape_none import ShapeNone
 
 
@@ -45,11 +42,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class SolidFromFace(NodeItem):
     REG_NAME: str = "Solid from Face"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -65,57 +60,32 @@ class SolidFromFace(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> NestedData:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        faces: NestedData = self.input_data(0, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        simple_face, struct_face = (simplify_array(faces.structure),
-                                                    simplified_array_structure(faces.structure))
-
-                        flat_data: list[Part.Shape] = []
-                        if type(struct_face) is int:
-                            shape: Part.Compound = Part.Compound(faces.data)
-                            shell: Part.Shell = Part.Shell(shape.Faces)
-                            shell.sewShape()
-                            solid: Part.Solid = Part.Solid(shell)
-                            flat_data.append(solid)
-                        else:
-                            for face_idx_set in simple_face:
-                                face_set: list[Part.Face] = [faces.data[idx] for idx in face_idx_set]
-                                shape: Part.Compound = Part.Compound(face_set)
-                                shell: Part.Shell = Part.Shell(shape.Faces)
-                                shell.sewShape()
-                                solid: Part.Solid = Part.Solid(shell)
-                                flat_data.append(solid)
-
-                        result: NestedData = NestedData(
-                            data=flat_data,
-                            structure=struct_face if type(struct_face) == ak.Array else ak.Array([0])
-                        )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Solid from Face executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                              digits=2), "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        faces: NestedData = self.input_data(0, args)
+
+        simple_face, struct_face = (simplify_array(faces.structure),
+                                    simplified_array_structure(faces.structure))
+
+        flat_data: list[Part.Shape] = []
+        if type(struct_face) is int:
+            shape: Part.Compound = Part.Compound(faces.data)
+            shell: Part.Shell = Part.Shell(shape.Faces)
+            shell.sewShape()
+            solid: Part.Solid = Part.Solid(shell)
+            flat_data.append(solid)
+        else:
+            for face_idx_set in simple_face:
+                face_set: list[Part.Face] = [faces.data[idx] for idx in face_idx_set]
+                shape: Part.Compound = Part.Compound(face_set)
+                shell: Part.Shell = Part.Shell(shape.Faces)
+                shell.sewShape()
+                solid: Part.Solid = Part.Solid(shell)
+                flat_data.append(solid)
+
+        result: NestedData = NestedData(
+            data=flat_data,
+            structure=struct_face if type(struct_face) == ak.Array else ak.Array([0])
+        )
+
+        return result
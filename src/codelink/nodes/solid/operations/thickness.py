@@ -22,9 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
@@ -37,7 +34,7 @@ import PySide2.QtWidgets as QtWidgets
 
 from utils import simplify_array, simplified_array_structure, flatten_record, record_structure
 from nested_data import NestedData
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from sockets.shape_none import ShapeNone
 from sockets.value_line import ValueLine
 
@@ -46,11 +43,10 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class Thickness(NodeItem):
     REG_NAME: str = "Thickness"
+    IS_PURE: bool = True
+    IS_PARALLEL: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -68,88 +64,59 @@ class Thickness(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @staticmethod
+    def make_thickness(parameter_zip: tuple[Part.Solid, list, float]) -> Part.Shape:
+        target: Part.Solid = parameter_zip[0]
+        faces: list[Part.Face] = [
+            target.Faces[int(idx)] if int(idx) in range(len(target.Faces)) else None for idx in parameter_zip[1]
+        ]
+
+        # target_obj: FreeCAD.DocumentObject = Part.show(target)
+        # result_obj: FreeCAD.DocumentObject = FreeCAD.activeDocument().addObject(
+        #     "Part::Thickness", "Thickness"
+        # )
+        #
+        # face_names: list[str] = ["Face" + str(int(face_idx)) for face_idx in parameter_zip[1]]
+        # result_obj.Faces = (target_obj, face_names) if face_names[0] != "Face0"
+        # else target_obj
+        # result_obj.Mode = 0
+        # result_obj.Join = 2
+        # result_obj.Value = parameter_zip[2]
+        # FreeCAD.activeDocument().recompute()
+        #
+        # # noinspection PyUnresolvedReferences
+        # result: Part.Shape = result_obj.Shape
+        #
+        # FreeCAD.activeDocument().removeObject(target_obj.Name)
+        # FreeCAD.activeDocument().removeObject(result_obj.Name)
+
+        return target.makeThickness(faces, parameter_zip[2], 0.1)
+
+    @node_eval(0)
     def eval_0(self, *args) -> NestedData:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        solid: NestedData = self.input_data(0, args)
-                        cutout_id: ak.Array = self.input_data(1, args)
-                        thickness: ak.Array = self.input_data(2, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        simple_cutout, struct_cutout = (ak.to_list(simplify_array(cutout_id)),
-                                                        simplified_array_structure(cutout_id))
-
-                        broadcasted_params: ak.Array = ak.zip(
-                            {"solid": solid.structure, "cutout": struct_cutout, "thickness": thickness}
-                        )
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-                        flat_data: list[Part.Shape] = []
-                        for param_tuple in flat_params:
-                            target: Part.Solid = solid.data[param_tuple["0"]]
-                            if len(target.Solids) > 0 and len(target.Vertexes) > 0:
-                                if type(struct_cutout) == int:
-                                    faces: list[Part.Face] = [
-                                        target.Faces[int(idx)]
-                                        if int(idx) in range(len(target.Faces)) else None for idx in simple_cutout
-                                    ]
-                                else:
-                                    faces: list[Part.Face] = [
-                                        target.Faces[int(idx)]
-                                        if int(idx) in range(len(target.Faces)) else None
-                                        for idx in simple_cutout[param_tuple["1"]]
-                                    ]
-
-                                flat_data.append(target.makeThickness(faces, param_tuple["2"], 0.1))
-
-                                # target_obj: FreeCAD.DocumentObject = Part.show(target)
-                                # result_obj: FreeCAD.DocumentObject = FreeCAD.activeDocument().addObject(
-                                #     "Part::Thickness", "Thickness"
-                                # )
-                                #
-                                # if type(struct_cutout) == int:
-                                # face_names: list[str] = ["Face" + str(int(face_idx)) for face_idx in simple_cutout]
-                                # else:
-                                #     face_names: list[str] = ["Face" + str(int(face_idx))
-                                #                              for face_idx in simple_cutout[param_tuple["1"]]]
-                                # result_obj.Faces = (target_obj, face_names) if face_names[0] != "Face0"
-                                # else target_obj
-                                # result_obj.Mode = 0
-                                # result_obj.Join = 2
-                                # result_obj.Value = param_tuple["2"]
-                                # FreeCAD.activeDocument().recompute()
-                                #
-                                # # noinspection PyUnresolvedReferences
-                                # flat_data.append(result_obj.Shape)
-                                #
-                                # FreeCAD.activeDocument().removeObject(target_obj.Name)
-                                # FreeCAD.activeDocument().removeObject(result_obj.Name)
-
-                            result: NestedData = NestedData(
-                                data=flat_data,
-                                structure=record_structure(broadcasted_params)
-                            )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Thickness executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                        digits=2), "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        solid: NestedData = self.input_data(0, args)
+        cutout_id: ak.Array = self.input_data(1, args)
+        thickness: ak.Array = self.input_data(2, args)
+
+        simple_cutout, struct_cutout = (ak.to_list(simplify_array(cutout_id)),
+                                        simplified_array_structure(cutout_id))
+
+        broadcasted_params: ak.Array = ak.zip(
+            {"solid": solid.structure, "cutout": struct_cutout, "thickness": thickness}
+        )
+        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
+        params: list[tuple[Part.Solid, list, float]] = []
+        for param_tuple in flat_params:
+            target: Part.Solid = solid.data[param_tuple["0"]]
+            if len(target.Solids) > 0 and len(target.Vertexes) > 0:
+                face_ids: list = simple_cutout if type(struct_cutout) == int else simple_cutout[param_tuple["1"]]
+                params.append((target, face_ids, param_tuple["2"]))
+
+        flat_data: list[Part.Shape] = self.map_elements(self.make_thickness, params)
+
+        result: NestedData = NestedData(
+            data=flat_data,
+            structure=record_structure(broadcasted_params)
+        )
+
+        return result
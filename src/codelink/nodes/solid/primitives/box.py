@@ -22,9 +22,6 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
@@ -36,7 +33,7 @@ import PySide2.QtWidgets as QtWidgets
 
 from utils import record_structure, flatten_record
 from nested_data import NestedData
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from sockets.value_line import ValueLine
 from sockets.shape_none import ShapeNone
 
@@ -44,11 +41,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class Box(NodeItem):
     REG_NAME: str = "Box"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -65,47 +60,22 @@ class Box(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> list:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        length: ak.Array = self.input_data(0, args)
-                        width: ak.Array = self.input_data(1, args)
-                        height: ak.Array = self.input_data(2, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        broadcasted_params: ak.Array = ak.zip({"length": length, "width": width, "height": height})
-                        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                        flat_data: list[Part.Shape] = []
-                        for param_tuple in flat_params:
-                            flat_data.append(Part.makeBox(param_tuple["0"], param_tuple["1"], param_tuple["2"]))
-
-                        result: NestedData = NestedData(
-                            data=flat_data,
-                            structure=record_structure(broadcasted_params)
-                        )
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Box executed in", "{number:.{digits}f}".format(number=1000 * (b - a), digits=2),
-                                  "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        length: ak.Array = self.input_data(0, args)
+        width: ak.Array = self.input_data(1, args)
+        height: ak.Array = self.input_data(2, args)
+
+        broadcasted_params: ak.Array = ak.zip({"length": length, "width": width, "height": height})
+        flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
+
+        flat_data: list[Part.Shape] = []
+        for param_tuple in flat_params:
+            flat_data.append(Part.makeBox(param_tuple["0"], param_tuple["1"], param_tuple["2"]))
+
+        result: NestedData = NestedData(
+            data=flat_data,
+            structure=record_structure(broadcasted_params)
+        )
+
+        return result
@@ -23,9 +23,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, Union, cast
 import importlib
-import warnings
-import inspect
-import time
 
 import Part
 import awkward as ak
@@ -33,10 +30,10 @@ import awkward as ak
 import PySide2.QtCore as QtCore
 import PySide2.QtWidgets as QtWidgets
 
-from nested_data import NestedData
+from nested_data import NestedData, NestedVector
 from utils import (mass_zip_to_array, reorder_list, array_structure, simplify_array, simplified_array_structure,
                    flatten_record, simplified_rec_struct)
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from input_widgets import OptionBoxWidget
 from sockets.any_none import AnyNone
 from sockets.value_line import ValueLine
@@ -46,11 +43,10 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class ListFunctions(NodeItem):
     REG_NAME: str = "List Functions"
+    IS_PURE: bool = True
+    OPTIONS: list[str] = ["Zip", "Mass Zip", "Flip", "Shift", "Item", "Mask"]
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -60,7 +56,7 @@ class ListFunctions(NodeItem):
         self._option_box: OptionBoxWidget = OptionBoxWidget(undo_stack)
         self._option_box.setFocusPolicy(QtCore.Qt.NoFocus)
         self._option_box.setMinimumWidth(5)
-        self._option_box.addItems(["Zip", "Mass Zip", "Flip", "Shift", "Item", "Mask"])
+        self._option_box.addItems(self.OPTIONS)
         for option_idx in range(self._option_box.count()):
             self._option_box.model().setData(self._option_box.model().index(option_idx, 0), QtCore.QSize(160, 24),
                                              QtCore.Qt.SizeHintRole)
@@ -172,176 +168,162 @@ class ListFunctions(NodeItem):
 
     # --------------- Node eval methods ---------------
 
-    def eval_0(self, *args) -> Union[ak.Array, NestedData, list]:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        list_a: Union[ak.Array, NestedData] = self.input_data(0, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        if self._option_box.currentText() == "Zip":
-                            list_b: Union[ak.Array, NestedData] = self.input_data(1, args)
-
-                            if isinstance(list_a, ak.Array) and isinstance(list_b, ak.Array):
-                                zipped_tuples: ak.Array = ak.zip([list_a, list_b], right_broadcast=True)
-                                grafted_tuples: ak.Array = ak.unflatten(zipped_tuples, counts=1, axis=-1)
-                                result = ak.concatenate(ak.unzip(grafted_tuples), axis=-1)
-
-                            elif isinstance(list_a, NestedData) and isinstance(list_b, NestedData):
-                                zipped_tuples: ak.Array = ak.zip([list_a.structure, list_b.structure],
-                                                                 right_broadcast=True)
-                                grafted_tuples: ak.Array = ak.unflatten(zipped_tuples, counts=1, axis=-1)
-                                new_structure: ak.Array = ak.concatenate(ak.unzip(grafted_tuples), axis=-1)
-
-                                flat_data: list[Part.Shape] = []
-                                simple_structure: list = ak.to_list(simplify_array(new_structure))
-
-                                for simple_ids in simple_structure:
-                                    flat_data.append(list_a.data[simple_ids[0]])
-                                    flat_data.append(list_b.data[simple_ids[1]])
-
-                                result: NestedData = NestedData(
-                                    flat_data, array_structure(new_structure)
-                                )
-                            else:
-                                result: ak.Array = ak.Array([0])
-
-                        elif self._option_box.currentText() == "Mass Zip":
-                            if isinstance(list_a, ak.Array):
-                                if (len(list_a.fields) == 0 and type(simplified_array_structure(list_a)) == int or
-                                        len(list_a.fields) != 0 and type(simplified_rec_struct(list_a)) == int):
-                                    result: ak.Array = list_a
-                                else:
-                                    result: ak.Array = mass_zip_to_array(list_a)
-
-                            elif isinstance(list_a, NestedData):
-                                if type(simplified_array_structure(list_a.structure)) == int:
-                                    result: NestedData = list_a
-                                else:
-                                    new_structure: ak.Array = mass_zip_to_array(list_a.structure)
-                                    flat_data_out: list[Part.Shape] = reorder_list(list_a.data, new_structure)
-
-                                    result: NestedData = NestedData(
-                                        flat_data_out, array_structure(new_structure)
-                                    )
-                            else:
-                                result: ak.Array = ak.Array([0])
-
-                        elif self._option_box.currentText() == "Flip":
-                            if isinstance(list_a, ak.Array):
-                                result: ak.Array = list_a[..., ::-1]
-
-                            elif isinstance(list_a, NestedData):
-                                new_structure: ak.Array = list_a[..., ::-1]
-                                flat_data_out: list[Part.Shape] = reorder_list(list_a.data, new_structure)
-
-                                result: NestedData = NestedData(
-                                    flat_data_out, array_structure(new_structure)
-                                )
-                            else:
-                                result: ak.Array = ak.Array([0])
-
-                        elif self._option_box.currentText() == "Shift":
-                            offset: ak.Array = self.input_data(1, args)
-
-                            broadcasted_params: ak.Array = ak.zip({"list_a": 0, "offset": offset},
-                                                                  right_broadcast=True)
-                            flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                            if isinstance(list_a, ak.Array):
-                                result_list: list[ak.Array] = []
-                                for param_tuple in flat_params:
-                                    offset: int = int(param_tuple["1"])
-                                    result_list.append(ak.concatenate(
-                                        [list_a[..., offset:], list_a[..., :offset]], axis=-1
-                                    ))
-                                    result: ak.Array = ak.flatten(result_list)
-
-                            elif isinstance(list_a, NestedData):
-                                new_structure_list: list[ak.Array] = []
-                                for param_tuple in flat_params:
-                                    offset: int = int(param_tuple["1"])
-                                    new_structure_list.append(ak.concatenate(
-                                        [list_a.structure[..., offset:], list_a.structure[..., :offset]], axis=-1
-                                    ))
-                                    new_structure: ak.Array = ak.flatten(new_structure_list)
-
-                                flat_data_out: list[Part.Shape] = reorder_list(list_a.data, new_structure)
-
-                                result: NestedData = NestedData(
-                                    flat_data_out, array_structure(new_structure)
-                                )
-                            else:
-                                result: ak.Array = ak.Array([0])
-
-                        elif self._option_box.currentText() == "Item":
-                            index: ak.Array = self.input_data(1, args)
-
-                            broadcasted_params: ak.Array = ak.zip({"list_a": 0, "index": index},
-                                                                  right_broadcast=True)
-                            flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                            if isinstance(list_a, ak.Array):
-                                result_list: list[ak.Array] = []
-                                for param_tuple in flat_params:
-                                    idx: int = int(param_tuple["1"])
-                                    result_list.append(list_a[..., idx:idx+1])
-                                result: ak.Array = ak.concatenate(result_list, axis=0)
-
-                            elif isinstance(list_a, NestedData):
-                                new_structure: list[ak.Array] = []
-                                for param_tuple in flat_params:
-                                    idx: int = int(param_tuple["1"])
-                                    new_structure.append(list_a.structure[..., idx:idx+1])
-                                new_structure: ak.Array = ak.concatenate(new_structure, axis=0)
-
-                                flat_data_out: list[Part.Shape] = reorder_list(list_a.data, new_structure)
-                                result: NestedData = NestedData(
-                                    flat_data_out, array_structure(new_structure)
-                                )
-                            else:
-                                result: ak.Array = ak.Array([0])
-                        else:
-                            mask: ak.Array = self.input_data(1, args)
-
-                            if ak.any(mask, axis=None):
-                                if isinstance(list_a, ak.Array):
-                                    list_a, mask = ak.broadcast_arrays(list_a, mask)
-                                    result: ak.Array = list_a[mask]
-
-                                elif isinstance(list_a, NestedData):
-                                    list_a_struct, mask = ak.broadcast_arrays(list_a.structure, mask)
-                                    new_structure: ak.Array = list_a_struct[mask]
-                                    flat_data_out: list[Part.Shape] = reorder_list(list_a.data, new_structure)
-                                    result: NestedData = NestedData(
-                                        flat_data_out, array_structure(new_structure)
-                                    )
-                            else:
-                                result: ak.Array = ak.Array([0])
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("List Functions executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                             digits=2), "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+    @node_eval(0)
+    def eval_0(self, *args) -> Union[ak.Array, NestedData, NestedVector, list]:
+        list_a: Union[ak.Array, NestedData, NestedVector] = self.input_data(0, args)
+
+        # Vectors are rearranged as awkward records and turned back into columns at the end
+        is_vector: bool = isinstance(list_a, NestedVector)
+        if is_vector:
+            list_a: ak.Array = list_a.to_record()
+
+        if self._option_box.currentText() == "Zip":
+            list_b: Union[ak.Array, NestedData, NestedVector] = self.input_data(1, args)
+            is_vector: bool = is_vector and isinstance(list_b, NestedVector)
+            if isinstance(list_b, NestedVector):
+                list_b: ak.Array = list_b.to_record()
+
+            if isinstance(list_a, ak.Array) and isinstance(list_b, ak.Array):
+                zipped_tuples: ak.Array = ak.zip([list_a, list_b], right_broadcast=True)
+                grafted_tuples: ak.Array = ak.unflatten(zipped_tuples, counts=1, axis=-1)
+                result = ak.concatenate(ak.unzip(grafted_tuples), axis=-1)
+
+            elif isinstance(list_a, NestedData) and isinstance(list_b, NestedData):
+                zipped_tuples: ak.Array = ak.zip([list_a.structure, list_b.structure],
+                                                 right_broadcast=True)
+                grafted_tuples: ak.Array = ak.unflatten(zipped_tuples, counts=1, axis=-1)
+                new_structure: ak.Array = ak.concatenate(ak.unzip(grafted_tuples), axis=-1)
+
+                flat_data: list[Part.Shape] = []
+                simple_structure: list = ak.to_list(simplify_array(new_structure))
+
+                for simple_ids in simple_structure:
+                    flat_data.append(list_a.data[simple_ids[0]])
+                    flat_data.append(list_b.data[simple_ids[1]])
+
+                result: NestedData = NestedData(
+                    flat_data, array_structure(new_structure)
+                )
+            else:
+                result: ak.Array = ak.Array([0])
+
+        elif self._option_box.currentText() == "Mass Zip":
+            if isinstance(list_a, ak.Array):
+                if (len(list_a.fields) == 0 and type(simplified_array_structure(list_a)) == int or
+                        len(list_a.fields) != 0 and type(simplified_rec_struct(list_a)) == int):
+                    result: ak.Array = list_a
+                else:
+                    result: ak.Array = mass_zip_to_array(list_a)
+
+            elif isinstance(list_a, NestedData):
+                if type(simplified_array_structure(list_a.structure)) == int:
+                    result: NestedData = list_a
+                else:
+                    new_structure: ak.Array = mass_zip_to_array(list_a.structure)
+                    flat_data_out: list[Part.Shape] = reorder_list(list_a.data, new_structure)
+
+                    result: NestedData = NestedData(
+                        flat_data_out, array_structure(new_structure)
+                    )
+            else:
+                result: ak.Array = ak.Array([0])
+
+        elif self._option_box.currentText() == "Flip":
+            if isinstance(list_a, ak.Array):
+                result: ak.Array = list_a[..., ::-1]
+
+            elif isinstance(list_a, NestedData):
+                new_structure: ak.Array = list_a[..., ::-1]
+                flat_data_out: list[Part.Shape] = reorder_list(list_a.data, new_structure)
+
+                result: NestedData = NestedData(
+                    flat_data_out, array_structure(new_structure)
+                )
+            else:
+                result: ak.Array = ak.Array([0])
+
+        elif self._option_box.currentText() == "Shift":
+            offset: ak.Array = self.input_data(1, args)
+
+            broadcasted_params: ak.Array = ak.zip({"list_a": 0, "offset": offset},
+                                                  right_broadcast=True)
+            flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
+
+            if isinstance(list_a, ak.Array):
+                result_list: list[ak.Array] = []
+                for param_tuple in flat_params:
+                    offset: int = int(param_tuple["1"])
+                    result_list.append(ak.concatenate(
+                        [list_a[..., offset:], list_a[..., :offset]], axis=-1
+                    ))
+                    result: ak.Array = ak.flatten(result_list)
+
+            elif isinstance(list_a, NestedData):
+                new_structure_list: list[ak.Array] = []
+                for param_tuple in flat_params:
+                    offset: int = int(param_tuple["1"])
+                    new_structure_list.append(ak.concatenate(
+                        [list_a.structure[..., offset:], list_a.structure[..., :offset]], axis=-1
+                    ))
+                    new_structure: ak.Array = ak.flatten(new_structure_list)
+
+                flat_data_out: list[Part.Shape] = reorder_list(list_a.data, new_structure)
+
+                result: NestedData = NestedData(
+                    flat_data_out, array_structure(new_structure)
+                )
+            else:
+                result: ak.Array = ak.Array([0])
+
+        elif self._option_box.currentText() == "Item":
+            index: ak.Array = self.input_data(1, args)
+
+            broadcasted_params: ak.Array = ak.zip({"list_a": 0, "index": index},
+                                                  right_broadcast=True)
+            flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
+
+            if isinstance(list_a, ak.Array):
+                result_list: list[ak.Array] = []
+                for param_tuple in flat_params:
+                    idx: int = int(param_tuple["1"])
+                    result_list.append(list_a[..., idx:idx+1])
+                result: ak.Array = ak.concatenate(result_list, axis=0)
+
+            elif isinstance(list_a, NestedData):
+                new_structure: list[ak.Array] = []
+                for param_tuple in flat_params:
+                    idx: int = int(param_tuple["1"])
+                    new_structure.append(list_a.structure[..., idx:idx+1])
+                new_structure: ak.Array = ak.concatenate(new_structure, axis=0)
+
+                flat_data_out: list[Part.Shape] = reorder_list(list_a.data, new_structure)
+                result: NestedData = NestedData(
+                    flat_data_out, array_structure(new_structure)
+                )
+            else:
+                result: ak.Array = ak.Array([0])
+        else:
+            mask: ak.Array = self.input_data(1, args)
+
+            if ak.any(mask, axis=None):
+                if isinstance(list_a, ak.Array):
+                    list_a, mask = ak.broadcast_arrays(list_a, mask)
+                    result: ak.Array = list_a[mask]
+
+                elif isinstance(list_a, NestedData):
+                    list_a_struct, mask = ak.broadcast_arrays(list_a.structure, mask)
+                    new_structure: ak.Array = list_a_struct[mask]
+                    flat_data_out: list[Part.Shape] = reorder_list(list_a.data, new_structure)
+                    result: NestedData = NestedData(
+                        flat_data_out, array_structure(new_structure)
+                    )
+            else:
+                result: ak.Array = ak.Array([0])
+
+        if is_vector and isinstance(result, ak.Array) and len(result.fields) == 3:
+            result: NestedVector = NestedVector.from_record(result)
+
+        return result
 
 # --------------- Serialization ---------------
 
@@ -23,9 +23,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, cast
 import importlib
-import warnings
-import inspect
-import time
 
 import awkward as ak
 import numpy as np
@@ -33,8 +30,9 @@ import numpy as np
 import PySide2.QtCore as QtCore
 import PySide2.QtWidgets as QtWidgets
 
-from utils import unflatten_array_like, flatten_record, unflatten_record_like
-from node_item import NodeItem
+from utils import unflatten_array_like, flatten_record
+from nested_data import NestedVector
+from node_item import NodeItem, node_eval
 from input_widgets import OptionBoxWidget
 from sockets.value_line import ValueLine
 from sockets.bool_checkbox import BoolCheckBox
@@ -44,11 +42,10 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class RandomFunctions(NodeItem):
     REG_NAME: str = "Random Functions"
+    IS_PURE: bool = True
+    OPTIONS: list[str] = ["Value", "Boolean", "Vector"]
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -58,7 +55,7 @@ class RandomFunctions(NodeItem):
         self._option_box: OptionBoxWidget = OptionBoxWidget(undo_stack)
         self._option_box.setFocusPolicy(QtCore.Qt.NoFocus)
         self._option_box.setMinimumWidth(5)
-        self._option_box.addItems(["Value", "Boolean", "Vector"])
+        self._option_box.addItems(self.OPTIONS)
         for option_idx in range(self._option_box.count()):
             self._option_box.model().setData(self._option_box.model().index(option_idx, 0), QtCore.QSize(160, 24),
                                              QtCore.Qt.SizeHintRole)
@@ -173,93 +170,65 @@ class RandomFunctions(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        template: ak.Array = self.input_data(0, args)
-
-                        if DEBUG:
-                            x: float = time.time()
-
-                        if self._option_box.currentText() == "Value":
-                            lower_limit: ak.Array = self.input_data(1, args)
-                            upper_limit: ak.Array = self.input_data(2, args)
-                            seed: ak.Array = self.input_data(3, args)
-
-                            np.random.seed(int(ak.flatten(seed, axis=None)[0]))
-
-                            broadcasted_params: ak.Array = ak.zip({"template": 0, "min": lower_limit,
-                                                                   "max": upper_limit}, right_broadcast=True)
-                            flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                            template_len: int = ak.num(ak.flatten(template, axis=None), axis=0)
-                            result_list: list[ak.Array] = []
-                            for param_tuple in flat_params:
-                                flat_rand: np.ndarray = np.random.randint(
-                                    param_tuple["1"], param_tuple["2"] + 1,  template_len
-                                )
-                                result_list.append(unflatten_array_like(ak.from_numpy(flat_rand), template))
-
-                            result: ak.Array = ak.concatenate(result_list, axis=0)
-
-                        elif self._option_box.currentText() == "Boolean":
-                            seed: ak.Array = self.input_data(1, args)
-
-                            np.random.seed(int(ak.flatten(seed, axis=None)[0]))
-
-                            template_len: int = ak.num(ak.flatten(template, axis=None), axis=0)
-                            flat_rand: np.random = np.random.randint(0, 2,  template_len)
-                            result: ak.Array = unflatten_array_like(
-                                ak.from_numpy(flat_rand.astype(dtype=bool)), template
-                            )
-                            result: ak.Array = ak.Array(result)
-
-                        else:
-                            lower_limit: ak.Array = self.input_data(1, args)
-                            upper_limit: ak.Array = self.input_data(2, args)
-                            seed: ak.Array = self.input_data(3, args)
-
-                            np.random.seed(int(ak.flatten(seed, axis=None)[0]))
-
-                            broadcasted_params: ak.Array = ak.zip({"template": 0, "min": lower_limit,
-                                                                   "max": upper_limit}, right_broadcast=True)
-                            flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
-
-                            template_len: int = ak.num(ak.flatten(template.x, axis=None), axis=0)
-                            result_list: list[ak.Array] = []
-                            for param_tuple in flat_params:
-                                flat_rand: np.ndarray = np.random.randint(
-                                    param_tuple["1"], param_tuple["2"] + 1, [template_len, 3]
-                                )
-                                flat_rand: ak.Array = ak.zip(
-                                    {"x": flat_rand[:, 0], "y": flat_rand[:, 1], "z": flat_rand[:, 2]}
-                                )
-                                result_list.append(unflatten_record_like(flat_rand, template))
-
-                            result: ak.Array = ak.concatenate(result_list, axis=0)
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            y: float = time.time()
-                            print("Random Functions executed in", "{number:.{digits}f}".format(number=1000 * (y - x),
-                                                                                               digits=2), "ms")
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        template: ak.Array = self.input_data(0, args)
+
+        if self._option_box.currentText() == "Value":
+            lower_limit: ak.Array = self.input_data(1, args)
+            upper_limit: ak.Array = self.input_data(2, args)
+            seed: ak.Array = self.input_data(3, args)
+
+            np.random.seed(int(ak.flatten(seed, axis=None)[0]))
+
+            broadcasted_params: ak.Array = ak.zip({"template": 0, "min": lower_limit,
+                                                   "max": upper_limit}, right_broadcast=True)
+            flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
+
+            template_len: int = ak.num(ak.flatten(template, axis=None), axis=0)
+            result_list: list[ak.Array] = []
+            for param_tuple in flat_params:
+                flat_rand: np.ndarray = np.random.randint(
+                    param_tuple["1"], param_tuple["2"] + 1,  template_len
+                )
+                result_list.append(unflatten_array_like(ak.from_numpy(flat_rand), template))
+
+            result: ak.Array = ak.concatenate(result_list, axis=0)
+
+        elif self._option_box.currentText() == "Boolean":
+            seed: ak.Array = self.input_data(1, args)
+
+            np.random.seed(int(ak.flatten(seed, axis=None)[0]))
+
+            template_len: int = ak.num(ak.flatten(template, axis=None), axis=0)
+            flat_rand: np.random = np.random.randint(0, 2,  template_len)
+            result: ak.Array = unflatten_array_like(
+                ak.from_numpy(flat_rand.astype(dtype=bool)), template
+            )
+            result: ak.Array = ak.Array(result)
+
+        else:
+            lower_limit: ak.Array = self.input_data(1, args)
+            upper_limit: ak.Array = self.input_data(2, args)
+            seed: ak.Array = self.input_data(3, args)
+
+            np.random.seed(int(ak.flatten(seed, axis=None)[0]))
+
+            broadcasted_params: ak.Array = ak.zip({"template": 0, "min": lower_limit,
+                                                   "max": upper_limit}, right_broadcast=True)
+            flat_params: ak.Array = flatten_record(nested_record=broadcasted_params, as_tuple=True)
+
+            template_len: int = len(template)
+            result_list: list[NestedVector] = []
+            for param_tuple in flat_params:
+                flat_rand: np.ndarray = np.random.randint(
+                    param_tuple["1"], param_tuple["2"] + 1, [template_len, 3]
+                )
+                result_list.append(NestedVector(flat_rand, template.offsets))
+
+            result: NestedVector = NestedVector.concatenate(result_list)
+
+        return result
 
 # --------------- Serialization ---------------
 
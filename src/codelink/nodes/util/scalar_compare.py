@@ -23,16 +23,13 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, cast
 import importlib
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
 import PySide2.QtCore as QtCore
 import PySide2.QtWidgets as QtWidgets
 
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from input_widgets import OptionBoxWidget
 from sockets.value_line import ValueLine
 from sockets.bool_checkbox import BoolCheckBox
@@ -41,11 +38,10 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class ScalarCompare(NodeItem):
     REG_NAME: str = "Scalar Compare"
+    IS_PURE: bool = True
+    OPTIONS: list[str] = ["Greater", "Greater or Equal", "Smaller", "Smaller or Equal", "Equal"]
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -55,7 +51,7 @@ class ScalarCompare(NodeItem):
         self._option_box: OptionBoxWidget = OptionBoxWidget(undo_stack)
         self._option_box.setFocusPolicy(QtCore.Qt.NoFocus)
         self._option_box.setMinimumWidth(5)
-        self._option_box.addItems(["Greater", "Greater or Equal", "Smaller", "Smaller or Equal", "Equal"])
+        self._option_box.addItems(self.OPTIONS)
         for option_idx in range(self._option_box.count()):
             self._option_box.model().setData(self._option_box.model().index(option_idx, 0), QtCore.QSize(160, 24),
                                              QtCore.Qt.SizeHintRole)
@@ -95,52 +91,27 @@ class ScalarCompare(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        a: ak.Array = self.input_data(0, args)
-                        b: ak.Array = self.input_data(1, args)
-
-                        if DEBUG:
-                            x: float = time.time()
-
-                        if self._option_box.currentText() == "Greater":
-                            result: ak.Array = ak.Array(a > b)
-
-                        elif self._option_box.currentText() == "Greater or Equal":
-                            result: ak.Array = ak.Array(a >= b)
-
-                        elif self._option_box.currentText() == "Smaller":
-                            result: ak.Array = ak.Array(a < b)
+        a: ak.Array = self.input_data(0, args)
+        b: ak.Array = self.input_data(1, args)
 
-                        elif self._option_box.currentText() == "Smaller or Equal":
-                            result: ak.Array = ak.Array(a <= b)
+        if self._option_box.currentText() == "Greater":
+            result: ak.Array = ak.Array(a > b)
 
-                        elif self._option_box.currentText() == "Equal":
-                            result: ak.Array = ak.Array(a == b)
+        elif self._option_box.currentText() == "Greater or Equal":
+            result: ak.Array = ak.Array(a >= b)
 
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
+        elif self._option_box.currentText() == "Smaller":
+            result: ak.Array = ak.Array(a < b)
 
-                        if DEBUG:
-                            y: float = time.time()
-                            print("Scalar Compare executed in", "{number:.{digits}f}".format(number=1000 * (y - x),
-                                                                                             digits=2), "ms")
+        elif self._option_box.currentText() == "Smaller or Equal":
+            result: ak.Array = ak.Array(a <= b)
 
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
+        elif self._option_box.currentText() == "Equal":
+            result: ak.Array = ak.Array(a == b)
 
-        return self._cache[cache_idx]
+        return result
 
 # --------------- Serialization ---------------
 
@@ -23,9 +23,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, cast
 import importlib
-import warnings
-import inspect
-import time
 
 import numpy as np
 import awkward as ak
@@ -33,7 +30,7 @@ import awkward as ak
 import PySide2.QtCore as QtCore
 import PySide2.QtWidgets as QtWidgets
 
-from node_item import NodeItem
+from node_item import NodeItem, node_eval
 from input_widgets import OptionBoxWidget
 from sockets.value_line import ValueLine
 
@@ -41,11 +38,10 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class ScalarTrigonometric(NodeItem):
     REG_NAME: str = "Scalar Trigonometric"
+    IS_PURE: bool = True
+    OPTIONS: list[str] = ["Sin", "Cos", "Tan", "ASin", "ACos", "ATan"]
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -55,7 +51,7 @@ class ScalarTrigonometric(NodeItem):
         self._option_box: OptionBoxWidget = OptionBoxWidget(undo_stack)
         self._option_box.setFocusPolicy(QtCore.Qt.NoFocus)
         self._option_box.setMinimumWidth(5)
-        self._option_box.addItems(["Sin", "Cos", "Tan", "ASin", "ACos", "ATan"])
+        self._option_box.addItems(self.OPTIONS)
         for option_idx in range(self._option_box.count()):
             self._option_box.model().setData(self._option_box.model().index(option_idx, 0), QtCore.QSize(160, 24),
                                              QtCore.Qt.SizeHintRole)
@@ -94,54 +90,29 @@ class ScalarTrigonometric(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> list:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        a: list = self.input_data(0, args)
-
-                        if DEBUG:
-                            x: float = time.time()
-
-                        if self._option_box.currentText() == "Sin":
-                            result: np.ndarray = np.sin(ak.Array(a))
-
-                        elif self._option_box.currentText() == "Cos":
-                            result: np.ndarray = np.cos(ak.Array(a))
-
-                        elif self._option_box.currentText() == "Tan":
-                            result: np.ndarray = np.tan(ak.Array(a))
+        a: list = self.input_data(0, args)
 
-                        elif self._option_box.currentText() == "ASin":
-                            result: np.ndarray = np.arcsin(ak.Array(a))
+        if self._option_box.currentText() == "Sin":
+            result: np.ndarray = np.sin(ak.Array(a))
 
-                        elif self._option_box.currentText() == "ACos":
-                            result: np.ndarray = np.arcsin(ak.Array(a))
+        elif self._option_box.currentText() == "Cos":
+            result: np.ndarray = np.cos(ak.Array(a))
 
-                        elif self._option_box.currentText() == "ATan":
-                            result: np.ndarray = np.arctan(ak.Array(a))
+        elif self._option_box.currentText() == "Tan":
+            result: np.ndarray = np.tan(ak.Array(a))
 
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
+        elif self._option_box.currentText() == "ASin":
+            result: np.ndarray = np.arcsin(ak.Array(a))
 
-                        if DEBUG:
-                            y: float = time.time()
-                            print("Scalar Trig executed in", "{number:.{digits}f}".format(number=1000 * (y - x),
-                                                                                          digits=2), "ms")
+        elif self._option_box.currentText() == "ACos":
+            result: np.ndarray = np.arcsin(ak.Array(a))
 
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
+        elif self._option_box.currentText() == "ATan":
+            result: np.ndarray = np.arctan(ak.Array(a))
 
-        return self._cache[cache_idx]
+        return result
 
 # --------------- Serialization ---------------
 
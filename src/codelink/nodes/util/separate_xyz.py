@@ -22,15 +22,13 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import warnings
-import inspect
-import time
 
 import awkward as ak
 
 import PySide2.QtWidgets as QtWidgets
 
-from node_item import NodeItem
+from nested_data import NestedVector
+from node_item import NodeItem, node_eval
 from sockets.vector_none import VectorNone
 from sockets.value_line import ValueLine
 
@@ -38,11 +36,9 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class SeparateXYZ(NodeItem):
     REG_NAME: str = "Separate XYZ"
+    IS_PURE: bool = True
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -62,85 +58,26 @@ class SeparateXYZ(NodeItem):
 
     # --------------- Node eval methods ---------------
 
+    @node_eval(0)
     def eval_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        vector: ak.Array = self.input_data(0, args)
-
-                        if DEBUG:
-                            a: float = time.time()
-
-                        result: ak.Array = vector.x
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
-
-                        if DEBUG:
-                            b: float = time.time()
-                            print("Separate XYZ executed in", "{number:.{digits}f}".format(number=1000 * (b - a),
-                                                                                           digits=2), "ms")
+        vector: NestedVector = self.input_data(0, args)
 
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
+        result: ak.Array = vector.x
 
-        return self._cache[cache_idx]
+        return result
 
+    @node_eval(1)
     def eval_1(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
+        vector: NestedVector = self.input_data(0, args)
 
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        vector: ak.Array = self.input_data(0, args)
+        result: ak.Array = vector.y
 
-                        result: ak.Array = vector.y
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(1, result)
-
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
-
-        return self._cache[cache_idx]
+        return result
 
+    @node_eval(2)
     def eval_2(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        vector: ak.Array = self.input_data(0, args)
-
-                        result: ak.Array = vector.z
-
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(2, result)
+        vector: NestedVector = self.input_data(0, args)
 
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
+        result: ak.Array = vector.z
 
-        return self._cache[cache_idx]
+        return result
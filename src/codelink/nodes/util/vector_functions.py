@@ -21,19 +21,16 @@
 # ***************************************************************************
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, Optional, Union, cast
 import importlib
-import warnings
-import inspect
-import time
 
-import numpy as np
 import awkward as ak
 
 import PySide2.QtCore as QtCore
 import PySide2.QtWidgets as QtWidgets
 
-from node_item import NodeItem
+from nested_data import NestedVector
+from node_item import NodeItem, node_eval
 from input_widgets import OptionBoxWidget
 from sockets.vector_none import VectorNone
 from sockets.value_line import ValueLine
@@ -42,11 +39,10 @@ if TYPE_CHECKING:
     from socket_widget import SocketWidget
 
 
-DEBUG = True
-
-
 class VectorFunctionsAk(NodeItem):
     REG_NAME: str = "Vector Functions"
+    IS_PURE: bool = True
+    OPTIONS: list[str] = ["Add", "Sub", "Mul", "Div", "Cross", "Dot", "Scale", "Length", "Normalize"]
 
     def __init__(self, pos: tuple, undo_stack: QtWidgets.QUndoStack, name: str = REG_NAME,
                  parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
@@ -56,7 +52,7 @@ class VectorFunctionsAk(NodeItem):
         self._option_box: OptionBoxWidget = OptionBoxWidget(undo_stack)
         self._option_box.setFocusPolicy(QtCore.Qt.NoFocus)
         self._option_box.setMinimumWidth(5)
-        self._option_box.addItems(["Add", "Sub", "Mul", "Div", "Cross", "Dot", "Scale", "Length"])
+        self._option_box.addItems(self.OPTIONS)
         for option_idx in range(self._option_box.count()):
             self._option_box.model().setData(self._option_box.model().index(option_idx, 0), QtCore.QSize(160, 24),
                                              QtCore.Qt.SizeHintRole)
@@ -77,83 +73,9 @@ class VectorFunctionsAk(NodeItem):
                        parent_node=self)
         ]
 
-        ak.behavior[np.add, "Vector3D", "Vector3D"] = self.vector_add
-        ak.behavior[np.subtract, "Vector3D", "Vector3D"] = self.vector_sub
-        ak.behavior[np.multiply, "Vector3D", "Vector3D"] = self.vector_mul
-        ak.behavior[np.divide, "Vector3D", "Vector3D"] = self.vector_div
-        ak.behavior[np.absolute, "Vector3D"] = self.vector_length
-
         # Listeners
         cast(QtCore.SignalInstance, self._option_box.currentIndexChanged).connect(self.update_socket_widgets)
 
-    @staticmethod
-    def vector_add(a, b) -> ak.contents.RecordArray:
-        return ak.contents.RecordArray(
-            [
-                ak.to_layout(a.x + b.x),
-                ak.to_layout(a.y + b.y),
-                ak.to_layout(a.z + b.z),
-            ],
-            ["x", "y", "z"],
-            parameters={"__record__": "Vector3D"},
-        )
-
-    @staticmethod
-    def vector_sub(a, b) -> ak.contents.RecordArray:
-        return ak.contents.RecordArray(
-            [
-                ak.to_layout(a.x - b.x),
-                ak.to_layout(a.y - b.y),
-                ak.to_layout(a.z - b.z),
-            ],
-            ["x", "y", "z"],
-            parameters={"__record__": "Vector3D"},
-        )
-
-    @staticmethod
-    def vector_mul(a, b) -> ak.contents.RecordArray:
-        return ak.contents.RecordArray(
-            [
-                ak.to_layout(a.x * b.x),
-                ak.to_layout(a.y * b.y),
-                ak.to_layout(a.z * b.z),
-            ],
-            ["x", "y", "z"],
-            parameters={"__record__": "Vector3D"},
-        )
-
-    @staticmethod
-    def vector_div(a, b) -> ak.contents.RecordArray:
-        return ak.contents.RecordArray(
-            [
-                ak.to_layout(a.x / b.x),
-                ak.to_layout(a.y / b.y),
-                ak.to_layout(a.z / b.z),
-            ],
-            ["x", "y", "z"],
-            parameters={"__record__": "Vector3D"},
-        )
-
-    @staticmethod
-    def vector_cross(a, b) -> ak.contents.RecordArray:
-        return ak.contents.RecordArray(
-            [
-                ak.to_layout(a.y * b.z - a.z * b.y),
-                ak.to_layout(a.z * b.x - a.x * b.z),
-                ak.to_layout(a.x * b.y - a.y * b.x),
-            ],
-            ["x", "y", "z"],
-            parameters={"__record__": "Vector3D"},
-        )
-
-    @staticmethod
-    def vector_dot(a, b) -> ak.Array:
-        return ak.Array(a.x * b.x + a.y * b.y + a.z * b.z)
-
-    @staticmethod
-    def vector_length(a) -> np.ndarray:
-        return np.sqrt(a.x**2 + a.y**2 + a.z**2)
-
     def update_socket_widgets(self) -> None:
         # Hack to prevent cyclic imports
         add_socket_cmd_cls: type = getattr(importlib.import_module("undo_commands"), "AddSocketCommand")
@@ -252,6 +174,25 @@ class VectorFunctionsAk(NodeItem):
                 )
                 self._undo_stack.push(add_socket_cmd_cls(self, new_socket_widget, 1))
 
+        elif current_option_name == "Normalize":
+            if len(self.input_socket_widgets) > 1:
+                remove_socket: SocketWidget = self._socket_widgets[1]
+                for edge in remove_socket.pin.edges:
+                    self._undo_stack.push(remove_edge_cmd_cls(self.scene(), edge, True))
+                self._undo_stack.push(remove_socket_cmd_cls(self, 1))
+
+            if type(self._socket_widgets[1]) != VectorNone:
+                remove_socket: SocketWidget = self._socket_widgets[1]
+                for edge in remove_socket.pin.edges:
+                    self._undo_stack.push(remove_edge_cmd_cls(self.scene(), edge, True))
+                self._undo_stack.push(remove_socket_cmd_cls(self, 1))
+
+                new_socket_widget: VectorNone = VectorNone(
+                    undo_stack=self._undo_stack, name="Res", content_value="<No Input>", is_input=False,
+                    parent_node=self
+                )
+                self._undo_stack.push(add_socket_cmd_cls(self, new_socket_widget, 1))
+
         else:
             if len(self.input_socket_widgets) == 2:
                 if type(self._socket_widgets[1]) != VectorNone:
@@ -292,73 +233,45 @@ class VectorFunctionsAk(NodeItem):
 
     # --------------- Node eval methods ---------------
 
-    def eval_0(self, *args) -> ak.Array:
-        cache_idx: int = int(inspect.stack()[0][3].split("_")[-1])
-
-        if self._is_invalid or self._cache[cache_idx] is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error")
-                try:
-                    try:
-                        a: ak.Array = ak.Array(self.input_data(0, args), with_name="Vector3D")
-
-                        if DEBUG:
-                            x: float = time.time()
-
-                        if len(args) == 1:
-                            if self._option_box.currentText() == "Length":
-                                result: ak.Array = np.absolute(a)
-
-                        if len(args) == 2:
-                            if self._option_box.currentText() in ("Add", "Sub", "Mul", "Div", "Cross", "Dot", ):
-                                b: ak.Array = ak.Array(self.input_data(1, args), with_name="Vector3D")
+    @node_eval(0)
+    def eval_0(self, *args) -> Union[NestedVector, ak.Array]:
+        a: NestedVector = self.input_data(0, args)
 
-                                if self._option_box.currentText() == "Add":
-                                    result: ak.Array = a + b
+        if len(args) == 1:
+            if self._option_box.currentText() == "Length":
+                result: ak.Array = a.length()
 
-                                elif self._option_box.currentText() == "Sub":
-                                    result: ak.Array = a - b
+            elif self._option_box.currentText() == "Normalize":
+                result: NestedVector = a.normalized()
 
-                                elif self._option_box.currentText() == "Mul":
-                                    result: ak.Array = a * b
+        if len(args) == 2:
+            if self._option_box.currentText() in ("Add", "Sub", "Mul", "Div", "Cross", "Dot", ):
+                b: NestedVector = self.input_data(1, args)
 
-                                elif self._option_box.currentText() == "Div":
-                                    result: ak.Array = a / b
+                if self._option_box.currentText() == "Add":
+                    result: NestedVector = a + b
 
-                                elif self._option_box.currentText() == "Cross":
-                                    ak.behavior[np.multiply, "Vector3D", "Vector3D"] = self.vector_cross
-                                    result: ak.Array = a * b
-                                    ak.behavior[np.multiply, "Vector3D", "Vector3D"] = self.vector_mul
+                elif self._option_box.currentText() == "Sub":
+                    result: NestedVector = a - b
 
-                                elif self._option_box.currentText() == "Dot":
-                                    ak.behavior[np.multiply, "Vector3D", "Vector3D"] = self.vector_dot
-                                    result: ak.Array = a * b
-                                    ak.behavior[np.multiply, "Vector3D", "Vector3D"] = self.vector_mul
+                elif self._option_box.currentText() == "Mul":
+                    result: NestedVector = a * b
 
-                            elif self._option_box.currentText() == "Scale":
-                                b: ak.Array = self.input_data(1, args)
+                elif self._option_box.currentText() == "Div":
+                    result: NestedVector = a / b
 
-                                b_vec: ak.Array = ak.zip({"x": b, "y": b, "z": b})
-                                b_vec: ak.Array = ak.Array(b_vec, with_name="Vector3D")
-                                result: ak.Array = a * b_vec
+                elif self._option_box.currentText() == "Cross":
+                    result: NestedVector = a.cross(b)
 
-                        self._is_dirty: bool = False
-                        self._is_invalid: bool = False
-                        self._cache[cache_idx] = self.output_data(0, result)
+                elif self._option_box.currentText() == "Dot":
+                    result: ak.Array = a.dot(b)
 
-                        if DEBUG:
-                            y: float = time.time()
-                            print("Vector Functions executed in", "{number:.{digits}f}".format(number=1000 * (y - x),
-                                                                                               digits=2), "ms")
+            elif self._option_box.currentText() == "Scale":
+                b: ak.Array = self.input_data(1, args)
 
-                    except Exception as e:
-                        self._is_dirty: bool = True
-                        print(e)
-                except Warning as e:
-                    self._is_dirty: bool = True
-                    print(e)
+                result: NestedVector = a * b
 
-        return self._cache[cache_idx]
+        return result
 
     # --------------- Serialization ---------------
 
@@ -21,7 +21,7 @@
 # ***************************************************************************
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import PySide2.QtCore as QtCore
 import PySide2.QtWidgets as QtWidgets
@@ -116,6 +116,19 @@ class PinItem(QtWidgets.QGraphicsItem):
 
     # --------------- Overwrites ---------------
 
+    def itemChange(self, change: QtWidgets.QGraphicsItem.GraphicsItemChange, value: Any) -> Any:
+        if change == QtWidgets.QGraphicsItem.GraphicsItemChange.ItemScenePositionHasChanged:
+            # Also sent when the parent node moved
+            for edge in self._edges:
+                edge.update_geometry()
+            if self.scene() is not None:
+                self.scene().update_spatial_item(self)
+        elif change == QtWidgets.QGraphicsItem.GraphicsItemChange.ItemSceneChange and self.scene() is not None:
+            self.scene().remove_spatial_item(self)
+        elif change == QtWidgets.QGraphicsItem.GraphicsItemChange.ItemSceneHasChanged and self.scene() is not None:
+            self.scene().update_spatial_item(self)
+        return super().itemChange(change, value)
+
     def hoverEnterEvent(self, event: QtWidgets.QGraphicsSceneHoverEvent) -> None:
         super().hoverEnterEvent(event)
         QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.CrossCursor)
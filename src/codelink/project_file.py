@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2023 Ronny Scharf-W. <ronny.scharf08@gmail.com>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+from __future__ import annotations
+from typing import Any
+import os
+import io
+import json
+import zipfile
+
+import numpy as np
+
+from result_cache import RESULT_CACHE, SESSION_KEY_PREFIX
+
+
+FORMAT_NAME: str = "Codelink"
+FORMAT_VERSION: int = 1
+FILE_SUFFIX: str = ".codelink"
+HEADER_NAME: str = "header.json"
+ROOT_NAME: str = "graphs/root.json"
+STORE_RESULTS: bool = True
+
+
+def is_project_file(file_path: str) -> bool:
+    # False for the plain JSON files written by earlier versions
+    return zipfile.is_zipfile(file_path)
+
+
+# --------------- Result encoding ---------------
+
+def pack_disk_value(disk_value: Any, arrays: dict[str, np.ndarray]) -> Any:
+    # JSON compatible copy of a result cache disk value, its NumPy buffers are moved into arrays
+    if isinstance(disk_value, np.ndarray):
+        if disk_value.dtype.hasobject:
+            raise TypeError("Object arrays can not be stored in a project file")
+        array_name: str = "a" + str(len(arrays))
+        arrays[array_name] = disk_value
+        return {"Array": array_name}
+
+    elif isinstance(disk_value, tuple):
+        return {"Tuple": [pack_disk_value(item, arrays) for item in disk_value]}
+
+    elif isinstance(disk_value, list):
+        return [pack_disk_value(item, arrays) for item in disk_value]
+
+    elif isinstance(disk_value, dict):
+        return {"Dict": {str(key): pack_disk_value(value, arrays) for key, value in disk_value.items()}}
+
+    elif isinstance(disk_value, (bool, int, float, str)) or disk_value is None:
+        return disk_value
+
+    else:
+        raise TypeError("Value type " + type(disk_value).__name__ + " can not be stored in a project file")
+
+
+def unpack_disk_value(packed_value: Any, arrays: dict[str, np.ndarray]) -> Any:
+    if isinstance(packed_value, dict):
+        if "Array" in packed_value:
+            return arrays[packed_value["Array"]]
+        elif "Tuple" in packed_value:
+            return tuple(unpack_disk_value(item, arrays) for item in packed_value["Tuple"])
+        else:
+            return {key: unpack_disk_value(value, arrays) for key, value in packed_value["Dict"].items()}
+
+    elif isinstance(packed_value, list):
+        return [unpack_disk_value(item, arrays) for item in packed_value]
+
+    else:
+        return packed_value
+
+
+# --------------- Writing ---------------
+
+def split_sub_graphs(dag_dict: dict, chunks: dict[str, dict]) -> dict:
+    # Moves every non empty sub graph into its own chunk and leaves a reference in its group node
+    split_nodes: list[dict] = []
+    for node_dict in dag_dict["Nodes"]:
+        sub_graph: dict = node_dict["Subgraph"]
+        if len(sub_graph["Nodes"]) > 0:
+            chunk_name: str = "graphs/" + str(len(chunks) + 1) + ".json"
+            chunks[chunk_name] = {}
+            chunks[chunk_name] = split_sub_graphs(sub_graph, chunks)
+            node_dict: dict = {**node_dict, "Subgraph": {"Chunk": chunk_name}}
+        split_nodes.append(node_dict)
+
+    return {**dag_dict, "Nodes": split_nodes}
+
+
+def write_project(file_path: str, dag_dict: dict, results: dict[str, Any]) -> None:
+    # Zip container with a header index, one JSON chunk per (sub) graph and optionally the group outputs. Results are
+    # stored as data only, i.e. JSON plus an npz archive of their buffers, so opening a file never runs its content.
+    chunks: dict[str, dict] = {}
+    root_dict: dict = split_sub_graphs(dag_dict, chunks)
+
+    result_blobs: dict[str, tuple[bytes, bytes]] = {}
+    if STORE_RESULTS:
+        for key, value in results.items():
+            if key.startswith(SESSION_KEY_PREFIX):
+                continue
+            try:
+                arrays: dict[str, np.ndarray] = {}
+                packed_value: Any = pack_disk_value(RESULT_CACHE.to_disk_value(value), arrays)
+            except TypeError:
+                continue
+
+            array_buffer: io.BytesIO = io.BytesIO()
+            np.savez(array_buffer, **arrays)
+            result_blobs[key] = (json.dumps(packed_value).encode(), array_buffer.getvalue())
+
+    header: dict = {
+        "Format": FORMAT_NAME,
+        "Version": FORMAT_VERSION,
+        "Root": ROOT_NAME,
+        "Chunks": {name: {"Nodes": len(chunk["Nodes"])} for name, chunk in chunks.items()},
+        "Results": list(result_blobs.keys())
+    }
+
+    tmp_path: str = file_path + ".tmp"
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(HEADER_NAME, json.dumps(header, indent=4))
+        archive.writestr(ROOT_NAME, json.dumps(root_dict, separators=(",", ":")))
+        for name, chunk in chunks.items():
+            archive.writestr(name, json.dumps(chunk, separators=(",", ":")))
+        for key, (value_blob, array_blob) in result_blobs.items():
+            archive.writestr("results/" + key + ".json", value_blob)
+            archive.writestr("results/" + key + ".npz", array_blob, compress_type=zipfile.ZIP_STORED)
+    os.replace(tmp_path, file_path)
+
+
+# --------------- Reading ---------------
+
+class ProjectFile:
+    # Reads the container once, graph chunks are only parsed when requested
+
+    def __init__(self, file_path: str) -> None:
+        with zipfile.ZipFile(file_path, "r") as archive:
+            self._header: dict = json.loads(archive.read(HEADER_NAME))
+            if self._header.get("Format") != FORMAT_NAME or self._header.get("Version", 0) > FORMAT_VERSION:
+                raise ValueError("Unsupported project file: " + file_path)
+
+            self._members: dict[str, bytes] = {
+                name: archive.read(name) for name in archive.namelist() if name != HEADER_NAME
+            }
+        self._results: dict[str, Any] = {}
+
+    @property
+    def header(self) -> dict:
+        return self._header
+
+    def graph(self, name: str) -> dict:
+        graph_dict: dict = json.loads(self._members[name])
+        for node_dict in graph_dict["Nodes"]:
+            if "Chunk" in node_dict["Subgraph"]:
+                node_dict["Subgraph"] = SubGraphChunk(self, node_dict["Subgraph"]["Chunk"])
+        return graph_dict
+
+    def root(self) -> dict:
+        return self.graph(self._header["Root"])
+
+    def result(self, key: str) -> Any:
+        # Stored result by key, unpacked on first request. Results are only served to the group nodes of this file.
+        if key not in self._results:
+            self._results[key] = self.read_result(key)
+        return self._results[key]
+
+    def read_result(self, key: str) -> Any:
+        if key not in self._header["Results"]:
+            return None
+
+        try:
+            with np.load(io.BytesIO(self._members["results/" + key + ".npz"]), allow_pickle=False) as npz_file:
+                arrays: dict[str, np.ndarray] = {name: npz_file[name] for name in npz_file.files}
+            packed_value: Any = json.loads(self._members["results/" + key + ".json"])
+            return RESULT_CACHE.from_disk_value(unpack_disk_value(packed_value, arrays))
+        except Exception as e:
+            print(e)
+            return None
+
+
+class SubGraphChunk:
+    # Stands in for the serialized sub graph of a group node until the node's sub scene is first accessed
+
+    def __init__(self, project_file: ProjectFile, name: str) -> None:
+        self._project_file: ProjectFile = project_file
+        self._name: str = name
+
+    def load(self) -> dict:
+        return self._project_file.graph(self._name)
+
+    def result(self, key: str) -> Any:
+        return self._project_file.result(key)
+
+    def expanded(self) -> dict:
+        # Plain serialized sub graph, with all nested chunks resolved
+        graph_dict: dict = self.load()
+        for node_dict in graph_dict["Nodes"]:
+            if isinstance(node_dict["Subgraph"], SubGraphChunk):
+                node_dict["Subgraph"] = node_dict["Subgraph"].expanded()
+        return graph_dict
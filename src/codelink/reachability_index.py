@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2023 Ronny Scharf-W. <ronny.scharf08@gmail.com>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from __future__ import annotations
+from typing import Hashable, Optional
+from collections import deque
+
+
+class ReachabilityIndex:
+    # Adjacency of a dependency graph together with a topological order of its vertices. The order is repaired locally
+    # on every edge insertion (Pearce & Kelly, "A dynamic topological sort algorithm for directed acyclic graphs"), so
+    # asking whether a new edge would close a cycle is a comparison of two order numbers in the common case and a
+    # search bounded by the affected order range otherwise. Edges are counted, parallel edges share one adjacency entry.
+    def __init__(self) -> None:
+        self._successors: dict[Hashable, dict[Hashable, int]] = {}
+        self._predecessors: dict[Hashable, dict[Hashable, int]] = {}
+        self._order: dict[Hashable, int] = {}
+        self._next_order: int = 0
+        self._is_acyclic: bool = True
+
+    @property
+    def is_acyclic(self) -> bool:
+        return self._is_acyclic
+
+    def clear(self) -> None:
+        self._successors: dict[Hashable, dict[Hashable, int]] = {}
+        self._predecessors: dict[Hashable, dict[Hashable, int]] = {}
+        self._order: dict[Hashable, int] = {}
+        self._next_order: int = 0
+        self._is_acyclic: bool = True
+
+    def add_vertex(self, vertex: Hashable) -> None:
+        if vertex not in self._order:
+            self._successors[vertex] = {}
+            self._predecessors[vertex] = {}
+            self._order[vertex] = self._next_order
+            self._next_order += 1
+
+    def remove_vertex(self, vertex: Hashable) -> None:
+        if vertex not in self._order:
+            return
+
+        for successor in self._successors.pop(vertex):
+            del self._predecessors[successor][vertex]
+        for predecessor in self._predecessors.pop(vertex):
+            del self._successors[predecessor][vertex]
+        del self._order[vertex]
+
+        if not self._is_acyclic:
+            self._rebuild_order()
+
+    def has_edge(self, source: Hashable, target: Hashable) -> bool:
+        return target in self._successors.get(source, {})
+
+    def add_edge(self, source: Hashable, target: Hashable) -> None:
+        self.add_vertex(source)
+        self.add_vertex(target)
+
+        if target in self._successors[source]:
+            self._successors[source][target] += 1
+            self._predecessors[target][source] += 1
+            return
+
+        if self._is_acyclic:
+            lower_bound: int = self._order[target]
+            upper_bound: int = self._order[source]
+
+            if source == target:
+                self._is_acyclic: bool = False
+            elif lower_bound < upper_bound:
+                forward: Optional[set[Hashable]] = self._forward_range(target, upper_bound)
+                if forward is None:
+                    # The order cannot be repaired, it is rebuilt once the cycle is broken up again
+                    self._is_acyclic: bool = False
+                else:
+                    self._reorder(self._backward_range(source, lower_bound), forward)
+
+        self._successors[source][target] = 1
+        self._predecessors[target][source] = 1
+
+    def remove_edge(self, source: Hashable, target: Hashable) -> None:
+        if not self.has_edge(source, target):
+            return
+
+        self._successors[source][target] -= 1
+        self._predecessors[target][source] -= 1
+        if self._successors[source][target] == 0:
+            del self._successors[source][target]
+            del self._predecessors[target][source]
+
+            # Removing edges keeps a valid order valid
+            if not self._is_acyclic:
+                self._rebuild_order()
+
+    def creates_cycle(self, source: Hashable, target: Hashable) -> bool:
+        # True if the edge source -> target would close a cycle, i.e. if target already reaches source
+        if not self._is_acyclic or source == target:
+            return True
+
+        if source not in self._order or target not in self._order:
+            return False
+
+        upper_bound: int = self._order[source]
+        if upper_bound < self._order[target]:
+            # Everything reachable from target comes after it in the order, so source cannot be
+            return False
+
+        return self._forward_range(target, upper_bound) is None
+
+    # --------------- Order maintenance ---------------
+
+    def _forward_range(self, start: Hashable, upper_bound: int) -> Optional[set[Hashable]]:
+        # Vertices reachable from start with an order below upper_bound, None if the vertex at upper_bound is reached
+        visited: set[Hashable] = {start}
+        stack: list[Hashable] = [start]
+        while len(stack) > 0:
+            vertex: Hashable = stack.pop()
+            for successor in self._successors[vertex]:
+                successor_order: int = self._order[successor]
+                if successor_order == upper_bound:
+                    return None
+                if successor_order < upper_bound and successor not in visited:
+                    visited.add(successor)
+                    stack.append(successor)
+        return visited
+
+    def _backward_range(self, start: Hashable, lower_bound: int) -> set[Hashable]:
+        # Vertices reaching start with an order above lower_bound
+        visited: set[Hashable] = {start}
+        stack: list[Hashable] = [start]
+        while len(stack) > 0:
+            vertex: Hashable = stack.pop()
+            for predecessor in self._predecessors[vertex]:
+                if self._order[predecessor] > lower_bound and predecessor not in visited:
+                    visited.add(predecessor)
+                    stack.append(predecessor)
+        return visited
+
+    def _reorder(self, backward: set[Hashable], forward: set[Hashable]) -> None:
+        # Moves the backward range in front of the forward range, reusing the order numbers both ranges occupy
+        affected: list[Hashable] = (
+            sorted(backward, key=self._order.__getitem__) + sorted(forward, key=self._order.__getitem__)
+        )
+        slots: list[int] = sorted(self._order[vertex] for vertex in affected)
+        for vertex, slot in zip(affected, slots):
+            self._order[vertex] = slot
+
+    def _rebuild_order(self) -> None:
+        in_degrees: dict[Hashable, int] = {vertex: len(self._predecessors[vertex]) for vertex in self._order}
+        queue: deque[Hashable] = deque(vertex for vertex, in_degree in in_degrees.items() if in_degree == 0)
+
+        order: dict[Hashable, int] = {}
+        while len(queue) > 0:
+            vertex: Hashable = queue.popleft()
+            order[vertex] = len(order)
+            for successor in self._successors[vertex]:
+                in_degrees[successor] -= 1
+                if in_degrees[successor] == 0:
+                    queue.append(successor)
+
+        self._is_acyclic: bool = len(order) == len(self._order)
+        if self._is_acyclic:
+            self._order: dict[Hashable, int] = order
+            self._next_order: int = len(order)
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2023 Ronny Scharf-W. <ronny.scharf08@gmail.com>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from __future__ import annotations
+from typing import Any, Optional
+from collections import OrderedDict
+from pathlib import Path
+import os
+import pickle
+import hashlib
+
+import numpy as np
+import awkward as ak
+
+import Part
+
+from utils import data_nbytes, is_session_fingerprint, shape_from_brep
+from nested_data import NestedData, NestedVector
+
+
+MEMORY_BUDGET: int = 512 * 1024 ** 2
+SESSION_KEY_PREFIX: str = "~"
+
+
+class ResultCache:
+    # Content addressed LRU memo of node eval results, optionally backed by a directory that outlives the session
+
+    def __init__(self, memory_budget: int = MEMORY_BUDGET, disk_dir: Optional[str] = None) -> None:
+        self._memory_budget: int = memory_budget
+        self._disk_dir: Optional[Path] = None
+        self.disk_dir = disk_dir
+
+        self._entries: OrderedDict[str, tuple[Any, int, Any]] = OrderedDict()
+        self._memory_size: int = 0
+
+    @property
+    def memory_budget(self) -> int:
+        return self._memory_budget
+
+    @memory_budget.setter
+    def memory_budget(self, value: int) -> None:
+        self._memory_budget: int = value
+        self.evict()
+
+    @property
+    def disk_dir(self) -> Optional[Path]:
+        return self._disk_dir
+
+    @disk_dir.setter
+    def disk_dir(self, value: Optional[str]) -> None:
+        self._disk_dir: Optional[Path] = Path(value) if value is not None else None
+        if self._disk_dir is not None:
+            self._disk_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def memory_size(self) -> int:
+        return self._memory_size
+
+    # --------------- Keys ---------------
+
+    def key(self, node_cls: str, eval_idx: int, eval_state: Any, input_fingerprint: Any) -> str:
+        key_tuple: tuple = (node_cls, eval_idx, eval_state, input_fingerprint)
+        result_key: str = hashlib.blake2b(repr(key_tuple).encode(), digest_size=16).hexdigest()
+
+        # Keys of session bound inputs are never written to or looked up on disk
+        if is_session_fingerprint(input_fingerprint):
+            return SESSION_KEY_PREFIX + result_key
+        return result_key
+
+    def disk_path(self, key: str) -> Optional[Path]:
+        if self._disk_dir is None or key.startswith(SESSION_KEY_PREFIX):
+            return None
+        return self._disk_dir / (key + ".pkl")
+
+    # --------------- Lookup ---------------
+
+    def get(self, key: str) -> Any:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+        disk_path: Optional[Path] = self.disk_path(key)
+        if disk_path is not None and disk_path.exists():
+            try:
+                with open(disk_path, "rb") as disk_file:
+                    value: Any = self.from_disk_value(pickle.load(disk_file))
+                self.add_entry(key, value)
+                return value
+            except Exception as e:
+                print(e)
+
+        return None
+
+    def put(self, key: str, value: Any, input_fingerprint: Any = None) -> None:
+        self.add_entry(key, value, input_fingerprint)
+
+        disk_path: Optional[Path] = self.disk_path(key)
+        if disk_path is not None and not disk_path.exists():
+            tmp_path: Path = disk_path.with_suffix(".tmp")
+            try:
+                with open(tmp_path, "wb") as disk_file:
+                    pickle.dump(self.to_disk_value(value), disk_file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, disk_path)
+            except Exception as e:
+                tmp_path.unlink(missing_ok=True)
+                print(e)
+
+    def add_entry(self, key: str, value: Any, input_fingerprint: Any = None) -> None:
+        # Entries hold on to the input fingerprint of their key, session keys stay unique while the entry exists
+        if key in self._entries:
+            self._memory_size -= self._entries.pop(key)[1]
+
+        value_size: int = data_nbytes(value)
+        if value_size > self._memory_budget:
+            return
+
+        self._entries[key] = (value, value_size, input_fingerprint)
+        self._memory_size += value_size
+        self.evict()
+
+    def evict(self) -> None:
+        while self._memory_size > self._memory_budget and len(self._entries) > 0:
+            _, (_, value_size, _) = self._entries.popitem(last=False)
+            self._memory_size -= value_size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._memory_size: int = 0
+
+    # --------------- Disk serialization ---------------
+
+    def to_disk_value(self, value: Any) -> tuple:
+        if isinstance(value, ak.Array):
+            form, length, buffers = ak.to_buffers(value)
+            return "ak", form.to_json(), length, {key: np.asarray(buffer) for key, buffer in buffers.items()}
+
+        elif isinstance(value, NestedData):
+            return "nested", self.to_disk_value(value.data), self.to_disk_value(value.structure), value.fingerprint
+
+        elif isinstance(value, NestedVector):
+            return "vector", value.coords, value.offsets, value.fingerprint
+
+        elif isinstance(value, Part.Shape):
+            return "brep", value.exportBrepToString()
+
+        elif type(value) in (list, tuple):
+            return "list", [self.to_disk_value(item) for item in value], type(value) == tuple
+
+        elif isinstance(value, (bool, int, float, str)) or value is None:
+            return "raw", value
+
+        else:
+            raise TypeError("Result type " + type(value).__name__ + " can not be stored on disk")
+
+    def from_disk_value(self, disk_value: tuple) -> Any:
+        if disk_value[0] == "ak":
+            _, form, length, buffers = disk_value
+            return ak.from_buffers(ak.forms.from_json(form), length, buffers)
+
+        elif disk_value[0] == "nested":
+            _, data, structure, fingerprint = disk_value
+            nested_data: NestedData = NestedData(self.from_disk_value(data), self.from_disk_value(structure))
+            nested_data.fingerprint = fingerprint
+            return nested_data
+
+        elif disk_value[0] == "vector":
+            _, coords, offsets, fingerprint = disk_value
+            nested_vector: NestedVector = NestedVector(coords, offsets)
+            nested_vector.fingerprint = fingerprint
+            return nested_vector
+
+        elif disk_value[0] == "brep":
+            return shape_from_brep(disk_value[1])
+
+        elif disk_value[0] == "list":
+            _, items, is_tuple = disk_value
+            result: list = [self.from_disk_value(item) for item in items]
+            return tuple(result) if is_tuple else result
+
+        else:
+            return disk_value[1]
+
+
+RESULT_CACHE: ResultCache = ResultCache()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2023 Ronny Scharf-W. <ronny.scharf08@gmail.com>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+# Evaluates a saved graph without the editor, e.g.
+#   python -m codelink.run graph.json --set Box.L=20 --get Boolean.Out
+
+from __future__ import annotations
+from typing import Any
+import argparse
+import json
+import sys
+
+from codelink import path_loader  # noqa: F401, makes the editor modules importable
+
+from executors import EXECUTORS, THREADED
+from result_cache import RESULT_CACHE
+from headless import HeadlessGraph, HeadlessSocket, plain_data
+
+
+def parse_value(text: str) -> Any:
+    # JSON literals, anything else is taken as a string
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def main() -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m codelink.run", description="Evaluates a codelink graph without the editor."
+    )
+    parser.add_argument("graph", help="project or JSON file saved by the editor")
+    parser.add_argument("--set", action="append", default=[], metavar="NODE.SOCKET=VALUE",
+                        help="overrides the value of an unconnected input socket")
+    parser.add_argument("--get", action="append", default=[], metavar="NODE.SOCKET",
+                        help="output socket to evaluate, defaults to the graph results")
+    parser.add_argument("--executor", choices=EXECUTORS, default=THREADED)
+    parser.add_argument("--cache-dir", default=None, help="directory that keeps node results across runs")
+    parser.add_argument("--json", action="store_true", help="prints the results as one JSON object")
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.cache_dir is not None:
+        RESULT_CACHE.disk_dir = args.cache_dir
+
+    graph: HeadlessGraph = HeadlessGraph.load(args.graph)
+    graph.executor = args.executor
+
+    try:
+        for assignment in args.set:
+            socket_path, separator, value = assignment.partition("=")
+            if separator == "":
+                raise ValueError("Expected NODE.SOCKET=VALUE, got " + assignment)
+            graph.set_value(socket_path, parse_value(value))
+
+        targets: list[HeadlessSocket] = [graph.find_socket(socket_path, False) for socket_path in args.get]
+        results: dict[HeadlessSocket, Any] = graph.evaluate(targets if len(targets) > 0 else None)
+    except (KeyError, ValueError) as e:
+        print(e.args[0], file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps({socket_widget.path(): plain_data(value) for socket_widget, value in results.items()}))
+    else:
+        for socket_widget, value in results.items():
+            print(socket_widget.path() + ":", value)
+
+    # Failed evals are reported by the nodes and leave their outputs empty
+    failed: bool = any([
+        value is None or socket_widget.parent_node.is_dirty for socket_widget, value in results.items()
+    ])
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,7 +30,7 @@ import PySide2.QtWidgets as QtWidgets
 import PySide2.QtGui as QtGui
 
 from utils import flatten_list, simplify_list, simplify_array, graft_list
-from nested_data import NestedData
+from nested_data import NestedData, NestedVector
 from property_model import PropertyModel
 from pin_item import PinItem
 
@@ -203,7 +203,7 @@ class SocketWidget(QtWidgets.QWidget):
         if self._pin_item.has_edges():
             for edge in self._pin_item.edges:
                 pre_node: NodeItem = edge.start_pin.parent_node
-                if len(pre_node.sub_scene.nodes) > 0:
+                if pre_node.has_sub_scene():
                     result.append(pre_node.linked_lowest_socket(edge.start_pin.socket_widget).pin)
                 else:
                     result.append(edge.start_pin)
@@ -213,13 +213,17 @@ class SocketWidget(QtWidgets.QWidget):
                 result.extend(linked_highest.input_data())
 
         if len(result) == 0:
-            result.append(0.)
+            result.append(self.default_data())
 
         return result
 
+    def default_data(self) -> Any:
+        # Data of the unconnected socket, which only depends on the persistent properties
+        return 0.
+
     def perform_socket_operation(
-            self, input_data: Union[list, NestedData, ak.Array]
-    ) -> Union[list, NestedData, ak.Array]:
+            self, input_data: Union[list, NestedData, NestedVector, ak.Array]
+    ) -> Union[list, NestedData, NestedVector, ak.Array]:
 
         if type(input_data) == list:
             if self.socket_options_state()[0]:  # Flatten
@@ -239,6 +243,14 @@ class SocketWidget(QtWidgets.QWidget):
                     input_data.data, ak.unflatten(input_data.structure, axis=-1, counts=1)
                 )
 
+        elif type(input_data) == NestedVector:
+            if self.socket_options_state()[0]:  # Flatten
+                input_data: NestedVector = input_data.flattened()
+            if self.socket_options_state()[1]:  # Simplify
+                input_data: NestedVector = input_data.simplified()
+            if self.socket_options_state()[2]:  # Graft
+                input_data: NestedVector = input_data.grafted()
+
         elif type(input_data) == ak.Array:
             if len(ak.fields(input_data)) == 3:
                 if self.socket_options_state()[0]:  # Flatten
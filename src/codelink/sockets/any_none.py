@@ -51,21 +51,5 @@ class AnyNone(SocketWidget):
 
 	# --------------- Socket data ---------------
 
-	def input_data(self) -> list:
-		result: list = []
-		if self._pin_item.has_edges():
-			for edge in self._pin_item.edges:
-				pre_node: NodeItem = edge.start_pin.parent_node
-				if len(pre_node.sub_scene.nodes) > 0:
-					result.append(pre_node.linked_lowest_socket(edge.start_pin.socket_widget).pin)
-				else:
-					result.append(edge.start_pin)
-		else:
-			linked_highest: SocketWidget = self.parent_node.linked_highest_socket(self)
-			if linked_highest != self:
-				result.extend(linked_highest.input_data())
-
-		if len(result) == 0:
-			result.append("")
-
-		return result
+	def default_data(self) -> Any:
+		return ""
@@ -69,24 +69,8 @@ class BoolCheckBox(SocketWidget):
 
 	# --------------- Socket data ---------------
 
-	def input_data(self) -> list:
-		result: list = []
-		if self._pin_item.has_edges():
-			for edge in self._pin_item.edges:
-				pre_node: NodeItem = edge.start_pin.parent_node
-				if len(pre_node.sub_scene.nodes) > 0:
-					result.append(pre_node.linked_lowest_socket(edge.start_pin.socket_widget).pin)
-				else:
-					result.append(edge.start_pin)
-		else:
-			linked_highest: SocketWidget = self.parent_node.linked_highest_socket(self)
-			if linked_highest != self:
-				result.extend(linked_highest.input_data())
-
-		if len(result) == 0:
-			result.append(ak.Array([bool(self._input_widget.checkState())]))
-
-		return result
+	def default_data(self) -> Any:
+		return ak.Array([bool(self.value)])
 
 	def perform_socket_operation(self, input_data: ak.Array) -> ak.Array:
 		if self.socket_options_state()[0]:  # Flatten
@@ -21,7 +21,7 @@
 # ***************************************************************************
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import awkward as ak
 
@@ -30,7 +30,7 @@ import FreeCAD
 import PySide2.QtGui as QtGui
 import PySide2.QtWidgets as QtWidgets
 
-from utils import simplify_array
+from nested_data import NestedVector
 from socket_widget import SocketWidget
 
 if TYPE_CHECKING:
@@ -56,39 +56,21 @@ class VectorNone(SocketWidget):
 
 	# --------------- Socket data ---------------
 
-	def input_data(self) -> list:
-		result: list = []
-		if self._pin_item.has_edges():
-			for edge in self._pin_item.edges:
-				pre_node: NodeItem = edge.start_pin.parent_node
-				if len(pre_node.sub_scene.nodes) > 0:
-					result.append(pre_node.linked_lowest_socket(edge.start_pin.socket_widget).pin)
-				else:
-					result.append(edge.start_pin)
-		else:
-			linked_highest: SocketWidget = self.parent_node.linked_highest_socket(self)
-			if linked_highest != self:
-				result.extend(linked_highest.input_data())
-
-		if len(result) == 0:
-			result.append(ak.Array([{"x": 0., "y": 0., "z": 0.}]))
-
-		return result
-
-	def perform_socket_operation(self, input_data: ak.Array) -> ak.Array:
+	def default_data(self) -> Any:
+		return NestedVector()
+
+	def perform_socket_operation(self, input_data: Union[NestedVector, ak.Array]) -> NestedVector:
+		# Vector records of nodes that still build them with awkward are converted once here
+		if type(input_data) == ak.Array:
+			input_data: NestedVector = NestedVector.from_record(input_data)
+
 		if self.socket_options_state()[0]:  # Flatten
-			x: ak.Array = ak.flatten(input_data.x, axis=None)
-			y: ak.Array = ak.flatten(input_data.y, axis=None)
-			z: ak.Array = ak.flatten(input_data.z, axis=None)
-			input_data: ak.Array = ak.zip({"x": x, "y": y, "z": z})
+			input_data: NestedVector = input_data.flattened()
 
 		if self.socket_options_state()[1]:  # Simplify
-			x: ak.Array = simplify_array(input_data.x)
-			y: ak.Array = simplify_array(input_data.y)
-			z: ak.Array = simplify_array(input_data.z)
-			input_data: ak.Array = ak.zip({"x": x, "y": y, "z": z})
+			input_data: NestedVector = input_data.simplified()
 
 		if self.socket_options_state()[2]:  # Graft
-			input_data: ak.Array = ak.unflatten(input_data, axis=-1, counts=1)
+			input_data: NestedVector = input_data.grafted()
 
 		return input_data
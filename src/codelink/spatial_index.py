@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2023 Ronny Scharf-W. <ronny.scharf08@gmail.com>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from __future__ import annotations
+from typing import Hashable
+from math import floor
+
+Cell = tuple[int, int]
+Point = tuple[float, float]
+
+
+def orientation(a: Point, b: Point, c: Point) -> float:
+    # Positive if a, b, c turn counterclockwise, negative if clockwise and zero if they are collinear
+    return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+
+
+def on_segment(a: Point, b: Point, c: Point) -> bool:
+    # True if c, collinear with a and b, lies within their bounding box
+    return min(a[0], b[0]) <= c[0] <= max(a[0], b[0]) and min(a[1], b[1]) <= c[1] <= max(a[1], b[1])
+
+
+def segments_intersect(a_1: Point, a_2: Point, b_1: Point, b_2: Point) -> bool:
+    orientation_1: float = orientation(a_1, a_2, b_1)
+    orientation_2: float = orientation(a_1, a_2, b_2)
+    orientation_3: float = orientation(b_1, b_2, a_1)
+    orientation_4: float = orientation(b_1, b_2, a_2)
+
+    if ((orientation_1 > 0 > orientation_2 or orientation_1 < 0 < orientation_2) and
+            (orientation_3 > 0 > orientation_4 or orientation_3 < 0 < orientation_4)):
+        return True
+
+    # Touching or collinear overlapping segments
+    return ((orientation_1 == 0 and on_segment(a_1, a_2, b_1)) or (orientation_2 == 0 and on_segment(a_1, a_2, b_2)) or
+            (orientation_3 == 0 and on_segment(b_1, b_2, a_1)) or (orientation_4 == 0 and on_segment(b_1, b_2, a_2)))
+
+
+class SpatialIndex:
+    # Uniform grid over the scene plane. Items are filed under the cells covered by their rectangle or line segment, so
+    # hit tests only look at the items sharing a cell with the queried area instead of at every item of the scene. The
+    # cells are candidates only, the exact geometric test is left to the caller.
+    def __init__(self, cell_size: float = 100.) -> None:
+        self._cell_size: float = cell_size
+        self._cells: dict[Cell, set[Hashable]] = {}
+        self._item_cells: dict[Hashable, list[Cell]] = {}
+
+    def __len__(self) -> int:
+        return len(self._item_cells)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._item_cells
+
+    def clear(self) -> None:
+        self._cells: dict[Cell, set[Hashable]] = {}
+        self._item_cells: dict[Hashable, list[Cell]] = {}
+
+    # --------------- Cell coverage ---------------
+
+    def rect_cells(self, x_min: float, y_min: float, x_max: float, y_max: float) -> list[Cell]:
+        return [
+            (column, row)
+            for column in range(floor(x_min / self._cell_size), floor(x_max / self._cell_size) + 1)
+            for row in range(floor(y_min / self._cell_size), floor(y_max / self._cell_size) + 1)
+        ]
+
+    def segment_cells(self, start: Point, end: Point) -> list[Cell]:
+        # All cells touched by the segment, column by column, so long diagonal segments do not cover their whole box
+        if start[0] > end[0]:
+            start, end = end, start
+
+        slope: float = (end[1] - start[1]) / (end[0] - start[0]) if end[0] != start[0] else 0.
+        cells: list[Cell] = []
+        for column in range(floor(start[0] / self._cell_size), floor(end[0] / self._cell_size) + 1):
+            if end[0] == start[0]:
+                y_1, y_2 = start[1], end[1]
+            else:
+                y_1: float = start[1] + (max(start[0], column * self._cell_size) - start[0]) * slope
+                y_2: float = start[1] + (min(end[0], (column + 1) * self._cell_size) - start[0]) * slope
+
+            cells.extend(
+                (column, row) for row in range(floor(min(y_1, y_2) / self._cell_size),
+                                               floor(max(y_1, y_2) / self._cell_size) + 1)
+            )
+        return cells
+
+    # --------------- Item filing ---------------
+
+    def insert(self, item: Hashable, cells: list[Cell]) -> None:
+        # Replaces the cells the item was filed under before
+        self.remove(item)
+        self._item_cells[item] = cells
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(item)
+
+    def remove(self, item: Hashable) -> None:
+        for cell in self._item_cells.pop(item, []):
+            cell_items: set[Hashable] = self._cells[cell]
+            cell_items.discard(item)
+            if len(cell_items) == 0:
+                del self._cells[cell]
+
+    def query(self, cells: list[Cell]) -> set[Hashable]:
+        result: set[Hashable] = set()
+        for cell in cells:
+            result.update(self._cells.get(cell, ()))
+        return result
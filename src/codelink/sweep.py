@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2023 Ronny Scharf-W. <ronny.scharf08@gmail.com>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from __future__ import annotations
+from typing import Any, Callable, Iterator, Optional, Union
+from concurrent.futures import ProcessPoolExecutor, Future, as_completed
+import itertools
+import math
+import os
+
+import numpy as np
+import awkward as ak
+
+from utils import data_length
+from nested_data import NestedData
+from result_cache import RESULT_CACHE
+from executors import SYNCHRONOUS, process_pool
+from headless import HeadlessGraph, HeadlessNode, HeadlessSocket
+
+
+VARIANT_COLUMN: str = "Variant"
+
+
+# --------------- Metrics ---------------
+
+def element_count(data: Any) -> float:
+    return float(data_length(data))
+
+
+def value_sum(data: Any) -> float:
+    if isinstance(data, ak.Array):
+        return float(ak.sum(data, axis=None))
+    return math.nan
+
+
+def shape_sum(data: Any, attribute: str) -> float:
+    if isinstance(data, NestedData):
+        return float(sum([getattr(shape, attribute) for shape in data.data]))
+    return math.nan
+
+
+def total_length(data: Any) -> float:
+    return shape_sum(data, "Length")
+
+
+def total_area(data: Any) -> float:
+    return shape_sum(data, "Area")
+
+
+def total_volume(data: Any) -> float:
+    return shape_sum(data, "Volume")
+
+
+# Metrics reduce the data of an output socket to one number per variant. Custom metrics have to be module level
+# functions, so they can be sent to the worker processes.
+METRICS: dict[str, Callable] = {
+    "count": element_count,
+    "sum": value_sum,
+    "length": total_length,
+    "area": total_area,
+    "volume": total_volume
+}
+
+
+# --------------- Variants ---------------
+
+def grid(inputs: dict[str, list]) -> dict[str, list]:
+    # All combinations of the input samples, as one column per input socket
+    rows: list[tuple] = list(itertools.product(*inputs.values()))
+    return {socket_path: [row[idx] for row in rows] for idx, socket_path in enumerate(inputs.keys())}
+
+
+def downstream_counts(graph: HeadlessGraph, socket_paths: list[str]) -> list[int]:
+    # Number of nodes that have to be evaluated again if the input socket changes
+    successors: dict[HeadlessNode, set[HeadlessNode]] = {}
+    for node in graph.all_nodes():
+        if not node.has_sub_graph():
+            for pre_node in node.predecessors():
+                successors.setdefault(pre_node, set()).add(node)
+
+    counts: list[int] = []
+    for socket_path in socket_paths:
+        start_node: HeadlessNode = graph.find_socket(socket_path, True).parent_node
+        visited: set[HeadlessNode] = {start_node}
+        stack: list[HeadlessNode] = [start_node]
+        while len(stack) > 0:
+            for suc_node in successors.get(stack.pop(), set()):
+                if suc_node not in visited:
+                    visited.add(suc_node)
+                    stack.append(suc_node)
+        counts.append(len(visited))
+
+    return counts
+
+
+# --------------- Worker ---------------
+
+_worker_graphs: dict[str, HeadlessGraph] = {}
+
+
+def run_variants(graph_path: str, cache_dir: Optional[str], variants: dict[str, list],
+                 outputs: dict[str, tuple[str, Union[str, Callable]]]) -> dict[str, list[float]]:
+    # Evaluates variants one after another on the same graph, so upstream nodes with unchanged inputs are served
+    # from their node caches. The graph is loaded once per process.
+    if cache_dir is not None and RESULT_CACHE.disk_dir is None:
+        RESULT_CACHE.disk_dir = cache_dir
+
+    if graph_path not in _worker_graphs.keys():
+        _worker_graphs[graph_path] = HeadlessGraph.load(graph_path)
+        _worker_graphs[graph_path].executor = SYNCHRONOUS
+    graph: HeadlessGraph = _worker_graphs[graph_path]
+
+    targets: list[HeadlessSocket] = [graph.find_socket(socket_path, False) for socket_path, _ in outputs.values()]
+    metrics: list[Callable] = [METRICS[metric] if type(metric) is str else metric for _, metric in outputs.values()]
+
+    columns: dict[str, list[float]] = {name: [] for name in outputs.keys()}
+    row_count: int = len(next(iter(variants.values()))) if len(variants) > 0 else 1
+    for row in range(row_count):
+        for socket_path, values in variants.items():
+            graph.set_value(socket_path, values[row])
+
+        results: dict[HeadlessSocket, Any] = graph.evaluate(targets)
+        for name, target, metric in zip(outputs.keys(), targets, metrics):
+            value: Any = results[target]
+            columns[name].append(metric(value) if value is not None and not target.parent_node.is_dirty else math.nan)
+
+    return columns
+
+
+# --------------- Sweep ---------------
+
+class Sweep:
+    # Evaluates a saved graph for many input values and collects metrics of its outputs as columns. Variants are
+    # ordered so that inputs with large downstream cones change least often and run in chunks on the process pool.
+    def __init__(self, graph_path: str, variants: dict[str, list], outputs: dict[str, tuple[str, Union[str, Callable]]],
+                 cache_dir: Optional[str] = None, chunk_size: Optional[int] = None, use_processes: bool = True) -> None:
+        self._graph_path: str = os.path.abspath(graph_path)
+        self._variants: dict[str, np.ndarray] = {
+            socket_path: np.asarray(values) for socket_path, values in variants.items()
+        }
+        self._outputs: dict[str, tuple[str, Union[str, Callable]]] = outputs
+        self._cache_dir: Optional[str] = cache_dir
+        self._use_processes: bool = use_processes
+
+        row_counts: set[int] = {len(values) for values in self._variants.values()}
+        if len(row_counts) > 1:
+            raise ValueError("Variant columns differ in length")
+        self._row_count: int = row_counts.pop() if len(row_counts) > 0 else 1
+
+        if chunk_size is None:
+            chunk_size: int = max(1, math.ceil(self._row_count / (2 * os.cpu_count())))
+        self._chunk_size: int = chunk_size
+
+        # Checks the socket paths before any process is started
+        graph: HeadlessGraph = HeadlessGraph.load(self._graph_path)
+        for socket_path in self._variants.keys():
+            if graph.find_socket(socket_path, True).is_connected():
+                raise ValueError("Socket " + socket_path + " is connected")
+        for socket_path, metric in self._outputs.values():
+            graph.find_socket(socket_path, False)
+            if type(metric) is str and metric not in METRICS.keys():
+                raise KeyError("No metric " + metric)
+
+        self._order: np.ndarray = self.variant_order(graph)
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    def variant_order(self, graph: HeadlessGraph) -> np.ndarray:
+        # Sorts the variants by the values of their inputs, the input with the largest downstream cone first
+        socket_paths: list[str] = list(self._variants.keys())
+        if len(socket_paths) == 0:
+            return np.arange(self._row_count)
+
+        counts: list[int] = downstream_counts(graph, socket_paths)
+        sort_paths: list[str] = sorted(socket_paths, key=lambda socket_path: counts[socket_paths.index(socket_path)])
+        sort_keys: list[np.ndarray] = [
+            np.unique(self._variants[socket_path], return_inverse=True)[1] for socket_path in sort_paths
+        ]
+        return np.lexsort(sort_keys)
+
+    def chunks(self) -> list[np.ndarray]:
+        return [self._order[start:start + self._chunk_size] for start in range(0, self._row_count, self._chunk_size)]
+
+    def chunk_variants(self, chunk: np.ndarray) -> dict[str, list]:
+        return {socket_path: values[chunk].tolist() for socket_path, values in self._variants.items()}
+
+    def chunk_table(self, chunk: np.ndarray, columns: dict[str, list[float]]) -> dict[str, np.ndarray]:
+        table: dict[str, np.ndarray] = {VARIANT_COLUMN: chunk}
+        table.update({socket_path: values[chunk] for socket_path, values in self._variants.items()})
+        table.update({name: np.asarray(values, dtype=np.float64) for name, values in columns.items()})
+        return table
+
+    def run(self) -> Iterator[dict[str, np.ndarray]]:
+        # Yields one columnar table per finished chunk, in completion order
+        pool: Optional[ProcessPoolExecutor] = process_pool() if self._use_processes else None
+        if pool is None:
+            for chunk in self.chunks():
+                yield self.chunk_table(chunk, run_variants(
+                    self._graph_path, self._cache_dir, self.chunk_variants(chunk), self._outputs
+                ))
+            return
+
+        futures: dict[Future, np.ndarray] = {
+            pool.submit(
+                run_variants, self._graph_path, self._cache_dir, self.chunk_variants(chunk), self._outputs
+            ): chunk
+            for chunk in self.chunks()
+        }
+        try:
+            for future in as_completed(futures.keys()):
+                yield self.chunk_table(futures[future], future.result())
+        finally:
+            for future in futures.keys():
+                future.cancel()
+
+    def table(self) -> dict[str, np.ndarray]:
+        # All variants in their original order
+        tables: list[dict[str, np.ndarray]] = list(self.run())
+        table: dict[str, np.ndarray] = {
+            name: np.concatenate([chunk_table[name] for chunk_table in tables]) for name in tables[0].keys()
+        }
+        order: np.ndarray = np.argsort(table[VARIANT_COLUMN])
+        return {name: values[order] for name, values in table.items()}
+
+
+def save_table(file_path: str, table: dict[str, np.ndarray]) -> None:
+    # Column names are kept as array names of the npz file
+    np.savez(file_path, **table)
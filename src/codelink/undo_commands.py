@@ -70,18 +70,19 @@ class AddGrpNodeCommand(QtWidgets.QUndoCommand):
 
 	def undo(self) -> None:
 		self._scene.clearSelection()
-		self._scene.resolve_sub_scene(self._grp_node)
+		with self._scene.batch():
+			self._scene.resolve_sub_scene(self._grp_node)
 		for sub_node in self._sub_nodes:
 			sub_node.setSelected(True)
 
 	def redo(self) -> None:
 		self._scene.clearSelection()
-		if self._grp_node not in self._scene.nodes:
-			self._scene.add_node(self._grp_node)
+		with self._scene.batch():
+			if self._grp_node not in self._scene.nodes:
+				self._scene.add_node(self._grp_node)
+			self._scene.populate_sub_scene(self._grp_node, self._sub_nodes)
 		self._grp_node.setSelected(True)
 
-		self._scene.populate_sub_scene(self._grp_node, self._sub_nodes)
-
 
 class RemoveNodeFromFrameCommand(QtWidgets.QUndoCommand):
 	def __init__(self, node: NodeItem, frame: FrameItem, parent: Optional[QtWidgets.QUndoCommand] = None) -> None:
@@ -110,13 +111,15 @@ class ResolveGrpNodeCommand(QtWidgets.QUndoCommand):
 
 	def undo(self) -> None:
 		self._scene.clearSelection()
-		self._scene.add_node(self._grp_node)
-		self._scene.populate_sub_scene(self._grp_node, self._sub_nodes)
+		with self._scene.batch():
+			self._scene.add_node(self._grp_node)
+			self._scene.populate_sub_scene(self._grp_node, self._sub_nodes)
 		self._grp_node.setSelected(True)
 
 	def redo(self) -> None:
 		self._scene.clearSelection()
-		self._scene.resolve_sub_scene(self._grp_node)
+		with self._scene.batch():
+			self._scene.resolve_sub_scene(self._grp_node)
 		for sub_node in self._sub_nodes:
 			sub_node.setSelected(True)
 
@@ -410,32 +413,34 @@ class PasteClipboardCommand(QtWidgets.QUndoCommand):
 		self._frames: list[FrameItem] = frames
 
 	def undo(self) -> None:
-		for frame in self._frames:
-			self._scene.remove_frame(frame)
-		for edge in self._edges:
-			self._scene.remove_edge(edge)
-		for node in self._nodes:
-			self._scene.remove_node(node)
-
-		for node in self._scene.ends():
-			cast(QtCore.SignalInstance, self._scene.dag_changed).emit(node, "")
+		with self._scene.batch():
+			for frame in self._frames:
+				self._scene.remove_frame(frame)
+			for edge in self._edges:
+				self._scene.remove_edge(edge)
+			for node in self._nodes:
+				self._scene.remove_node(node)
+
+			for node in self._scene.ends():
+				cast(QtCore.SignalInstance, self._scene.dag_changed).emit(node, "")
 
 	def redo(self) -> None:
-		for node in self._nodes:
-			if node not in self._scene.nodes:
-				self._scene.add_node(node)
-		for edge in self._edges:
-			if edge not in self._scene.edges:
-				self._scene.add_edge(edge)
-		for frame in self._frames:
-			if frame not in self._scene.frames:
-				self._scene.add_frame(frame)
-				for node in frame.framed_nodes:
-					node.parent_frame = frame
-
-		for node in self._scene.ends():
-			if node in self._nodes:
-				cast(QtCore.SignalInstance, self._scene.dag_changed).emit(node, "")
+		with self._scene.batch():
+			for node in self._nodes:
+				if node not in self._scene.nodes:
+					self._scene.add_node(node)
+			for edge in self._edges:
+				if edge not in self._scene.edges:
+					self._scene.add_edge(edge)
+			for frame in self._frames:
+				if frame not in self._scene.frames:
+					self._scene.add_frame(frame)
+					for node in frame.framed_nodes:
+						node.parent_frame = frame
+
+			for node in self._scene.ends():
+				if node in self._nodes:
+					cast(QtCore.SignalInstance, self._scene.dag_changed).emit(node, "")
 
 
 class EditModelDataCommand(QtWidgets.QUndoCommand):
@@ -22,10 +22,15 @@
 
 from __future__ import annotations
 from typing import Callable, Any, Union, cast, Iterator
+import sys
+import uuid
+import hashlib
 
 import numpy as np
 import awkward as ak
 
+import Part
+
 # noinspection PyPackageRequirements
 from pivy import coin
 
@@ -138,6 +143,58 @@ def unflatten_record_like(flat_record: ak.Array, template_record: ak.Array) -> a
     )
 
 
+def broadcast_params(params: dict[str, ak.Array],
+                     right_broadcast: bool = False) -> tuple[dict[str, np.ndarray], ak.Array]:
+    # Broadcasts the node parameters against each other and converts them once into flat NumPy columns. The packed
+    # broadcast template restores the nested structure of per element results with unflatten_like.
+    broadcasted_params: ak.Array = ak.zip(params, right_broadcast=right_broadcast)
+    columns: dict[str, np.ndarray] = {
+        k: ak.to_numpy(ak.flatten(broadcasted_params[k], axis=None)) for k in broadcasted_params.fields
+    }
+    template: ak.Array = ak.to_packed(broadcasted_params[broadcasted_params.fields[0]])
+    return columns, template
+
+
+def record_columns(nested_record: ak.Array) -> np.ndarray:
+    # Flat record fields as columns of a (n, fields) NumPy array, e.g. vectors as (n, 3)
+    return np.column_stack([ak.to_numpy(ak.flatten(nested_record[k], axis=None)) for k in nested_record.fields])
+
+
+def unflatten_like(flat_data: Union[np.ndarray, ak.Array], template: ak.Array) -> ak.Array:
+    # Nests flat_data, one item per template leaf, like the packed template in a single pass
+    flat_layout: ak.contents.Content = ak.to_layout(flat_data)
+
+    # noinspection PyUnusedLocal
+    def replace_leaf(layout: ak.contents.Content, **kwargs) -> ak.contents.Content:
+        if layout.is_numpy:
+            return flat_layout
+
+    return ak.transform(replace_leaf, template)
+
+
+def nesting_offsets(nested_array: ak.Array) -> list[np.ndarray]:
+    # Offsets of each list level of a nested array, outermost first
+    offsets: list[np.ndarray] = []
+    layout: ak.contents.Content = ak.to_packed(nested_array).layout
+    while not layout.is_numpy:
+        if isinstance(layout, ak.contents.RegularArray):
+            offsets.append(np.arange(layout.length + 1, dtype=np.int64) * layout.size)
+        elif isinstance(layout, ak.contents.ListOffsetArray):
+            offsets.append(np.asarray(layout.offsets.data, dtype=np.int64))
+        else:
+            raise TypeError("Nesting of " + type(layout).__name__ + " is not supported")
+        layout: ak.contents.Content = layout.content
+    return offsets
+
+
+def nest_by_offsets(flat_data: np.ndarray, offsets: list[np.ndarray]) -> ak.Array:
+    # Inverse of nesting_offsets, wraps flat_data in one list level per offsets array
+    layout: ak.contents.Content = ak.contents.NumpyArray(np.ascontiguousarray(flat_data))
+    for level_offsets in offsets[::-1]:
+        layout: ak.contents.Content = ak.contents.ListOffsetArray(ak.index.Index64(level_offsets), layout)
+    return ak.Array(layout)
+
+
 def simplify_list(nested_list: list[Any]) -> list[Any]:
     result: list[Any] = []
     stack: list[Any] = nested_list[:]
@@ -224,6 +281,161 @@ def reorder_list(flat_list: list[Any], target_structure: ak.Array) -> list:
     return result
 
 
+# Identifies this process, Part.Shape hash codes are only unique while the shapes are alive
+SESSION_ID: str = uuid.uuid4().hex
+
+
+class ShapeFingerprint:
+    # Fingerprint of a Part.Shape, equal for shapes sharing the same topological entity. It holds on to the shape, so
+    # that no new shape can reuse its hash code as long as the fingerprint is compared against or keys a result.
+    def __init__(self, shape: Any) -> None:
+        self._shape: Any = shape
+        self._key: tuple[str, int] = (type(shape).__name__, shape.hashCode())
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, ShapeFingerprint) and self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        return "Shape(" + SESSION_ID + ", " + self._key[0] + ", " + str(self._key[1]) + ")"
+
+
+class UnknownFingerprint:
+    # Fingerprint of data without a value equality key. It only equals itself, and the results computed from it are
+    # never memoized.
+    def __repr__(self) -> str:
+        return "Unknown(" + SESSION_ID + ", " + str(id(self)) + ")"
+
+
+def data_fingerprint(data: Any) -> Any:
+    # Hashable value equality key for socket data, used to detect unchanged node inputs
+    if isinstance(data, ak.Array):
+        form, length, buffers = ak.to_buffers(data)
+        digest = hashlib.blake2b(form.to_json().encode(), digest_size=16)
+        digest.update(str(length).encode())
+        for key, buffer in buffers.items():
+            digest.update(key.encode())
+            digest.update(np.ascontiguousarray(buffer).view(np.uint8))
+        return digest.hexdigest()
+
+    elif isinstance(data, (list, tuple)):
+        return tuple(data_fingerprint(item) for item in data)
+
+    elif hasattr(data, "coords") and hasattr(data, "offsets"):
+        # NestedVector
+        if data.fingerprint is not None:
+            return data.fingerprint
+        digest = hashlib.blake2b(data.coords.view(np.uint8), digest_size=16)
+        for level_offsets in data.offsets:
+            digest.update(level_offsets.view(np.uint8))
+        return digest.hexdigest()
+
+    elif hasattr(data, "data") and hasattr(data, "structure"):
+        # NestedData, content addressed if produced by a cached node eval
+        if getattr(data, "fingerprint", None) is not None:
+            return data.fingerprint
+        return data_fingerprint(data.data), data_fingerprint(data.structure)
+
+    elif hasattr(data, "hashCode"):
+        # Part.Shape
+        return ShapeFingerprint(data)
+
+    elif isinstance(data, np.generic):
+        return data_fingerprint(data.item())
+
+    elif isinstance(data, (bool, int, float, str)) or data is None:
+        return data
+
+    else:
+        # Unknown data never compares equal, so its consumers are always recomputed
+        return UnknownFingerprint()
+
+
+def is_session_fingerprint(fingerprint: Any) -> bool:
+    # True if the fingerprint is only meaningful within the running process
+    if isinstance(fingerprint, (ShapeFingerprint, UnknownFingerprint)):
+        return True
+    elif type(fingerprint) == tuple:
+        return any(is_session_fingerprint(item) for item in fingerprint)
+
+    return False
+
+
+def is_unknown_fingerprint(fingerprint: Any) -> bool:
+    # True if the fingerprint contains data without a value equality key
+    if isinstance(fingerprint, UnknownFingerprint):
+        return True
+    elif type(fingerprint) == tuple:
+        return any(is_unknown_fingerprint(item) for item in fingerprint)
+
+    return False
+
+
+def data_nbytes(data: Any) -> int:
+    # Rough memory footprint of socket data
+    if isinstance(data, ak.Array):
+        return data.nbytes
+
+    elif isinstance(data, (list, tuple)):
+        return sum(data_nbytes(item) for item in data)
+
+    elif hasattr(data, "coords") and hasattr(data, "offsets"):
+        # NestedVector
+        return data.coords.nbytes + sum(level_offsets.nbytes for level_offsets in data.offsets)
+
+    elif hasattr(data, "data") and hasattr(data, "structure"):
+        # NestedData
+        return data_nbytes(data.data) + data_nbytes(data.structure)
+
+    elif hasattr(data, "MemSize"):
+        # Part.Shape
+        return data.MemSize
+
+    else:
+        return sys.getsizeof(data)
+
+
+def data_length(data: Any) -> int:
+    # Number of leaf elements of socket data, e.g. for profiling
+    if isinstance(data, ak.Array):
+        if len(data.fields) > 0:
+            return int(ak.count(data[data.fields[0]], axis=None))
+        return int(ak.count(data, axis=None))
+
+    elif isinstance(data, (list, tuple)):
+        return sum(data_length(item) for item in data)
+
+    elif hasattr(data, "coords") and hasattr(data, "offsets"):
+        # NestedVector
+        return len(data.coords)
+
+    elif hasattr(data, "data") and hasattr(data, "structure"):
+        # NestedData
+        return len(data.data)
+
+    elif data is None:
+        return 0
+
+    else:
+        return 1
+
+
+def shape_from_brep(brep: str) -> Part.Shape:
+    shape: Part.Shape = Part.Shape()
+    shape.importBrepFromString(brep)
+
+    # Restores the concrete shape type, nodes check e.g. for Part.Edge
+    sub_shapes: dict[str, str] = {
+        "Vertex": "Vertexes", "Edge": "Edges", "Wire": "Wires", "Face": "Faces", "Shell": "Shells",
+        "Solid": "Solids", "CompSolid": "CompSolids"
+    }
+    if shape.ShapeType in sub_shapes.keys():
+        return getattr(shape, sub_shapes[shape.ShapeType])[0]
+    return shape
+
+
 def populate_coin_scene(child: coin.SoVRMLGroup, pivot: np.ndarray, axis: int,
                         parent: Union[coin.SoSeparator, coin.SoVRMLGroup]) -> coin.SoRotationXYZ:
     so_reverse_transformation: coin.SoTranslation = coin.SoTranslation()